@@ -0,0 +1,41 @@
+"""Add partial index on open positions
+
+Revision ID: 20261017_open_positions_index
+Revises: 20251025_separate_mnemonics
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20261017_open_positions_index'
+down_revision: Union[str, None] = '20251025_separate_mnemonics'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The position monitor polls status = 'open'; a partial index stays small
+    # however much closed-position history accumulates. Built concurrently so
+    # the positions table is not locked against writes.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_positions_status_open',
+            'positions',
+            ['status'],
+            postgresql_where=sa.text("status = 'open'"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'idx_positions_status_open',
+            table_name='positions',
+            postgresql_concurrently=True,
+        )
@@ -133,6 +133,36 @@ def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(securit
 
     return wallet_address
 
+async def get_current_user_row(
+    request: Request,
+    current_user: str = Depends(get_current_user)
+) -> User:
+    """Dependency to load the authenticated user's row once per request.
+
+    The row is cached on ``request.state.user`` so every dependency and
+    handler in the same request shares a single SELECT.
+
+    Args:
+        request: Incoming request
+        current_user: Wallet address of authenticated user
+
+    Returns:
+        User instance for the authenticated wallet
+
+    Raises:
+        HTTPException: If the user does not exist
+    """
+    user = getattr(request.state, "user", None)
+    if user is not None and user.wallet_address == current_user:
+        return user
+
+    user = await get_database_manager().get_user_by_wallet(current_user)
+    if not user:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+
+    request.state.user = user
+    return user
+
 # API Endpoints
 
 @router.post("/login", response_model=LoginResponse)
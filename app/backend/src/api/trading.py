@@ -5,20 +5,104 @@ This module provides FastAPI endpoints for trading operations,
 integrating with the stateless trading engine.
 """
 
+import asyncio
+import hashlib
+import json
 import logging
+import time
+from collections import OrderedDict
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple
 
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status, BackgroundTasks
+from fastapi.responses import JSONResponse, ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, ConfigDict, Field
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+import httpx
 
+from ..core.config import get_settings
+from ..core.network_validator import NetworkValidator
 from ..core.security import get_encryption_manager
 from ..db.database import get_database_manager
-from ..bot import TradingEngine, DydxClient, TelegramManager
+from ..bot import TradingEngine, DydxClient, TelegramManager, StateSynchronizer
 from ..db.models import User
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Encoder for endpoints that return already-JSON-safe payloads directly
+FastJSONResponse = ORJSONResponse if orjson is not None else JSONResponse
+
+# Position lists longer than this are streamed in chunks of this many rows
+# rather than encoded into one response body
+POSITIONS_STREAM_CHUNK = 500
+
+# Short private caching lets browsers coalesce bursts of dashboard refreshes
+HTTP_CACHE_CONTROL = "private, max-age=2"
+
+
+def _dumps(value: Any) -> bytes:
+    """Encode a JSON-safe value to bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, separators=(',', ':')).encode('utf-8')
+
+
+def _weak_etag(value: Any) -> str:
+    """Build a weak ETag from the JSON encoding of a payload."""
+    return 'W/"%s"' % hashlib.blake2b(_dumps(value), digest_size=8).hexdigest()
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Check ``If-None-Match`` against an ETag using weak comparison."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == opaque:
+            return True
+    return False
+
+
+def _conditional_json_response(request: Request, etag: str, content: Any) -> Response:
+    """Return ``content`` with caching headers, or 304 if the client is current.
+
+    ``etag`` should come from the payload without per-request fields such
+    as timestamps, so those don't defeat revalidation.
+    """
+    headers = {"ETag": etag, "Cache-Control": HTTP_CACHE_CONTROL}
+    if _etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return FastJSONResponse(content, headers=headers)
+
+
+def _stream_positions_json(
+    user_address: str,
+    position_data: List[Dict[str, Any]],
+    timestamp: str
+) -> Iterator[bytes]:
+    """Yield the positions response body a chunk of rows at a time."""
+    yield b'{"user_address":' + _dumps(user_address) + b',"positions":['
+    for start in range(0, len(position_data), POSITIONS_STREAM_CHUNK):
+        chunk = position_data[start:start + POSITIONS_STREAM_CHUNK]
+        rows = b','.join(_dumps(row) for row in chunk)
+        yield rows if start == 0 else b',' + rows
+    yield (
+        b'],"count":' + _dumps(len(position_data))
+        + b',"timestamp":' + _dumps(timestamp) + b'}'
+    )
+
 # Create router
 router = APIRouter(
     prefix="/api/trading",
@@ -26,14 +110,225 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
+# Pydantic models for request/response
+class TradingViewSignal(BaseModel):
+    """Request model for a TradingView webhook signal.
+
+    Extra alert fields (timeframe, strategy, ...) are kept and passed on.
+    """
+    model_config = ConfigDict(extra="allow")
+
+    symbol: str = Field(..., min_length=1, description="Trading pair symbol")
+    side: str = Field(..., min_length=1, description="Trade side ('buy' or 'sell')")
+    price: Optional[float] = Field(None, description="Optional limit price")
+    size: Optional[float] = Field(None, description="Optional position size")
+
+
+# Decrypted Telegram credentials, keyed by their ciphertexts so a rotated
+# token or chat ID misses automatically. Held in process memory only.
+TELEGRAM_CREDS_CACHE_SIZE = 10_000
+TELEGRAM_CREDS_CACHE_TTL = 300  # seconds
+_telegram_creds_cache: "OrderedDict[Tuple[str, str], Tuple[float, Tuple[str, str]]]" = OrderedDict()
+
+
+def _get_telegram_creds(encrypted_token: str, encrypted_chat_id: str) -> Tuple[str, str]:
+    """Get a decrypted Telegram token and chat ID, reusing recent results.
+
+    Raises:
+        Exception: If decryption fails
+    """
+    cache_key = (encrypted_token, encrypted_chat_id)
+    now = time.monotonic()
+
+    cached = _telegram_creds_cache.get(cache_key)
+    if cached and cached[0] > now:
+        _telegram_creds_cache.move_to_end(cache_key)
+        return cached[1]
+
+    encryption_manager = get_encryption_manager()
+    creds = (
+        encryption_manager.decrypt(encrypted_token),
+        encryption_manager.decrypt(encrypted_chat_id),
+    )
+
+    _telegram_creds_cache[cache_key] = (now + TELEGRAM_CREDS_CACHE_TTL, creds)
+    _telegram_creds_cache.move_to_end(cache_key)
+    if len(_telegram_creds_cache) > TELEGRAM_CREDS_CACHE_SIZE:
+        _telegram_creds_cache.popitem(last=False)
+
+    return creds
+
+
+# Recently built position responses, keyed by (endpoint, user_address, status).
+# Absorbs bursts of dashboard polling; dropped for a user after they trade.
+# Each entry keeps the payload's ETag so cache hits skip re-encoding it.
+POSITIONS_CACHE_TTL = 3  # seconds
+POSITIONS_CACHE_SIZE = 4096
+_positions_cache: "OrderedDict[Tuple[str, str, Optional[str]], Tuple[float, Any, str]]" = OrderedDict()
+
+
+def _get_cached_positions(key: Tuple[str, str, Optional[str]]) -> Optional[Tuple[Any, str]]:
+    """Return a cached ``(payload, etag)`` pair if it has not expired."""
+    cached = _positions_cache.get(key)
+    if cached and cached[0] > time.monotonic():
+        return cached[1], cached[2]
+    return None
+
+
+def _cache_positions(key: Tuple[str, str, Optional[str]], payload: Any) -> Tuple[Any, str]:
+    """Store a positions payload and its ETag for POSITIONS_CACHE_TTL seconds.
+
+    Returns:
+        The ``(payload, etag)`` pair that was stored
+    """
+    etag = _weak_etag(payload)
+    _positions_cache[key] = (time.monotonic() + POSITIONS_CACHE_TTL, payload, etag)
+    _positions_cache.move_to_end(key)
+    if len(_positions_cache) > POSITIONS_CACHE_SIZE:
+        _positions_cache.popitem(last=False)
+    return payload, etag
+
+
+# Position loads currently running, keyed like _positions_cache; concurrent
+# identical requests await the same load instead of each querying
+_positions_inflight: Dict[Tuple[str, str, Optional[str]], "asyncio.Future[Any]"] = {}
+
+
+async def _run_once(
+    inflight: Dict[Any, "asyncio.Future[Any]"],
+    key: Any,
+    load: Callable[[], Awaitable[Any]]
+) -> Any:
+    """Run load() for key, sharing one in-flight call between concurrent callers.
+
+    Entries only live while their load runs, so ``inflight`` stays bounded
+    by the number of concurrent loads.
+    """
+    pending = inflight.get(key)
+    if pending is not None:
+        # shield: a cancelled waiter must not cancel the shared load
+        return await asyncio.shield(pending)
+
+    future = asyncio.get_running_loop().create_future()
+    inflight[key] = future
+    try:
+        result = await load()
+    except Exception as e:
+        future.set_exception(e)
+        future.exception()  # mark retrieved when nobody else was waiting
+        raise
+    except BaseException:
+        future.cancel()
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        inflight.pop(key, None)
+
+
+async def _load_positions_once(
+    key: Tuple[str, str, Optional[str]],
+    load: Callable[[], Awaitable[Any]]
+) -> Any:
+    """Run a positions load for key, sharing it between concurrent callers."""
+    return await _run_once(_positions_inflight, key, load)
+
+
+def _invalidate_positions_cache(user_address: str) -> None:
+    """Drop every cached positions payload for a user."""
+    for key in [key for key in _positions_cache if key[1] == user_address]:
+        del _positions_cache[key]
+
+
+# Indexer market snapshots per symbol. Prices move constantly, so entries
+# live for a second: enough to collapse bursts of requests into one fetch.
+# Symbols come from request bodies, so the cache is a bounded LRU and
+# unknown markets (cached as None) age out with everything else.
+MARKET_CACHE_TTL = 1.0  # seconds
+MARKET_CACHE_SIZE = 512
+_market_cache: "OrderedDict[str, Tuple[float, Optional[Dict[str, Any]]]]" = OrderedDict()
+_market_inflight: Dict[str, "asyncio.Future[Any]"] = {}
 
-def get_db_session():
-    """Dependency to get database session."""
+# Pooled client for indexer market lookups, bound to the loop that opened it
+INDEXER_HTTP_TIMEOUT = 10.0
+_indexer_http_client: Optional[httpx.AsyncClient] = None
+_indexer_http_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_indexer_http_client() -> httpx.AsyncClient:
+    """Return the pooled indexer HTTP client, creating it for the running loop."""
+    global _indexer_http_client, _indexer_http_client_loop
+
+    loop = asyncio.get_running_loop()
+    if (
+        _indexer_http_client is None
+        or _indexer_http_client.is_closed
+        or _indexer_http_client_loop is not loop
+    ):
+        _indexer_http_client = httpx.AsyncClient(timeout=INDEXER_HTTP_TIMEOUT)
+        _indexer_http_client_loop = loop
+    return _indexer_http_client
+
+
+async def close_indexer_http_client() -> None:
+    """Close the pooled indexer HTTP client (called on application shutdown)."""
+    global _indexer_http_client, _indexer_http_client_loop
+
+    if _indexer_http_client is not None and not _indexer_http_client.is_closed:
+        await _indexer_http_client.aclose()
+    _indexer_http_client = None
+    _indexer_http_client_loop = None
+
+
+def _indexer_markets_url() -> str:
+    """Perpetual markets endpoint of the indexer for the configured network."""
+    config, _ = NetworkValidator(environment=get_settings().env).get_network_config()
+    # The mainnet REST URL already ends in /v4; testnet's does not
+    base_url = config.indexer_rest_url.rstrip('/')
+    if base_url.endswith('/v4'):
+        base_url = base_url[:-len('/v4')]
+    return f"{base_url}/v4/perpetualMarkets"
+
+
+async def _get_market_snapshot(symbol: str) -> Optional[Dict[str, Any]]:
+    """Get a symbol's indexer market data, fetching at most once per TTL.
+
+    Concurrent callers for the same symbol wait on one in-flight fetch
+    instead of each calling the indexer.
+
+    Returns:
+        Market data dict, or None if the indexer has no such market
+    """
+    cached = _market_cache.get(symbol)
+    if cached and cached[0] > time.monotonic():
+        _market_cache.move_to_end(symbol)
+        return cached[1]
+
+    async def fetch() -> Optional[Dict[str, Any]]:
+        response = await _get_indexer_http_client().get(
+            _indexer_markets_url(), params={'market': symbol}
+        )
+        response.raise_for_status()
+        market = response.json().get('markets', {}).get(symbol)
+
+        _market_cache[symbol] = (time.monotonic() + MARKET_CACHE_TTL, market)
+        _market_cache.move_to_end(symbol)
+        if len(_market_cache) > MARKET_CACHE_SIZE:
+            _market_cache.popitem(last=False)
+        return market
+
+    return await _run_once(_market_inflight, symbol, fetch)
+
+
+async def get_db_session():
+    """Dependency to get an async database session for the request."""
     db_manager = get_database_manager()
-    return db_manager.get_session()
+    async with db_manager.async_session_factory() as session:
+        yield session
 
 
-def get_trading_engine(db_session: Session = Depends(get_db_session)):
+def get_trading_engine(db_session: AsyncSession = Depends(get_db_session)):
     """Dependency to get trading engine instance."""
     return TradingEngine(db_session)
 
@@ -57,24 +352,24 @@ async def execute_trading_signal(
         Trade execution result
     """
     try:
-        # Get user from database
-        db_session = trading_engine.db
-        user = db_session.exec(
-            select(User).where(User.wallet_address == user_address)
-        ).first()
+        # Load only the user's encrypted Telegram credentials
+        result = await trading_engine.db.execute(
+            select(
+                User.encrypted_telegram_token,
+                User.encrypted_telegram_chat_id,
+            ).where(User.wallet_address == user_address)
+        )
+        telegram_row = result.first()
 
-        if not user:
+        if not telegram_row:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"User not found: {user_address}"
             )
 
         # Decrypt user credentials
-        encryption_manager = get_encryption_manager()
-
         try:
-            telegram_token = encryption_manager.decrypt(user.encrypted_telegram_token)
-            telegram_chat_id = encryption_manager.decrypt(user.encrypted_telegram_chat_id)
+            telegram_token, telegram_chat_id = _get_telegram_creds(*telegram_row)
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -89,6 +384,8 @@ async def execute_trading_signal(
             telegram_chat_id,
             signal_data
         )
+        # Runs after the trade task, so the next poll sees the new position
+        background_tasks.add_task(_invalidate_positions_cache, user_address)
 
         return {
             "message": "Trade signal received and queued for execution",
@@ -100,7 +397,7 @@ async def execute_trading_signal(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Trading signal execution error: {e}")
+        logger.error("Trading signal execution error: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Trade execution failed: {str(e)}"
@@ -109,14 +406,14 @@ async def execute_trading_signal(
 
 @router.post("/tradingview-webhook")
 async def tradingview_webhook(
-    signal_data: Dict[str, Any],
+    signal: TradingViewSignal,
     background_tasks: BackgroundTasks,
     trading_engine: TradingEngine = Depends(get_trading_engine)
 ):
     """Process TradingView webhook signal.
 
     Args:
-        signal_data: TradingView webhook data
+        signal: TradingView webhook data, validated on parse
         background_tasks: FastAPI background tasks
         trading_engine: Trading engine instance
 
@@ -124,25 +421,14 @@ async def tradingview_webhook(
         Webhook processing result
     """
     try:
-        # Extract TradingView signal format
-        symbol = signal_data.get('symbol')
-        side = signal_data.get('side')
-        price = signal_data.get('price')
-        size = signal_data.get('size')
-
-        if not symbol or not side:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Symbol and side are required"
-            )
-
-        # Process signal
+        # Process signal; only the extra alert fields go through **kwargs,
+        # since the declared ones are already passed explicitly
         signal_result = await trading_engine.process_tradingview_signal(
-            symbol=symbol,
-            side=side,
-            price=price,
-            size=size,
-            **signal_data
+            symbol=signal.symbol,
+            side=signal.side,
+            price=signal.price,
+            size=signal.size,
+            **(signal.model_extra or {})
         )
 
         if not signal_result['valid']:
@@ -164,61 +450,85 @@ async def tradingview_webhook(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"TradingView webhook error: {e}")
+        logger.error("TradingView webhook error: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Webhook processing failed: {str(e)}"
         )
 
 
-@router.get("/positions/{user_address}")
+@router.get("/positions/{user_address}", response_class=FastJSONResponse)
 async def get_user_positions(
+    request: Request,
     user_address: str,
-    status: Optional[str] = None,
+    status_filter: Optional[str] = Query(None, alias="status"),
     trading_engine: TradingEngine = Depends(get_trading_engine)
 ):
     """Get user's trading positions.
 
     Args:
+        request: Incoming request (for ``If-None-Match``)
         user_address: User's wallet address
-        status: Optional position status filter
+        status_filter: Optional position status filter (``status`` query param)
         trading_engine: Trading engine instance
 
     Returns:
         List of user positions
     """
     try:
-        # Get positions from database
-        positions = await trading_engine.position_manager.get_user_positions(
-            user_address, status
-        )
+        cache_key = ("positions", user_address, status_filter)
+        cached = _get_cached_positions(cache_key)
 
-        # Convert to response format
-        position_data = []
-        for position in positions:
-            position_data.append({
-                "id": position.id,
-                "symbol": position.symbol,
-                "status": position.status,
-                "side": "BUY",  # Would need to be stored in position
-                "entry_price": float(position.entry_price),
-                "size": float(position.size),
-                "dydx_order_id": position.dydx_order_id,
-                "tp_order_id": position.tp_order_id,
-                "sl_order_id": position.sl_order_id,
-                "opened_at": position.opened_at.isoformat(),
-                "notional_value": float(position.notional_value),
-            })
+        async def load_position_data() -> Tuple[List[Dict[str, Any]], str]:
+            # Get positions from database
+            positions = await trading_engine.position_manager.get_user_positions(
+                user_address, status_filter
+            )
 
-        return {
+            # Convert to response format
+            position_data = [
+                {
+                    "id": position.id,
+                    "symbol": position.symbol,
+                    "status": position.status,
+                    "side": "BUY",  # Would need to be stored in position
+                    "entry_price": float(position.entry_price),
+                    "size": float(position.size),
+                    "dydx_order_id": position.dydx_order_id,
+                    "tp_order_id": position.tp_order_id,
+                    "sl_order_id": position.sl_order_id,
+                    "opened_at": position.opened_at.isoformat(),
+                    "notional_value": float(position.notional_value),
+                }
+                for position in positions
+            ]
+            return _cache_positions(cache_key, position_data)
+
+        if cached is None:
+            cached = await _load_positions_once(cache_key, load_position_data)
+        position_data, etag = cached
+
+        timestamp = datetime.utcnow().isoformat()
+
+        # Long histories are streamed so the client starts parsing early and
+        # the encoded body is never held in memory as one buffer
+        if len(position_data) > POSITIONS_STREAM_CHUNK:
+            return StreamingResponse(
+                _stream_positions_json(user_address, position_data, timestamp),
+                media_type="application/json",
+                headers={"Cache-Control": HTTP_CACHE_CONTROL}
+            )
+
+        # The payload is already JSON-safe, so skip jsonable_encoder's walk
+        return _conditional_json_response(request, etag, {
             "user_address": user_address,
             "positions": position_data,
             "count": len(position_data),
-            "timestamp": datetime.utcnow().isoformat()
-        }
+            "timestamp": timestamp
+        })
 
     except Exception as e:
-        logger.error(f"Get positions error for {user_address}: {e}")
+        logger.error("Get positions error for %s: %s", user_address, e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to get positions: {str(e)}"
@@ -227,32 +537,45 @@ async def get_user_positions(
 
 @router.get("/positions/{user_address}/summary")
 async def get_positions_summary(
+    request: Request,
     user_address: str,
-    trading_engine: TradingEngine = Depends(get_trading_engine)
+    db_session: AsyncSession = Depends(get_db_session)
 ):
     """Get summary of user's positions.
 
     Args:
+        request: Incoming request (for ``If-None-Match``)
         user_address: User's wallet address
-        trading_engine: Trading engine instance
+        db_session: Database session
 
     Returns:
         Position summary statistics
     """
     try:
-        # Get summary from state synchronizer
-        summary = await StateSynchronizer.get_positions_summary(
-            trading_engine.db, user_address
-        )
+        cache_key = ("summary", user_address, None)
+        cached = _get_cached_positions(cache_key)
 
-        return {
+        async def load_summary() -> Tuple[Dict[str, Any], str]:
+            # Get summary from state synchronizer
+            summary = await StateSynchronizer.get_positions_summary(
+                db_session, user_address
+            )
+            if 'error' in summary:
+                return summary, _weak_etag(summary)
+            return _cache_positions(cache_key, summary)
+
+        if cached is None:
+            cached = await _load_positions_once(cache_key, load_summary)
+        summary, etag = cached
+
+        return _conditional_json_response(request, etag, {
             "user_address": user_address,
             "summary": summary,
             "timestamp": datetime.utcnow().isoformat()
-        }
+        })
 
     except Exception as e:
-        logger.error(f"Get positions summary error for {user_address}: {e}")
+        logger.error("Get positions summary error for %s: %s", user_address, e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to get summary: {str(e)}"
@@ -262,35 +585,36 @@ async def get_positions_summary(
 @router.post("/test-telegram")
 async def test_telegram_connection(
     user_address: str,
-    trading_engine: TradingEngine = Depends(get_trading_engine)
+    db_session: AsyncSession = Depends(get_db_session)
 ):
     """Test Telegram connection for a user.
 
     Args:
         user_address: User's wallet address
-        trading_engine: Trading engine instance
+        db_session: Database session
 
     Returns:
         Telegram connection test result
     """
     try:
-        # Get user from database
-        user = trading_engine.db.exec(
-            select(User).where(User.wallet_address == user_address)
-        ).first()
+        # Load only the user's encrypted Telegram credentials
+        result = await db_session.execute(
+            select(
+                User.encrypted_telegram_token,
+                User.encrypted_telegram_chat_id,
+            ).where(User.wallet_address == user_address)
+        )
+        telegram_row = result.first()
 
-        if not user:
+        if not telegram_row:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"User not found: {user_address}"
             )
 
         # Decrypt Telegram credentials
-        encryption_manager = get_encryption_manager()
-
         try:
-            telegram_token = encryption_manager.decrypt(user.encrypted_telegram_token)
-            telegram_chat_id = encryption_manager.decrypt(user.encrypted_telegram_chat_id)
+            telegram_token, telegram_chat_id = _get_telegram_creds(*telegram_row)
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -311,7 +635,7 @@ async def test_telegram_connection(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Telegram test error for {user_address}: {e}")
+        logger.error("Telegram test error for %s: %s", user_address, e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Telegram test failed: {str(e)}"
@@ -319,30 +643,42 @@ async def test_telegram_connection(
 
 
 @router.get("/market/{symbol}")
-async def get_market_data(symbol: str):
+async def get_market_data(request: Request, symbol: str):
     """Get market data for a symbol.
 
     Args:
+        request: Incoming request (for ``If-None-Match``)
         symbol: Trading pair symbol
 
     Returns:
         Market data including price and volume
     """
     try:
-        # Create a temporary client for market data (no credentials needed)
-        # Note: In practice, you'd want to cache this or use a market data client
+        # Public indexer data; no credentials needed
+        market = await _get_market_snapshot(symbol)
+
+        if market is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Market not found: {symbol}"
+            )
+
         market_data = {
             "symbol": symbol,
-            "price": 50000.0,  # Placeholder
-            "volume_24h": 1000000.0,  # Placeholder
-            "price_change_24h": 2.5,  # Placeholder
-            "timestamp": datetime.utcnow().isoformat()
+            "price": float(market.get('oraclePrice') or 0),
+            "volume_24h": float(market.get('volume24H') or 0),
+            "price_change_24h": float(market.get('priceChange24H') or 0),
         }
 
-        return market_data
+        return _conditional_json_response(request, _weak_etag(market_data), {
+            **market_data,
+            "timestamp": datetime.utcnow().isoformat()
+        })
 
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f"Market data error for {symbol}: {e}")
+        logger.error("Market data error for %s: %s", symbol, e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to get market data: {str(e)}"
@@ -387,7 +723,7 @@ async def check_risk_limits(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Risk check error for {user_address}: {e}")
+        logger.error("Risk check error for %s: %s", user_address, e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Risk check failed: {str(e)}"
@@ -8,25 +8,29 @@ and dashboard data for authenticated users.
 import secrets
 import logging
 import asyncio
+import time
 import httpx
+from collections import OrderedDict
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
-from fastapi import APIRouter, HTTPException, status, Depends
+from fastapi import APIRouter, HTTPException, Request, status, Depends
+from fastapi.responses import JSONResponse, Response
 from pydantic import BaseModel, Field
 
 from ..core.security import (
     get_credential_validator,
     get_aesgcm_manager,
     encrypt_sensitive_data,
+    encrypt_sensitive_data_many,
     decrypt_sensitive_data
 )
 from ..db.database import get_database_manager
 from ..db.models import User
-from .auth import get_current_user
-from ..bot.dydx_client import DydxClient
+from .auth import get_current_user, get_current_user_row
+from ..bot.dydx_client import DydxClient, forget_key_pair
 
 # Import faucet client for testnet funds
 try:
@@ -40,6 +44,83 @@ except ImportError:
 # Create router
 router = APIRouter(prefix="/api/user", tags=["user-management"])
 
+# Decrypted mnemonics, keyed by their ciphertext so saving new credentials
+# misses automatically. Held in process memory only.
+MNEMONIC_CACHE_SIZE = 1_000
+MNEMONIC_CACHE_TTL = 300  # seconds
+_mnemonic_cache: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+
+
+def _get_mnemonic(encrypted_mnemonic: str) -> str:
+    """Get a decrypted mnemonic, reusing recent results.
+
+    Raises:
+        Exception: If decryption fails
+    """
+    now = time.monotonic()
+
+    cached = _mnemonic_cache.get(encrypted_mnemonic)
+    if cached and cached[0] > now:
+        _mnemonic_cache.move_to_end(encrypted_mnemonic)
+        return cached[1]
+
+    mnemonic = decrypt_sensitive_data(encrypted_mnemonic)
+
+    _mnemonic_cache[encrypted_mnemonic] = (now + MNEMONIC_CACHE_TTL, mnemonic)
+    _mnemonic_cache.move_to_end(encrypted_mnemonic)
+    if len(_mnemonic_cache) > MNEMONIC_CACHE_SIZE:
+        _mnemonic_cache.popitem(last=False)
+
+    return mnemonic
+
+
+def _forget_mnemonic(encrypted_mnemonic: Optional[str]) -> None:
+    """Drop the cached plaintext and key pair for a mnemonic being replaced."""
+    if not encrypted_mnemonic:
+        return
+
+    cached = _mnemonic_cache.pop(encrypted_mnemonic, None)
+    try:
+        mnemonic = cached[1] if cached else decrypt_sensitive_data(encrypted_mnemonic)
+    except Exception as e:
+        logger.warning(f"Could not decrypt replaced mnemonic to drop its key pair: {e}")
+        return
+    forget_key_pair(mnemonic)
+
+
+# Rendered bodies of read-only endpoints, keyed by (endpoint, wallet_address).
+# Absorbs dashboard polling; dropped for a user when they change credentials.
+USER_RESPONSE_CACHE_SIZE = 10_000
+USER_RESPONSE_CACHE_TTL = 30  # seconds
+_user_response_cache: "OrderedDict[Tuple[str, str], Tuple[float, bytes]]" = OrderedDict()
+
+
+def _get_cached_response(cache_key: Tuple[str, str]) -> Optional[Response]:
+    """Return a cached JSON response if it hasn't expired."""
+    cached = _user_response_cache.get(cache_key)
+    if cached is None:
+        return None
+    if cached[0] <= time.monotonic():
+        del _user_response_cache[cache_key]
+        return None
+    _user_response_cache.move_to_end(cache_key)
+    return Response(content=cached[1], media_type="application/json")
+
+
+def _cache_response(cache_key: Tuple[str, str], response: Response) -> Response:
+    """Store a response body for reuse and return the response."""
+    _user_response_cache[cache_key] = (time.monotonic() + USER_RESPONSE_CACHE_TTL, response.body)
+    _user_response_cache.move_to_end(cache_key)
+    if len(_user_response_cache) > USER_RESPONSE_CACHE_SIZE:
+        _user_response_cache.popitem(last=False)
+    return response
+
+
+def _invalidate_user_responses(wallet_address: str) -> None:
+    """Drop cached read responses for a user after their data changes."""
+    for endpoint in ("dashboard", "credentials_status"):
+        _user_response_cache.pop((endpoint, wallet_address), None)
+
 # Pydantic models for request/response
 class CredentialsRequest(BaseModel):
     """Request model for saving/updating credentials."""
@@ -114,17 +195,29 @@ class TestnetFundsResponse(BaseModel):
     address: str = Field(..., description="Wallet address that received funds")
     error: Optional[str] = Field(None, description="Error message if failed")
 
+class ModelJSONResponse(JSONResponse):
+    """JSON response rendered straight from a Pydantic model.
+
+    Returning a Response skips FastAPI's ``response_model`` re-validation
+    and ``jsonable_encoder`` pass; ``model_dump_json`` serializes in
+    pydantic-core. ``response_model`` still drives the OpenAPI schema.
+    """
+
+    def render(self, content: BaseModel) -> bytes:
+        return content.model_dump_json().encode("utf-8")
+
 # API Endpoints
 
 @router.get("/dashboard", response_model=DashboardResponse)
-async def get_dashboard(current_user: str = Depends(get_current_user)) -> DashboardResponse:
+async def get_dashboard(request: Request, current_user: str = Depends(get_current_user)) -> Response:
     """Get user dashboard data including profile and webhook information."""
-    try:
-        db_manager = get_database_manager()
-        user = await db_manager.get_user_by_wallet(current_user)
-        if not user:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+    cache_key = ("dashboard", current_user)
+    cached = _get_cached_response(cache_key)
+    if cached is not None:
+        return cached
 
+    user = await get_current_user_row(request, current_user)
+    try:
         user_profile = {
             "wallet_address": user.wallet_address,
             "webhook_uuid": user.webhook_uuid,
@@ -148,20 +241,20 @@ async def get_dashboard(current_user: str = Depends(get_current_user)) -> Dashbo
             webhook_configured=user.encrypted_webhook_secret is not None
         )
 
-        return DashboardResponse(
+        return _cache_response(cache_key, ModelJSONResponse(DashboardResponse(
             user_profile=user_profile,
             webhook_info=webhook_info,
             credentials_status=credentials_status
-        )
+        )))
     except Exception as e:
-        logger.error(f"Failed to load dashboard for user {current_user}: {e}")
+        logger.error(f"Failed to load dashboard for user {user.wallet_address}: {e}")
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to load dashboard data.")
 
 @router.post("/credentials", response_model=CredentialsResponse)
 async def save_credentials(
     credentials: CredentialsRequest,
-    current_user: str = Depends(get_current_user)
-) -> CredentialsResponse:
+    user: User = Depends(get_current_user_row)
+) -> Response:
     """Save or update user credentials with encryption."""
     try:
         validator = get_credential_validator()
@@ -201,67 +294,69 @@ async def save_credentials(
         if not updated_fields:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="No valid credentials provided")
 
-        db_manager = get_database_manager()
-        user = await db_manager.get_user_by_wallet(current_user)
-        if not user:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
-
         if 'dydx_testnet_address' in updated_fields:
             user.dydx_testnet_address = credentials.dydx_testnet_address
         if 'dydx_mainnet_address' in updated_fields:
             user.dydx_mainnet_address = credentials.dydx_mainnet_address
-        if 'dydx_testnet_mnemonic' in updated_fields:
-            user.encrypted_dydx_testnet_mnemonic = encrypt_sensitive_data(credentials.dydx_testnet_mnemonic)
-        if 'dydx_mainnet_mnemonic' in updated_fields:
-            user.encrypted_dydx_mainnet_mnemonic = encrypt_sensitive_data(credentials.dydx_mainnet_mnemonic)
         if 'dydx_network_id' in updated_fields:
             user.dydx_network_id = credentials.dydx_network_id
+
+        # Encrypt all secret fields in one batch, then assign them back
+        secret_fields = []
+        if 'dydx_testnet_mnemonic' in updated_fields:
+            _forget_mnemonic(user.encrypted_dydx_testnet_mnemonic)
+            secret_fields.append(('encrypted_dydx_testnet_mnemonic', credentials.dydx_testnet_mnemonic))
+        if 'dydx_mainnet_mnemonic' in updated_fields:
+            _forget_mnemonic(user.encrypted_dydx_mainnet_mnemonic)
+            secret_fields.append(('encrypted_dydx_mainnet_mnemonic', credentials.dydx_mainnet_mnemonic))
         if 'telegram_token' in updated_fields:
-            user.encrypted_telegram_token = encrypt_sensitive_data(credentials.telegram_token)
+            secret_fields.append(('encrypted_telegram_token', credentials.telegram_token))
         if 'telegram_chat_id' in updated_fields:
-            user.encrypted_telegram_chat_id = encrypt_sensitive_data(credentials.telegram_chat_id)
+            secret_fields.append(('encrypted_telegram_chat_id', credentials.telegram_chat_id))
 
-        await db_manager.update_user(user)
+        if secret_fields:
+            encrypted_values = encrypt_sensitive_data_many([value for _, value in secret_fields])
+            for (attr, _), encrypted_value in zip(secret_fields, encrypted_values):
+                setattr(user, attr, encrypted_value)
 
-        return CredentialsResponse(
+        await get_database_manager().update_user(user)
+        _invalidate_user_responses(user.wallet_address)
+
+        return ModelJSONResponse(CredentialsResponse(
             message=f"Successfully saved {len(updated_fields)} credential field(s)",
             updated_fields=updated_fields
-        )
+        ))
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to save credentials for user {current_user}: {e}")
+        logger.error(f"Failed to save credentials for user {user.wallet_address}: {e}")
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to save credentials: {str(e)}")
 
 @router.get("/credentials/status", response_model=CredentialsStatusResponse)
-async def get_credentials_status(current_user: str = Depends(get_current_user)) -> CredentialsStatusResponse:
+async def get_credentials_status(request: Request, current_user: str = Depends(get_current_user)) -> Response:
     """Get status of configured credentials."""
-    try:
-        db_manager = get_database_manager()
-        user = await db_manager.get_user_by_wallet(current_user)
-        if not user:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+    cache_key = ("credentials_status", current_user)
+    cached = _get_cached_response(cache_key)
+    if cached is not None:
+        return cached
 
-        return CredentialsStatusResponse(
+    user = await get_current_user_row(request, current_user)
+    try:
+        return _cache_response(cache_key, ModelJSONResponse(CredentialsStatusResponse(
             dydx_configured=(user.encrypted_dydx_mnemonic is not None or user.encrypted_dydx_testnet_mnemonic is not None or user.encrypted_dydx_mainnet_mnemonic is not None),
             dydx_testnet_configured=user.encrypted_dydx_testnet_mnemonic is not None,
             dydx_mainnet_configured=user.encrypted_dydx_mainnet_mnemonic is not None,
             telegram_configured=user.encrypted_telegram_token is not None and user.encrypted_telegram_chat_id is not None,
             webhook_configured=user.encrypted_webhook_secret is not None
-        )
+        )))
     except Exception as e:
-        logger.error(f"Failed to get credentials status for user {current_user}: {e}")
+        logger.error(f"Failed to get credentials status for user {user.wallet_address}: {e}")
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to get credentials status.")
 
 @router.get("/webhook-info", response_model=WebhookInfoResponse)
-async def get_webhook_info(current_user: str = Depends(get_current_user)) -> WebhookInfoResponse:
+async def get_webhook_info(user: User = Depends(get_current_user_row)) -> Response:
     """Get webhook information and setup instructions."""
     try:
-        db_manager = get_database_manager()
-        user = await db_manager.get_user_by_wallet(current_user)
-        if not user:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
-
         webhook_secret = "Not configured"
         if user.encrypted_webhook_secret:
             try:
@@ -271,103 +366,89 @@ async def get_webhook_info(current_user: str = Depends(get_current_user)) -> Web
 
         webhook_url = f"/api/webhooks/signal/{user.webhook_uuid}"  # Relative URL
 
-        return WebhookInfoResponse(
+        return ModelJSONResponse(WebhookInfoResponse(
             webhook_url=webhook_url,
             webhook_secret=webhook_secret,
-        )
+        ))
     except Exception as e:
-        logger.error(f"Failed to get webhook info for user {current_user}: {e}")
+        logger.error(f"Failed to get webhook info for user {user.wallet_address}: {e}")
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to get webhook info.")
 
 @router.put("/webhook-secret", response_model=WebhookSecretResponse)
-async def regenerate_webhook_secret(current_user: str = Depends(get_current_user)) -> WebhookSecretResponse:
+async def regenerate_webhook_secret(user: User = Depends(get_current_user_row)) -> Response:
     """Regenerate webhook secret."""
     try:
         new_secret = get_aesgcm_manager().generate_webhook_secret()
         encrypted_secret = encrypt_sensitive_data(new_secret)
 
-        db_manager = get_database_manager()
-        user = await db_manager.get_user_by_wallet(current_user)
-        if not user:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
-
         user.encrypted_webhook_secret = encrypted_secret
-        await db_manager.update_user(user)
+        await get_database_manager().update_user(user)
+        _invalidate_user_responses(user.wallet_address)
 
-        return WebhookSecretResponse(new_secret=new_secret)
+        return ModelJSONResponse(WebhookSecretResponse(new_secret=new_secret))
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to regenerate webhook secret: {str(e)}")
 
 @router.get("/account-balance", response_model=AccountBalanceResponse)
-async def get_account_balance(current_user: str = Depends(get_current_user)) -> AccountBalanceResponse:
+async def get_account_balance(user: User = Depends(get_current_user_row)) -> Response:
     """Get user's dYdX account balance and equity information."""
     try:
-        db_manager = get_database_manager()
-        user = await db_manager.get_user_by_wallet(current_user)
-
-        if not user:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
-
         # Check for testnet or mainnet mnemonic
         mnemonic_encrypted = user.encrypted_dydx_testnet_mnemonic or user.encrypted_dydx_mainnet_mnemonic or user.encrypted_dydx_mnemonic
         if not mnemonic_encrypted:
-            return AccountBalanceResponse(
+            return ModelJSONResponse(AccountBalanceResponse(
                 success=False,
                 error="dYdX mnemonic not configured. Please configure it first."
-            )
+            ))
 
         try:
-            mnemonic = decrypt_sensitive_data(mnemonic_encrypted)
+            mnemonic = _get_mnemonic(mnemonic_encrypted)
             dydx_client = await DydxClient.create_client(mnemonic=mnemonic)
             
             account_info = await DydxClient.get_account_info(dydx_client)
 
             if not account_info.get("success"):
                 error_message = account_info.get("error", "Failed to fetch account info from dYdX")
-                logger.error(f"dYdX API error for user {current_user}: {error_message}")
-                return AccountBalanceResponse(success=False, error=error_message)
+                logger.error(f"dYdX API error for user {user.wallet_address}: {error_message}")
+                return ModelJSONResponse(AccountBalanceResponse(success=False, error=error_message))
 
             account_details = account_info.get("account", {})
             subaccount_details = account_info.get("subaccount", {})
 
-            return AccountBalanceResponse(
+            return ModelJSONResponse(AccountBalanceResponse(
                 success=True,
                 equity=account_details.get("equity"),
                 free_collateral=account_details.get("freeCollateral"),
                 margin_used=subaccount_details.get("marginUsed"),
                 open_positions_value=account_details.get("openNotional"),
-            )
+            ))
 
         except Exception as e:
-            logger.error(f"Failed to initialize dYdX client or fetch balance for user {current_user}: {e}")
-            return AccountBalanceResponse(
+            logger.error(f"Failed to initialize dYdX client or fetch balance for user {user.wallet_address}: {e}")
+            return ModelJSONResponse(AccountBalanceResponse(
                 success=False,
                 error=f"Failed to fetch balance. Ensure your mnemonic is valid: {str(e)}"
-            )
+            ))
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Account balance endpoint error for user {current_user}: {e}")
+        logger.error(f"Account balance endpoint error for user {user.wallet_address}: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to get account balance: {str(e)}"
         )
 
 @router.get("/positions", response_model=OpenPositionsResponse)
-async def get_open_positions(current_user: str = Depends(get_current_user)) -> OpenPositionsResponse:
+async def get_open_positions(user: User = Depends(get_current_user_row)) -> Response:
     """Get user's open positions from database."""
     try:
         db_manager = get_database_manager()
-        user = await db_manager.get_user_by_wallet(current_user)
-
-        if not user:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
 
         # Get open positions from database
-        positions = await db_manager.get_open_positions(current_user)
+        positions = await db_manager.get_open_positions(user.wallet_address)
         
         position_list = [
             PositionData(
@@ -383,48 +464,42 @@ async def get_open_positions(current_user: str = Depends(get_current_user)) -> O
             for pos in positions
         ]
 
-        return OpenPositionsResponse(
+        return ModelJSONResponse(OpenPositionsResponse(
             success=True,
             positions=position_list
-        )
+        ))
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to get open positions for user {current_user}: {e}")
-        return OpenPositionsResponse(
+        logger.error(f"Failed to get open positions for user {user.wallet_address}: {e}")
+        return ModelJSONResponse(OpenPositionsResponse(
             success=False,
             positions=[],
             error=f"Failed to get open positions: {str(e)}"
-        )
+        ))
 
 @router.post("/testnet-funds", response_model=TestnetFundsResponse)
-async def request_testnet_funds(current_user: str = Depends(get_current_user)) -> TestnetFundsResponse:
+async def request_testnet_funds(user: User = Depends(get_current_user_row)) -> Response:
     """Request testnet funds from dYdX faucet for the user's testnet wallet."""
     try:
         if not FAUCET_AVAILABLE:
-            return TestnetFundsResponse(
+            return ModelJSONResponse(TestnetFundsResponse(
                 success=False,
                 message="Faucet client not available",
                 address="",
                 error="FaucetClient is not available in this environment"
-            )
-
-        db_manager = get_database_manager()
-        user = await db_manager.get_user_by_wallet(current_user)
-        
-        if not user:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+            ))
 
         # Get testnet address from user credentials
         testnet_address = user.dydx_testnet_address
         if not testnet_address:
-            return TestnetFundsResponse(
+            return ModelJSONResponse(TestnetFundsResponse(
                 success=False,
                 message="No testnet address configured",
                 address="",
                 error="Please configure your dYdX testnet address first"
-            )
+            ))
 
         logger.info(f"Requesting testnet funds for address: {testnet_address}")
         
@@ -443,35 +518,35 @@ async def request_testnet_funds(current_user: str = Depends(get_current_user)) -
                 
                 if response.status_code == 200:
                     logger.info(f"✅ Faucet request successful for {testnet_address}")
-                    return TestnetFundsResponse(
+                    return ModelJSONResponse(TestnetFundsResponse(
                         success=True,
                         message="✅ Testnet funds requested successfully! Check your wallet in a few moments for 1 USDC.",
                         address=testnet_address,
                         error=None
-                    )
+                    ))
                 else:
                     error_msg = response.text
                     logger.error(f"❌ Faucet returned {response.status_code}: {error_msg}")
-                    return TestnetFundsResponse(
+                    return ModelJSONResponse(TestnetFundsResponse(
                         success=False,
                         message="Faucet request failed",
                         address=testnet_address,
                         error=f"Faucet error ({response.status_code}): {error_msg}"
-                    )
+                    ))
             
         except Exception as e:
             logger.error(f"❌ Faucet request failed for {testnet_address}: {type(e).__name__}: {e}")
-            return TestnetFundsResponse(
+            return ModelJSONResponse(TestnetFundsResponse(
                 success=False,
                 message="Faucet request failed",
                 address=testnet_address,
                 error=f"Faucet error: {str(e)}"
-            )
+            ))
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to request testnet funds for user {current_user}: {e}")
+        logger.error(f"Failed to request testnet funds for user {user.wallet_address}: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to request testnet funds: {str(e)}"
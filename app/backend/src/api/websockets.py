@@ -5,12 +5,14 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Coroutine, Dict, Optional, Set, Tuple
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, status
 
-from ..bot.dydx_client import DydxClient
+from ..bot.websocket_manager import SubaccountFeed
+from ..core.network_validator import NetworkValidator
 from ..core.security import get_current_user
+from ..db.database import get_database_manager
 
 logger = logging.getLogger(__name__)
 
@@ -18,97 +20,166 @@ router = APIRouter(prefix="/ws", tags=["websockets"])
 
 
 class ConnectionManager:
-    """Track active dashboard WebSocket connections."""
+    """Track active dashboard WebSocket connections.
+
+    A user may have several dashboards open; they share one account stream
+    task, started by a connection when none is running and cancelled with
+    the last.
+    """
 
     def __init__(self) -> None:
-        self.active_connections: Dict[str, WebSocket] = {}
+        self.active_connections: Dict[str, Set[WebSocket]] = {}
         self.stream_tasks: Dict[str, asyncio.Task[Any]] = {}
+        self.stream_refcount: Dict[str, int] = {}
 
     async def connect(self, websocket: WebSocket, user_address: str) -> None:
         await websocket.accept()
-        self.active_connections[user_address] = websocket
+        self.active_connections.setdefault(user_address, set()).add(websocket)
         logger.info("WebSocket connected for user %s", user_address)
 
-    def disconnect(self, user_address: str) -> None:
+    def disconnect(self, websocket: WebSocket, user_address: str) -> Optional[asyncio.Task[Any]]:
+        """Drop a connection; return the user's stream task if it was cancelled."""
+        connections = self.active_connections.get(user_address)
+        if connections is not None:
+            connections.discard(websocket)
+            if not connections:
+                del self.active_connections[user_address]
+        logger.info("WebSocket disconnected for user %s", user_address)
+
+        refcount = self.stream_refcount.get(user_address, 0) - 1
+        if refcount > 0:
+            self.stream_refcount[user_address] = refcount
+            return None
+
+        self.stream_refcount.pop(user_address, None)
         task = self.stream_tasks.pop(user_address, None)
         if task and not task.done():
             task.cancel()
-        self.active_connections.pop(user_address, None)
-        logger.info("WebSocket disconnected for user %s", user_address)
+            return task
+        return None
 
     async def send_personal_message(self, message: Dict[str, Any], user_address: str) -> None:
-        websocket = self.active_connections.get(user_address)
-        if not websocket:
-            return
-        try:
-            await websocket.send_json(message)
-        except Exception as exc:  # noqa: BLE001
-            logger.error("Failed to send WebSocket message: %s", exc)
-
-    def register_stream_task(self, user_address: str, task: asyncio.Task[Any]) -> None:
-        self.stream_tasks[user_address] = task
+        for websocket in list(self.active_connections.get(user_address, ())):
+            try:
+                await websocket.send_json(message)
+            except Exception as exc:  # noqa: BLE001
+                logger.error("Failed to send WebSocket message: %s", exc)
+
+    def register_stream_task(
+        self,
+        user_address: str,
+        stream_factory: Callable[[], Coroutine[Any, Any, None]],
+    ) -> None:
+        """Count a stream consumer, (re)starting the task if none is running.
+
+        A stream that ended while dashboards were still connected (e.g. the
+        user had no dYdX address yet) is restarted by the next connection.
+        """
+        self.stream_refcount[user_address] = self.stream_refcount.get(user_address, 0) + 1
+        task = self.stream_tasks.get(user_address)
+        if task is None or task.done():
+            self.stream_tasks[user_address] = asyncio.create_task(stream_factory())
 
 
 manager = ConnectionManager()
 
 
-async def _stream_account_state(user_address: str) -> None:
-    """Poll dYdX account state and push updates to the dashboard."""
+async def _forward_subaccount_message(user_address: str, message: Dict[str, Any]) -> None:
+    """Translate an indexer ``v4_subaccounts`` message for the dashboard."""
+    contents = message.get("contents")
 
-    try:
-        dydx_client = await DydxClient.create_client()
-    except Exception as exc:  # noqa: BLE001
-        logger.error("Unable to initialise dYdX client for %s: %s", user_address, exc)
+    if message.get("type") == "subscribed":
+        # Initial snapshot of the subaccount and its open positions
+        subaccount = contents.get("subaccount", {})
+        await manager.send_personal_message(
+            {
+                "type": "account_update",
+                "source": "websocket",
+                "success": True,
+                "subaccount": subaccount,
+                "positions": list((subaccount.get("openPerpetualPositions") or {}).values()),
+            },
+            user_address,
+        )
+    else:
+        # channel_data / channel_batch_data: incremental changes only
+        await manager.send_personal_message(
+            {
+                "type": "account_delta",
+                "source": "websocket",
+                "contents": contents,
+            },
+            user_address,
+        )
+
+
+# One shared indexer feed per dYdX network, and the login addresses watching
+# each (network_id, dYdX address) subscription on it
+_subaccount_feeds: Dict[int, SubaccountFeed] = {}
+_subaccount_watchers: Dict[Tuple[int, str], Set[str]] = {}
+
+
+def get_subaccount_feed(network_id: int) -> SubaccountFeed:
+    """Get or create the process-wide indexer subaccount feed for a network."""
+    feed = _subaccount_feeds.get(network_id)
+    if feed is None:
+        async def forward(dydx_address: str, message: Dict[str, Any]) -> None:
+            # Indexer messages name the dYdX address; dashboards are keyed
+            # by the login wallet
+            for user_address in tuple(_subaccount_watchers.get((network_id, dydx_address), ())):
+                await _forward_subaccount_message(user_address, message)
+
+        feed = SubaccountFeed(NetworkValidator.NETWORKS[network_id].indexer_ws_url, forward)
+        _subaccount_feeds[network_id] = feed
+    return feed
+
+
+async def _stream_account_state(user_address: str) -> None:
+    """Push dYdX account updates to the dashboard as the indexer sends them.
+
+    The user's dYdX address and network come from their saved credentials.
+    All users of a network share one upstream indexer connection; this task
+    only holds the user's subscription open until the dashboard disconnects.
+    """
+    user = await get_database_manager().get_user_by_wallet(user_address)
+    network_id = (user.dydx_network_id if user else None) or 11155111
+    dydx_address = None
+    if user:
+        dydx_address = user.dydx_mainnet_address if network_id == 1 else user.dydx_testnet_address
+
+    if not dydx_address or network_id not in NetworkValidator.NETWORKS:
+        logger.info("No dYdX address for network %s configured for %s; not streaming", network_id, user_address)
         await manager.send_personal_message(
             {
                 "type": "error",
-                "message": "Failed to initialise dYdX client",
-                "details": str(exc),
+                "message": "No dYdX address configured for the selected network",
+                "details": f"Save a dYdX address for network {network_id} to stream account data",
             },
             user_address,
         )
         return
 
-    poll_interval = 15.0
-
-    while True:
-        try:
-            account_snapshot = await DydxClient.get_account_info(dydx_client)
-            if not account_snapshot.get("success", False):
-                await manager.send_personal_message(
-                    {
-                        "type": "account_update",
-                        "success": False,
-                        "error": account_snapshot.get("error", "Unknown error"),
-                    },
-                    user_address,
-                )
-            else:
-                await manager.send_personal_message(
-                    {
-                        "type": "account_update",
-                        "success": True,
-                        "account": account_snapshot.get("account", {}),
-                        "positions": account_snapshot.get("positions", []),
-                        "subaccount": account_snapshot.get("subaccount", {}),
-                    },
-                    user_address,
-                )
-        except asyncio.CancelledError:  # noqa: PERF203
-            logger.info("Stopping account stream for %s", user_address)
-            raise
-        except Exception as exc:  # noqa: BLE001
-            logger.exception("Account streaming error for %s: %s", user_address, exc)
-            await manager.send_personal_message(
-                {
-                    "type": "error",
-                    "message": "Error fetching account data",
-                    "details": str(exc),
-                },
-                user_address,
-            )
-
-        await asyncio.sleep(poll_interval)
+    feed = get_subaccount_feed(network_id)
+    watch_key = (network_id, dydx_address)
+    _subaccount_watchers.setdefault(watch_key, set()).add(user_address)
+    subscribed = False
+    try:
+        await feed.subscribe(dydx_address)
+        subscribed = True
+        await asyncio.Event().wait()
+    except asyncio.CancelledError:
+        logger.info("Stopping account stream for %s", user_address)
+        raise
+    finally:
+        watchers = _subaccount_watchers.get(watch_key)
+        if watchers is not None:
+            watchers.discard(user_address)
+            if not watchers:
+                del _subaccount_watchers[watch_key]
+        # Only release a subscription this task actually took; cancelled
+        # while waiting on the feed's lock, it never counted
+        if subscribed:
+            await feed.unsubscribe(dydx_address)
 
 
 @router.websocket("/dashboard")
@@ -125,9 +196,7 @@ async def dashboard_stream(websocket: WebSocket, token: Optional[str] = None) ->
         return
 
     await manager.connect(websocket, user_address)
-
-    stream_task = asyncio.create_task(_stream_account_state(user_address))
-    manager.register_stream_task(user_address, stream_task)
+    manager.register_stream_task(user_address, lambda: _stream_account_state(user_address))
 
     try:
         while True:
@@ -137,8 +206,7 @@ async def dashboard_stream(websocket: WebSocket, token: Optional[str] = None) ->
     except Exception as exc:  # noqa: BLE001
         logger.error("WebSocket error for %s: %s", user_address, exc)
     finally:
-        manager.disconnect(user_address)
-        if stream_task and not stream_task.done():
-            stream_task.cancel()
+        stream_task = manager.disconnect(websocket, user_address)
+        if stream_task:
             with contextlib.suppress(asyncio.CancelledError):
                 await stream_task
@@ -6,18 +6,84 @@ accepting user credentials as parameters for each operation.
 """
 
 import asyncio
+import hashlib
 import logging
+import time
+from collections import OrderedDict
 from decimal import Decimal
 from typing import Dict, Any, Optional, Tuple
+import httpx
 from dydx_v4_client.node.client import NodeClient
 from dydx_v4_client.node.market import Market
 from dydx_v4_client.network import make_mainnet, make_testnet
 from dydx_v4_client.wallet import Wallet
 from dydx_v4_client.key_pair import KeyPair
 from src.core.config import get_settings
+from src.core.network_validator import NetworkValidator
 from src.bot.dydx_v4_orders import DydxV4OrderPlacer
  
 logger = logging.getLogger(__name__)
+
+# Derived signing keys, keyed by a digest of the normalized mnemonic so the
+# phrase itself is never held as a cache key. BIP-39 seed stretching and
+# secp256k1 key generation run once per mnemonic instead of per client.
+# Entries expire like the decrypted mnemonics they come from and are dropped
+# when a user replaces their mnemonic.
+KEY_PAIR_CACHE_SIZE = 1_000
+KEY_PAIR_CACHE_TTL = 300  # seconds
+_key_pair_cache: "OrderedDict[bytes, Tuple[float, Tuple[KeyPair, str]]]" = OrderedDict()
+
+# Shared keep-alive pool for indexer REST calls so order lookups during
+# closures reuse TCP+TLS sessions instead of handshaking on every call.
+INDEXER_HTTP_TIMEOUT = 10.0
+
+_http_client: Optional[httpx.AsyncClient] = None
+_http_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _normalize_mnemonic(mnemonic: str) -> str:
+    """Strip whitespace, lowercase and collapse runs of spaces."""
+    return ' '.join(mnemonic.strip().lower().split())
+
+
+def _key_pair_cache_key(mnemonic: str) -> bytes:
+    return hashlib.sha256(mnemonic.encode('utf-8')).digest()
+
+
+def forget_key_pair(mnemonic: Optional[str]) -> None:
+    """Drop the cached key pair derived from a mnemonic that is being replaced."""
+    if mnemonic:
+        _key_pair_cache.pop(_key_pair_cache_key(_normalize_mnemonic(mnemonic)), None)
+
+
+def _key_pair_from_mnemonic(mnemonic: str) -> Tuple[KeyPair, str]:
+    """Derive the signing key pair and dYdX address (CPU-bound)."""
+    key_pair = KeyPair.from_mnemonic(mnemonic)
+    return key_pair, Wallet(key_pair, 0, 0).address
+
+
+async def _derive_key_pair(mnemonic: str) -> Tuple[KeyPair, str]:
+    """Get the signing key pair and dYdX address for a normalized mnemonic.
+
+    Derivation (PBKDF2 seed stretching plus secp256k1 key generation) runs
+    in a worker thread so it doesn't stall the event loop; the cache is
+    only touched from the loop thread.
+    """
+    cache_key = _key_pair_cache_key(mnemonic)
+
+    cached = _key_pair_cache.get(cache_key)
+    if cached and cached[0] > time.monotonic():
+        _key_pair_cache.move_to_end(cache_key)
+        return cached[1]
+
+    derived = await asyncio.to_thread(_key_pair_from_mnemonic, mnemonic)
+
+    _key_pair_cache[cache_key] = (time.monotonic() + KEY_PAIR_CACHE_TTL, derived)
+    _key_pair_cache.move_to_end(cache_key)
+    if len(_key_pair_cache) > KEY_PAIR_CACHE_SIZE:
+        _key_pair_cache.popitem(last=False)
+
+    return derived
  
  
 class DydxClient:
@@ -29,13 +95,51 @@ class DydxClient:
         11155111: "testnet",  # Sepolia testnet
     }
 
-    def __init__(self, node_client: NodeClient):
+    # Indexer order statuses that can still be cancelled
+    OPEN_ORDER_STATUSES = ('OPEN', 'UNTRIGGERED')
+
+    def __init__(self, node_client: NodeClient, network_id: int = 11155111):
         """Initialize with authenticated dYdX node client.
 
         Args:
             node_client: Authenticated dYdX node client instance
+            network_id: Network the client is connected to
         """
         self.node_client = node_client
+        self.network_id = network_id
+
+    @property
+    def indexer_url(self) -> str:
+        """Indexer REST base URL (without /v4) for the client's network."""
+        base_url = NetworkValidator.NETWORKS[self.network_id].indexer_rest_url.rstrip('/')
+        if base_url.endswith('/v4'):
+            base_url = base_url[:-len('/v4')]
+        return base_url
+
+    @staticmethod
+    def get_http_client() -> httpx.AsyncClient:
+        """Return the pooled indexer HTTP client, creating it for the running loop.
+
+        Pooled connections are bound to the event loop that opened them, so
+        a client created under a different (e.g. closed) loop is replaced.
+        """
+        global _http_client, _http_client_loop
+
+        loop = asyncio.get_running_loop()
+        if _http_client is None or _http_client.is_closed or _http_client_loop is not loop:
+            _http_client = httpx.AsyncClient(timeout=INDEXER_HTTP_TIMEOUT)
+            _http_client_loop = loop
+        return _http_client
+
+    @staticmethod
+    async def close_http_client() -> None:
+        """Close the pooled indexer HTTP client (called on application shutdown)."""
+        global _http_client, _http_client_loop
+
+        if _http_client is not None and not _http_client.is_closed:
+            await _http_client.aclose()
+        _http_client = None
+        _http_client_loop = None
 
     @staticmethod
     async def create_client(
@@ -68,10 +172,8 @@ class DydxClient:
                     "Please configure your dYdX mnemonic in the dashboard."
                 )
             
-            user_mnemonic = mnemonic
-            
             # Normalize mnemonic: strip whitespace, convert to lowercase, replace multiple spaces with single space
-            user_mnemonic = ' '.join(user_mnemonic.strip().lower().split())
+            user_mnemonic = _normalize_mnemonic(mnemonic)
             
             # Validate mnemonic word count
             mnemonic_words = user_mnemonic.split()
@@ -157,16 +259,15 @@ class DydxClient:
             
             # Create wallet from mnemonic for signing transactions
             try:
-                # Step 1: Derive address from mnemonic
-                # Create a temporary wallet to get the address
-                key_pair = KeyPair.from_mnemonic(user_mnemonic)
-                temp_wallet = Wallet(key_pair, 0, 0)
-                address = temp_wallet.address  # address is a property, not a method
+                # Step 1: Derive key pair and address from mnemonic
+                key_pair, address = await _derive_key_pair(user_mnemonic)
                 
                 logger.info(f"Derived address from mnemonic: {address}")
                 
-                # Step 2: Create the actual wallet for signing transactions
-                wallet = await Wallet.from_mnemonic(node_client, user_mnemonic, address)
+                # Step 2: Create the actual wallet for signing transactions,
+                # reusing the derived key (as Wallet.from_mnemonic would)
+                account = await node_client.get_account(address)
+                wallet = Wallet(key_pair, account.account_number, account.sequence)
                 
                 # Store wallet in the client for later use
                 node_client._wallet = wallet
@@ -180,7 +281,7 @@ class DydxClient:
             await node_client.latest_block_height()
 
             logger.info(f"dYdX client created for network {network_id}")
-            return DydxClient(node_client)
+            return DydxClient(node_client, network_id)
 
         except Exception as e:
             logger.error(f"Failed to create dYdX client: {e}")
@@ -363,7 +464,10 @@ class DydxClient:
                 'side': order_info.get('side'),
                 'size': order_info.get('size'),
                 'price': order_info.get('price'),
+                'trigger_price': order_info.get('triggerPrice'),
                 'type': order_info.get('type'),
+                'time_in_force': order_info.get('timeInForce'),
+                'post_only': order_info.get('postOnly'),
                 'remaining_size': order_info.get('remainingSize'),
                 'created_at': order_info.get('createdAt'),
                 'updated_at': order_info.get('updatedAt'),
@@ -377,6 +481,76 @@ class DydxClient:
                 'order_id': order_id,
             }
 
+    @staticmethod
+    async def get_open_orders(client: "DydxClient") -> Dict[str, Any]:
+        """Get all cancellable orders for the client's subaccount.
+
+        Resting (OPEN) and conditional (UNTRIGGERED) orders are fetched
+        concurrently, so TP/SL orders that haven't triggered yet are included.
+
+        Args:
+            client: Authenticated DydxClient instance
+
+        Returns:
+            Open orders keyed by order ID, in the same shape as get_order_status
+        """
+        try:
+            wallet = client.node_client._wallet
+            address = wallet.address if wallet else None
+
+            if not address:
+                return {
+                    'success': False,
+                    'error': 'Wallet address not available',
+                }
+
+            http_client = DydxClient.get_http_client()
+            orders_url = f"{client.indexer_url}/v4/orders"
+            responses = await asyncio.gather(*(
+                http_client.get(
+                    orders_url,
+                    params={'address': address, 'subaccountNumber': 0, 'status': order_status},
+                )
+                for order_status in DydxClient.OPEN_ORDER_STATUSES
+            ))
+            for response in responses:
+                response.raise_for_status()
+
+            orders = {}
+            for response in responses:
+                for order_info in response.json():
+                    size = order_info.get('size')
+                    filled = order_info.get('totalFilled')
+                    remaining = (
+                        str(Decimal(size) - Decimal(filled)) if size and filled else size
+                    )
+                    orders[order_info.get('id')] = {
+                        'order_id': order_info.get('id'),
+                        'status': order_info.get('status'),
+                        'symbol': order_info.get('ticker'),
+                        'side': order_info.get('side'),
+                        'size': size,
+                        'price': order_info.get('price'),
+                        'trigger_price': order_info.get('triggerPrice'),
+                        'type': order_info.get('type'),
+                        'time_in_force': order_info.get('timeInForce'),
+                        'post_only': order_info.get('postOnly'),
+                        'remaining_size': remaining,
+                        'updated_at': order_info.get('updatedAt'),
+                    }
+
+            return {
+                'success': True,
+                'orders': orders,
+            }
+
+        except Exception as e:
+            logger.error(f"Failed to get open orders: {e}")
+            return {
+                'success': False,
+                'error': str(e),
+            }
+
     @staticmethod
     async def get_account_info(client: "DydxClient") -> Dict[str, Any]:
         """Get account balances and positions from dYdX indexer.
@@ -12,6 +12,7 @@ from decimal import Decimal
 from typing import Dict, Any, List, Optional, Tuple
 from sqlmodel import Session, select, and_, or_
 from sqlalchemy.orm import selectinload
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..db.models import Position, User
 from .dydx_client import DydxClient
@@ -193,9 +194,9 @@ class PositionManager:
             # Order by creation date (newest first)
             query = query.order_by(Position.opened_at.desc())
 
-            positions = self.db.exec(query).all()
+            result = await self.db.execute(query)
 
-            return positions
+            return result.scalars().all()
 
         except Exception as e:
             logger.error(f"Failed to get user positions for {user_address}: {e}")
@@ -518,7 +519,7 @@ class StateSynchronizer:
 
     @staticmethod
     async def get_positions_summary(
-        db_session: Session,
+        db_session: AsyncSession,
         user_address: str
     ) -> Dict[str, Any]:
         """Get summary of user's positions.
@@ -532,10 +533,11 @@ class StateSynchronizer:
         """
         try:
             # Get all user positions
-            positions = db_session.exec(
+            result = await db_session.execute(
                 select(Position)
                 .where(Position.user_address == user_address)
-            ).all()
+            )
+            positions = result.scalars().all()
 
             if not positions:
                 return {
@@ -12,6 +12,14 @@ import httpx
 
 logger = logging.getLogger(__name__)
 
+# Shared keep-alive pool for the Bot API so repeated sends and connection
+# tests reuse TCP+TLS sessions instead of handshaking on every call.
+TELEGRAM_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=100)
+TELEGRAM_HTTP_TIMEOUT = 30.0
+
+_http_client: Optional[httpx.AsyncClient] = None
+_http_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
 
 class TelegramManager:
     """Stateless Telegram manager for user-specific notifications."""
@@ -19,6 +27,34 @@ class TelegramManager:
     # Telegram API configuration
     API_BASE_URL = "https://api.telegram.org/bot"
 
+    @staticmethod
+    def get_http_client() -> httpx.AsyncClient:
+        """Return the pooled HTTP client, creating it for the running loop.
+
+        Pooled connections are bound to the event loop that opened them, so
+        a new client is created if the loop has changed since the last call.
+        """
+        global _http_client, _http_client_loop
+
+        loop = asyncio.get_running_loop()
+        if _http_client is None or _http_client.is_closed or _http_client_loop is not loop:
+            _http_client = httpx.AsyncClient(
+                timeout=TELEGRAM_HTTP_TIMEOUT,
+                limits=TELEGRAM_HTTP_LIMITS,
+            )
+            _http_client_loop = loop
+        return _http_client
+
+    @staticmethod
+    async def close_http_client() -> None:
+        """Close the pooled HTTP client (called on application shutdown)."""
+        global _http_client, _http_client_loop
+
+        if _http_client is not None and not _http_client.is_closed:
+            await _http_client.aclose()
+        _http_client = None
+        _http_client_loop = None
+
     @staticmethod
     async def send_notification(
         token: str,
@@ -64,9 +100,9 @@ class TelegramManager:
                 'disable_web_page_preview': True,
             }
 
-            # Send message with timeout
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(url, json=payload)
+            # Send message over the pooled connection
+            client = TelegramManager.get_http_client()
+            response = await client.post(url, json=payload)
 
             # Check response
             if response.status_code == 200:
@@ -7,7 +7,7 @@ account, order, and trade updates with automatic reconnection and fallback.
 import asyncio
 import json
 import logging
-from typing import Dict, Any, Optional, Callable
+from typing import Dict, Any, Optional, Callable, Awaitable
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
@@ -262,3 +262,166 @@ class WebSocketManager:
                 else None
             ),
         }
+
+
+class SubaccountFeed:
+    """Shared dYdX Indexer connection multiplexing ``v4_subaccounts`` streams.
+
+    One upstream WebSocket per process carries the subscriptions of every
+    dashboard user. Subscriptions are reference-counted per address and
+    incoming messages are routed to ``on_message`` by address.
+    """
+
+    CHANNEL = "v4_subaccounts"
+
+    def __init__(
+        self,
+        ws_url: str,
+        on_message: Callable[[str, Dict[str, Any]], Awaitable[None]],
+        subaccount_number: int = 0,
+        initial_backoff: float = 1.0,
+        max_backoff: float = 16.0,
+    ):
+        """Initialize the shared feed.
+
+        Args:
+            ws_url: Indexer WebSocket URL (testnet or mainnet)
+            on_message: Async callback receiving (address, message)
+            subaccount_number: Subaccount to subscribe to for each address
+            initial_backoff: Initial reconnect delay in seconds
+            max_backoff: Maximum reconnect delay in seconds
+        """
+        self.ws_url = ws_url
+        self.on_message = on_message
+        self.subaccount_number = subaccount_number
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+
+        self.websocket = None
+        self.subscribers: Dict[str, int] = {}
+        self._listener_task: Optional[asyncio.Task] = None
+        self._lock = asyncio.Lock()
+
+    def _subaccount_id(self, address: str) -> str:
+        return f"{address}/{self.subaccount_number}"
+
+    async def _send(self, message_type: str, address: str) -> None:
+        if self.websocket is None:
+            return  # Sent on (re)connect
+        try:
+            await self.websocket.send(json.dumps({
+                "type": message_type,
+                "channel": self.CHANNEL,
+                "id": self._subaccount_id(address),
+            }))
+        except Exception as e:
+            logger.warning(f"Failed to {message_type} {address}: {e}")
+
+    async def subscribe(self, address: str) -> None:
+        """Add a subscriber for an address, subscribing upstream on 0 -> 1.
+
+        Args:
+            address: dYdX wallet address
+        """
+        async with self._lock:
+            count = self.subscribers.get(address, 0)
+            self.subscribers[address] = count + 1
+            if count == 0:
+                await self._send("subscribe", address)
+            if self._listener_task is None or self._listener_task.done():
+                self._listener_task = asyncio.create_task(self._listen())
+
+    async def unsubscribe(self, address: str) -> None:
+        """Drop a subscriber, unsubscribing upstream on 1 -> 0.
+
+        The upstream connection is closed once no addresses remain.
+
+        Args:
+            address: dYdX wallet address
+        """
+        async with self._lock:
+            count = self.subscribers.get(address, 0)
+            if count > 1:
+                self.subscribers[address] = count - 1
+                return
+            if count == 1:
+                del self.subscribers[address]
+                await self._send("unsubscribe", address)
+
+            if not self.subscribers and self._listener_task is not None:
+                self._listener_task.cancel()
+                self._listener_task = None
+                if self.websocket is not None:
+                    try:
+                        await self.websocket.close()
+                    except Exception as e:
+                        logger.warning(f"Error closing indexer WebSocket: {e}")
+                    self.websocket = None
+
+    async def _listen(self) -> None:
+        """Hold the upstream connection open and route its messages."""
+        import websockets
+
+        backoff = self.initial_backoff
+        while True:
+            try:
+                async with websockets.connect(self.ws_url) as websocket:
+                    # Publish the connection and (re)subscribe everyone
+                    # currently listening under the lock, so a concurrent
+                    # subscribe() can't send the same subscription twice
+                    async with self._lock:
+                        self.websocket = websocket
+                        for address in list(self.subscribers):
+                            await self._send("subscribe", address)
+                    backoff = self.initial_backoff
+                    logger.info(f"Indexer feed connected to {self.ws_url}")
+
+                    async for raw in websocket:
+                        await self._route(raw)
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Indexer feed error: {e}. Reconnecting in {backoff}s...")
+            finally:
+                self.websocket = None
+
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, self.max_backoff)
+
+    async def _route(self, raw: str) -> None:
+        """Deliver one upstream message to the subscriber it belongs to."""
+        try:
+            message = json.loads(raw)
+        except json.JSONDecodeError as e:
+            logger.error(f"Failed to parse indexer message: {e}")
+            return
+
+        if message.get("type") == "error":
+            # Rejected subscriptions arrive without a channel or id
+            logger.error(f"Indexer rejected a subaccount request: {message.get('message')}")
+            return
+
+        if message.get("channel") != self.CHANNEL:
+            return
+
+        address = str(message.get("id", "")).split("/", 1)[0]
+        if address not in self.subscribers or not message.get("contents"):
+            return
+
+        try:
+            await self.on_message(address, message)
+        except Exception as e:
+            logger.error(f"Error delivering indexer update for {address}: {e}")
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get shared feed status.
+
+        Returns:
+            Dictionary with status information
+        """
+        return {
+            "is_connected": self.websocket is not None,
+            "ws_url": self.ws_url,
+            "subscribed_addresses": len(self.subscribers),
+        }
@@ -20,8 +20,9 @@ class DatabaseSettings(BaseSettings):
     """Database configuration settings."""
 
     url: str = Field(default="sqlite+aiosqlite:///./dydx_trading.db")
-    pool_size: int = Field(default=10, ge=1, le=50)
-    max_overflow: int = Field(default=20, ge=0, le=100)
+    pool_size: int = Field(default=20, ge=1, le=50)
+    max_overflow: int = Field(default=10, ge=0, le=100)
+    pool_timeout: int = Field(default=30, ge=1)
     pool_recycle: int = Field(default=3600, ge=60)  # 1 hour minimum
     echo: bool = Field(default=False)
 
@@ -12,6 +12,11 @@ import json
 import sys
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Create logs directory if it doesn't exist
 LOGS_DIR = Path("logs")
 LOGS_DIR.mkdir(exist_ok=True)
@@ -44,6 +49,12 @@ class JSONFormatter(logging.Formatter):
             }:
                 log_entry[key] = value
 
+        if orjson is not None:
+            try:
+                return orjson.dumps(log_entry, default=str).decode('utf-8')
+            except TypeError:
+                pass  # e.g. integers beyond 64 bits; use the stdlib encoder
+
         return json.dumps(log_entry, default=str)
 
 
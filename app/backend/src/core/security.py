@@ -10,12 +10,13 @@ import time
 import hashlib
 import secrets
 import json
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 
 import jwt
 from cryptography.fernet import Fernet
 
 from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 import base64
@@ -33,6 +34,11 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Prefix marking values encrypted with the one-shot AES-256-GCM format.
+# ':' is outside the urlsafe base64 alphabet, so legacy Fernet values
+# can never start with it.
+AESGCM_TOKEN_PREFIX = "gcm1:"
+
 
 class EncryptionManager:
     """Manages encryption and decryption of sensitive data."""
@@ -57,9 +63,19 @@ class EncryptionManager:
         except ValueError as e:
             raise ValueError(f"Invalid hex string for master key: {e}")
 
-        # Create Fernet cipher
+        # Fernet cipher, kept to decrypt values stored before AES-GCM
         self.cipher = Fernet(base64.urlsafe_b64encode(key_bytes))
 
+        # AES-256-GCM cipher for new values, under a key derived separately
+        # from the master key so the two schemes never share key material
+        gcm_key = HKDF(
+            algorithm=hashes.SHA256(),
+            length=32,
+            salt=None,
+            info=b"dydx-trading-service/aes-256-gcm",
+        ).derive(key_bytes)
+        self.aesgcm = AESGCM(gcm_key)
+
     def encrypt(self, data: str) -> str:
         """Encrypt sensitive data.
 
@@ -67,26 +83,61 @@ class EncryptionManager:
             data: Plain text data to encrypt
 
         Returns:
-            Base64 encoded encrypted data
+            ``AESGCM_TOKEN_PREFIX`` followed by base64 of nonce + ciphertext
         """
         try:
-            encrypted_bytes = self.cipher.encrypt(data.encode('utf-8'))
-            return base64.urlsafe_b64encode(encrypted_bytes).decode('utf-8')
+            nonce = os.urandom(12)
+            encrypted_bytes = nonce + self.aesgcm.encrypt(nonce, data.encode('utf-8'), None)
+            return AESGCM_TOKEN_PREFIX + base64.urlsafe_b64encode(encrypted_bytes).decode('utf-8')
         except Exception as e:
             logger.error(f"Encryption failed: {e}")
             raise
 
+    def encrypt_many(self, data: List[str]) -> List[str]:
+        """Encrypt several values with one cipher and one nonce draw.
+
+        Each value still gets its own random nonce.
+
+        Args:
+            data: Plain text values to encrypt
+
+        Returns:
+            Encrypted values, in the same order as ``data``
+        """
+        try:
+            nonces = os.urandom(12 * len(data))
+            encrypted = []
+            for i, value in enumerate(data):
+                nonce = nonces[12 * i:12 * (i + 1)]
+                encrypted_bytes = nonce + self.aesgcm.encrypt(nonce, value.encode('utf-8'), None)
+                encrypted.append(
+                    AESGCM_TOKEN_PREFIX + base64.urlsafe_b64encode(encrypted_bytes).decode('utf-8')
+                )
+            return encrypted
+        except Exception as e:
+            logger.error(f"Batch encryption failed: {e}")
+            raise
+
     def decrypt(self, encrypted_data: str) -> str:
         """Decrypt sensitive data.
 
+        Accepts both AES-GCM values and legacy Fernet values.
+
         Args:
-            encrypted_data: Base64 encoded encrypted data
+            encrypted_data: Encrypted data from ``encrypt``
 
         Returns:
             Plain text data
         """
         try:
-            # Decode base64
+            if encrypted_data.startswith(AESGCM_TOKEN_PREFIX):
+                encrypted_bytes = base64.urlsafe_b64decode(
+                    encrypted_data[len(AESGCM_TOKEN_PREFIX):].encode('utf-8')
+                )
+                nonce, ciphertext = encrypted_bytes[:12], encrypted_bytes[12:]
+                return self.aesgcm.decrypt(nonce, ciphertext, None).decode('utf-8')
+
+            # Legacy Fernet value: decode base64
             encrypted_bytes = base64.urlsafe_b64decode(encrypted_data.encode('utf-8'))
             # Decrypt
             decrypted_bytes = self.cipher.decrypt(encrypted_bytes)
@@ -600,6 +651,19 @@ def encrypt_sensitive_data(data: str) -> str:
     return manager.encrypt(data)
 
 
+def encrypt_sensitive_data_many(data: List[str]) -> List[str]:
+    """Encrypt several values using global encryption manager.
+
+    Args:
+        data: Plain text values to encrypt
+
+    Returns:
+        Encrypted values, in the same order as ``data``
+    """
+    manager = get_encryption_manager()
+    return manager.encrypt_many(data)
+
+
 def decrypt_sensitive_data(encrypted_data: str) -> str:
     """Decrypt sensitive data using global encryption manager.
 
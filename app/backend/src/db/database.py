@@ -12,9 +12,10 @@ from contextlib import contextmanager
 
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.pool import StaticPool
-from sqlalchemy import text, event
+from sqlalchemy import select, text, event
 import asyncio
 
+from ..core.config import get_settings
 from .models import create_tables, User, Position
 
 logger = logging.getLogger(__name__)
@@ -46,14 +47,18 @@ class DatabaseManager:
                 echo=True  # Log SQL for testing
             )
         else:
-            # Use connection pooling for production
+            # Use connection pooling for production; sized from the
+            # database settings so bursts of requests reuse warm
+            # connections instead of failing on an exhausted pool
+            pool_settings = get_settings().database
             self.engine = create_async_engine(
                 self.database_url,
                 echo=os.getenv('DEBUG', 'false').lower() == 'true',
-                pool_size=10,
-                max_overflow=20,
+                pool_size=pool_settings.pool_size,
+                max_overflow=pool_settings.max_overflow,
+                pool_timeout=pool_settings.pool_timeout,
                 pool_pre_ping=True,
-                pool_recycle=3600,  # Recycle connections after 1 hour
+                pool_recycle=pool_settings.pool_recycle,  # Recycle connections after 1 hour by default
             )
 
         # Create async session factory
@@ -160,15 +165,13 @@ class DatabaseManager:
         Returns:
             User instance or None if not found
         """
-        session = self.async_session_factory()
-        try:
-            from sqlalchemy import select
+        # Sessions check out a connection from the engine's pool and
+        # return it on exit, so lookups reuse warm connections
+        async with self.async_session_factory() as session:
             result = await session.execute(
                 select(User).where(User.wallet_address == wallet_address)
             )
             return result.scalar_one_or_none()
-        finally:
-            await session.close()
 
     async def get_user_by_webhook_uuid(self, webhook_uuid: str) -> Optional[User]:
         """Get user by webhook UUID.
@@ -179,15 +182,11 @@ class DatabaseManager:
         Returns:
             User instance or None if not found
         """
-        session = self.async_session_factory()
-        try:
-            from sqlalchemy import select
+        async with self.async_session_factory() as session:
             result = await session.execute(
                 select(User).where(User.webhook_uuid == webhook_uuid)
             )
             return result.scalar_one_or_none()
-        finally:
-            await session.close()
 
     async def create_user(self, user: User) -> User:
         """Create new user.
@@ -252,7 +251,6 @@ class DatabaseManager:
         """
         session = self.async_session_factory()
         try:
-            from sqlalchemy import select
             result = await session.execute(
                 select(Position)
                 .where(Position.user_address == wallet_address)
@@ -273,7 +271,6 @@ class DatabaseManager:
         """
         session = self.async_session_factory()
         try:
-            from sqlalchemy import select
             result = await session.execute(
                 select(Position)
                 .where(Position.user_address == wallet_address, Position.status == "open")
@@ -330,6 +327,26 @@ class DatabaseManager:
         finally:
             await session.close()
 
+    async def warm_pool(self) -> int:
+        """Pre-open pooled connections so early requests skip connect cost.
+
+        Checks out up to ``pool_size`` connections concurrently and returns
+        them to the pool, leaving them idle and ready for reuse.
+
+        Returns:
+            Number of connections opened
+        """
+        size_fn = getattr(self.engine.pool, 'size', None)
+        pool_size = max(size_fn() if callable(size_fn) else 1, 1)
+
+        async def _open_one():
+            async with self.engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+
+        await asyncio.gather(*(_open_one() for _ in range(pool_size)))
+        logger.info(f"Database pool warmed with {pool_size} connections")
+        return pool_size
+
     async def close(self) -> None:
         """Close database connections."""
         await self.engine.dispose()
@@ -379,6 +396,12 @@ async def check_db_health() -> dict:
     return await db_manager.check_health()
 
 
+async def warm_db_pool() -> int:
+    """Pre-open database pool connections at startup."""
+    db_manager = get_database_manager()
+    return await db_manager.warm_pool()
+
+
 async def create_sample_data() -> None:
     """Create sample data for development/testing."""
     db_manager = get_database_manager()
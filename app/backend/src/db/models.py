@@ -187,6 +187,16 @@ class Position(SQLModel, table=True):
         """Calculate notional value of the position."""
         return self.entry_price * self.size
 
+    @property
+    def opened_at_iso(self) -> Optional[str]:
+        """Opening timestamp in ISO format, formatted once per instance."""
+        # opened_at does not change after opening; cached outside the fields
+        opened_at_iso = self.__dict__.get('_opened_at_iso')
+        if opened_at_iso is None and self.opened_at:
+            opened_at_iso = self.opened_at.isoformat()
+            self.__dict__['_opened_at_iso'] = opened_at_iso
+        return opened_at_iso
+
     def close_position(self) -> None:
         """Mark position as closed."""
         self.status = "closed"
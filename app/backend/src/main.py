@@ -24,11 +24,18 @@ from slowapi.errors import RateLimitExceeded
 from slowapi.middleware import SlowAPIMiddleware
 import uvicorn
 
+try:
+    from prometheus_client import make_asgi_app
+except ImportError:
+    make_asgi_app = None
+
 from .core.config import get_settings, get_cors_middleware_config, validate_configuration
 from .core.network_validator import NetworkValidator
 from .core.resilience import get_error_handler
-from .db.database import init_db, check_db_health, get_database_manager
+from .db.database import init_db, check_db_health, get_database_manager, warm_db_pool
 from .core.security import get_encryption_manager
+from .bot.telegram_manager import TelegramManager
+from .bot.dydx_client import DydxClient
 from .core.logging_config import setup_logging, get_logger
 from .api import auth, trading, user, webhooks, websockets, health, equity_curve
 # from .api import pnl, errors  # TODO: Need proper authentication setup
@@ -74,8 +81,10 @@ async def lifespan(app: FastAPI):
                 else:
                     logger.warning(f"Configuration warning: {message}")
 
-        # Initialize encryption manager
+        # Initialize encryption manager and exercise the cipher once so the
+        # first credential decrypt on a request path is already warm
         encryption_manager = get_encryption_manager()
+        encryption_manager.decrypt(encryption_manager.encrypt("warmup"))
         logger.info("Encryption manager initialized")
 
         # Initialize database
@@ -89,6 +98,9 @@ async def lifespan(app: FastAPI):
 
         logger.info(f"Database health check passed in {db_health['response_time_ms']}ms")
 
+        # Pre-open pooled connections so the first requests don't pay connect cost
+        await warm_db_pool()
+
         # Create sample data in development mode
         if get_settings().is_development():
             from .db.database import create_sample_data
@@ -149,6 +161,18 @@ async def lifespan(app: FastAPI):
             await graceful_shutdown(app)
             logger.info("Position monitoring worker stopped")
 
+        # Close pooled Telegram HTTP connections
+        await TelegramManager.close_http_client()
+        logger.info("Telegram HTTP client closed")
+
+        # Close pooled indexer HTTP connections
+        await trading.close_indexer_http_client()
+        logger.info("Indexer HTTP client closed")
+
+        # Close pooled dYdX order lookup connections
+        await DydxClient.close_http_client()
+        logger.info("dYdX indexer HTTP client closed")
+
         # Close database connections
         db_manager = get_database_manager()
         await db_manager.close()
@@ -230,6 +254,10 @@ def create_application() -> FastAPI:
     # Mount static files directory
     app.mount("/static", StaticFiles(directory="src/static"), name="static")
 
+    # Prometheus scrape endpoint for worker metrics
+    if make_asgi_app is not None:
+        app.mount("/metrics", make_asgi_app())
+
     # Add security headers middleware
     @app.middleware("http")
     async def add_security_headers(request: Request, call_next):
@@ -5,35 +5,59 @@ This package provides a comprehensive background monitoring system for dYdX
 trading positions with automated closure capabilities and real-time notifications.
 """
 
-from .position_monitor import (
-    PositionMonitorWorker,
-    WorkerConfig,
-    WorkerMetrics,
-    get_position_monitor_worker,
-    initialize_worker,
-    graceful_shutdown,
-    health_check
-)
+from importlib import import_module
+from typing import Any
+
+# Public names and the submodule defining each. They are imported on first
+# access so importing one worker module doesn't load the whole package.
+_EXPORTS = {
+    # Main worker and its management
+    "PositionMonitorWorker": ".position_monitor",
+    "WorkerConfig": ".position_monitor",
+    "WorkerMetrics": ".position_monitor",
+    "get_position_monitor_worker": ".position_monitor",
+    "initialize_worker": ".position_monitor",
+    "graceful_shutdown": ".position_monitor",
+    "health_check": ".position_monitor",
+
+    # Components
+    "DydxOrderMonitor": ".dydx_order_monitor",
+    "PositionStateManager": ".position_state_manager",
+    "PositionClosureOrchestrator": ".position_closure_orchestrator",
+    "BatchProcessor": ".batch_processor",
+    "PositionNotificationManager": ".notification_manager",
+    "MonitoringManager": ".monitoring_manager",
+    "SystemMetrics": ".monitoring_manager",
+    "AlertRule": ".monitoring_manager",
+    "MetricsCollector": ".monitoring_manager",
+
+    # Error handling
+    "ErrorHandler": ".error_handler",
+    "ErrorRecoveryManager": ".error_handler",
+    "ErrorContext": ".error_handler",
+    "ErrorRecord": ".error_handler",
+    "ErrorSeverity": ".error_handler",
+    "ErrorCategory": ".error_handler",
+    "handle_async_error": ".error_handler",
+    "handle_sync_error": ".error_handler",
+    "create_error_context": ".error_handler",
+    "error_handler": ".error_handler",
+    "recovery_manager": ".error_handler",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
 
-from .dydx_order_monitor import DydxOrderMonitor
-from .position_state_manager import PositionStateManager
-from .position_closure_orchestrator import PositionClosureOrchestrator
-from .batch_processor import BatchProcessor
-from .notification_manager import PositionNotificationManager
-from .monitoring_manager import MonitoringManager, SystemMetrics, AlertRule, MetricsCollector
-from .error_handler import (
-    ErrorHandler,
-    ErrorRecoveryManager,
-    ErrorContext,
-    ErrorRecord,
-    ErrorSeverity,
-    ErrorCategory,
-    handle_async_error,
-    handle_sync_error,
-    create_error_context,
-    error_handler,
-    recovery_manager
-)
 
 __version__ = "1.0.0"
 __all__ = [
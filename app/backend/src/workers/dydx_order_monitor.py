@@ -53,8 +53,8 @@ class DydxOrderMonitor:
         # Create dYdX client
         try:
             dydx_client = await DydxClient.create_client(
-                eth_private_key=credentials['dydx_private_key'],
-                network_id=1  # Mainnet
+                mnemonic=credentials['dydx_mnemonic'],
+                network_id=credentials['network_id']
             )
         except Exception as e:
             logger.error(f"Failed to create dYdX client: {e}")
@@ -227,6 +227,9 @@ class DydxOrderMonitor:
                     'type': result.get('type'),
                     'size': result.get('size'),
                     'price': result.get('price'),
+                    'trigger_price': result.get('trigger_price'),
+                    'time_in_force': result.get('time_in_force'),
+                    'post_only': result.get('post_only'),
                     'remaining_size': result.get('remaining_size'),
                     'created_at': result.get('created_at'),
                     'updated_at': result.get('updated_at'),
@@ -250,15 +253,26 @@ class DydxOrderMonitor:
     async def cancel_order_if_exists(
         self,
         client: DydxClient,
-        order_id: str
+        order_id: str,
+        order_details: Optional[Dict[str, Any]] = None
     ) -> bool:
-        """Safely cancel order with existence check."""
+        """Safely cancel order with existence check.
+
+        Args:
+            client: Authenticated DydxClient instance
+            order_id: dYdX order ID to cancel
+            order_details: Previously fetched order details; skips the lookup when given
+
+        Returns:
+            True if the order is cancelled or no longer open
+        """
         try:
             if not order_id:
                 return False
 
             # First check if order exists and is cancellable
-            order_details = await self.get_order_details(client, order_id)
+            if order_details is None:
+                order_details = await self.get_order_details(client, order_id)
 
             if order_details.get('status') == 'ERROR':
                 logger.warning(f"Order {order_id} not found or already cancelled")
@@ -295,7 +309,7 @@ class DydxOrderMonitor:
             # Create dYdX client
             dydx_client = await DydxClient.create_client(
                 mnemonic=credentials['dydx_mnemonic'],
-                network_id=1
+                network_id=credentials['network_id']
             )
 
             # Get order details
@@ -329,7 +343,7 @@ class DydxOrderMonitor:
             try:
                 dydx_client = await DydxClient.create_client(
                     mnemonic=credentials['dydx_mnemonic'],
-                    network_id=1
+                    network_id=credentials['network_id']
                 )
 
                 account_info = await DydxClient.get_account_info(dydx_client)
@@ -381,7 +395,7 @@ class DydxOrderMonitor:
             # Create dYdX client
             dydx_client = await DydxClient.create_client(
                 mnemonic=credentials['dydx_mnemonic'],
-                network_id=1
+                network_id=credentials['network_id']
             )
 
             # Get all market data in one call
@@ -7,11 +7,16 @@ with rollback capabilities and comprehensive error handling.
 
 import asyncio
 import logging
-from typing import Dict, List, Any, Optional, Tuple
+import operator
+from collections import OrderedDict
+from typing import AsyncIterator, Dict, List, Any, Optional, Tuple
 from datetime import datetime
 from decimal import Decimal
 
-from sqlmodel import Session
+import numpy as np
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm.attributes import set_committed_value
 
 from ..db.models import Position
 from ..bot.dydx_client import DydxClient
@@ -20,19 +25,51 @@ from .position_state_manager import PositionStateManager
 
 logger = logging.getLogger(__name__)
 
+# Stateless helpers shared by every orchestrator instance
+_order_monitor = DydxOrderMonitor()
+_state_manager = PositionStateManager()
+
+# Pre-closure validation results keyed by position id, state and the
+# closing data fields validation reads
+VALIDATION_CACHE_SIZE = 1024
+_validation_cache: "OrderedDict[Tuple, Tuple[bool, str]]" = OrderedDict()
+_VALIDATED_CLOSURE_FIELDS = operator.itemgetter('closing_price', 'closing_size', 'timestamp')
+
+# Position columns holding the dYdX orders that belong to a position
+ORDER_ID_FIELDS = ('dydx_order_id', 'tp_order_id', 'sl_order_id')
+
+# Indexer order statuses that leave nothing to restore after a cancel
+INACTIVE_ORDER_STATUSES = frozenset({'ERROR', 'FILLED', 'CANCELED', 'BEST_EFFORT_CANCELED'})
+
+# Indexer order types that only rest once triggered (TP/SL)
+CONDITIONAL_ORDER_TYPES = frozenset({
+    'STOP_LIMIT', 'STOP_MARKET', 'TAKE_PROFIT', 'TAKE_PROFIT_MARKET', 'TRAILING_STOP',
+})
+
 
 class PositionClosureOrchestrator:
     """Orchestrates complete automatic position closure with rollback capabilities."""
 
-    def __init__(self, db_session: Session):
+    def __init__(
+        self,
+        db_session: AsyncSession,
+        session_factory: Optional[async_sessionmaker] = None
+    ):
         """Initialize the closure orchestrator.
 
         Args:
-            db_session: Database session for position updates
+            db_session: Async database session whose engine position updates use
+            session_factory: Optional factory for the per-write sessions
         """
-        self.db = db_session
-        self.order_monitor = DydxOrderMonitor()
-        self.state_manager = PositionStateManager()
+        # Closures run concurrently while the worker's session holds the
+        # loaded positions. Each write gets a short-lived session of its own,
+        # so a failed commit only rolls back that write instead of expiring
+        # every position in a shared session.
+        self._session_factory = session_factory or async_sessionmaker(
+            db_session.bind, expire_on_commit=False
+        )
+        self.order_monitor = _order_monitor
+        self.state_manager = _state_manager
 
     async def close_position_automatically(
         self,
@@ -52,22 +89,14 @@ class PositionClosureOrchestrator:
         Returns:
             Closure operation result
         """
-        logger.info(f"Starting automatic closure for position {position.id}: {closing_reason}")
+        logger.info("Starting automatic closure for position %s: %s", position.id, closing_reason)
 
         try:
-            # Step 1: Pre-closure validation
-            validation_result = await self._validate_pre_closure(position, closing_data)
-            if not validation_result['valid']:
-                return {
-                    'success': False,
-                    'error': f"Pre-closure validation failed: {validation_result['error']}",
-                    'position_id': position.id,
-                }
-
-            # Step 2: Cancel remaining orders
-            cancel_result = await self._cancel_remaining_orders(position, credentials)
-            if not cancel_result['success']:
-                logger.warning(f"Failed to cancel some orders for position {position.id}: {cancel_result['error']}")
+            # Steps 1-2: Pre-closure validation and order cancellation
+            prepare_result = await self._prepare_closure(position, credentials, closing_data)
+            if not prepare_result['success']:
+                return prepare_result
+            cancel_result = prepare_result['cancel_result']
 
             # Step 3: Update database
             update_result = await self._update_position_in_database(position, closing_data, closing_reason)
@@ -81,35 +110,99 @@ class PositionClosureOrchestrator:
                 }
 
             # Step 4: Calculate final P&L
-            pnl_result = await self._calculate_final_pnl(position, closing_data)
-            update_result['pnl'] = pnl_result['pnl']
-            update_result['closing_price'] = pnl_result['closing_price']
-
-            logger.info(f"Position {position.id} closed successfully: {closing_reason}")
+            return await self._finalize_closure(position, closing_reason, closing_data, cancel_result)
 
+        except Exception as e:
+            logger.error("Error in position closure orchestration for %s: %s", position.id, e)
             return {
-                'success': True,
+                'success': False,
+                'error': str(e),
                 'position_id': position.id,
-                'closing_reason': closing_reason,
-                'closing_price': pnl_result['closing_price'],
-                'pnl': pnl_result['pnl'],
-                'orders_cancelled': cancel_result.get('orders_cancelled', []),
-                'rollback_available': False,  # Closure completed successfully
             }
 
-        except Exception as e:
-            logger.error(f"Error in position closure orchestration for {position.id}: {e}")
+    async def _prepare_closure(
+        self,
+        position: Position,
+        credentials: Dict[str, str],
+        closing_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Validate the position and cancel its remaining orders (steps 1-2)."""
+        validation_result = await self._validate_pre_closure(position, closing_data)
+        if not validation_result['valid']:
             return {
                 'success': False,
-                'error': str(e),
+                'error': f"Pre-closure validation failed: {validation_result['error']}",
                 'position_id': position.id,
             }
 
+        cancel_result = await self._cancel_remaining_orders(position, credentials)
+        if not cancel_result['success']:
+            logger.warning("Failed to cancel some orders for position %s: %s", position.id, cancel_result['error'])
+
+        return {
+            'success': True,
+            'cancel_result': cancel_result,
+        }
+
+    async def _finalize_closure(
+        self,
+        position: Position,
+        closing_reason: str,
+        closing_data: Dict[str, Any],
+        cancel_result: Dict[str, Any],
+        pnl_result: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Calculate final P&L and build the closure result (step 4).
+
+        Bulk closures pass the P&L they already computed for the batch.
+        """
+        if pnl_result is None:
+            pnl_result = await self._calculate_final_pnl(position, closing_data)
+
+        logger.info("Position %s closed successfully: %s", position.id, closing_reason)
+
+        return {
+            'success': True,
+            'position_id': position.id,
+            'closing_reason': closing_reason,
+            'closing_type': closing_data.get('closing_type'),
+            'closing_price': pnl_result['closing_price'],
+            'pnl': pnl_result['pnl'],
+            'orders_cancelled': cancel_result.get('orders_cancelled', []),
+            'rollback_available': False,  # Closure completed successfully
+        }
+
     async def _validate_pre_closure(self, position: Position, closing_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Validate position state before closure."""
+        """Validate position state before closure.
+
+        Results are memoized in a bounded LRU keyed by the position's id,
+        status and entry price plus the closing price, size and timestamp,
+        so a status change always misses the cache. The rest of the closing
+        data (nested order dicts) isn't read by validation and is left out.
+        """
         try:
-            # Use the state manager's validation
-            is_valid, error = await self.state_manager.validate_position_closure(position, closing_data)
+            try:
+                cache_key = (
+                    position.id,
+                    position.status,
+                    position.entry_price,
+                    *_VALIDATED_CLOSURE_FIELDS(closing_data),
+                )
+                hash(cache_key)
+            except (KeyError, TypeError):
+                cache_key = None  # Incomplete closing data, validate uncached
+
+            if cache_key is not None and cache_key in _validation_cache:
+                _validation_cache.move_to_end(cache_key)
+                is_valid, error = _validation_cache[cache_key]
+            else:
+                # Use the state manager's validation
+                is_valid, error = self.state_manager.validate_position_closure(position, closing_data)
+
+                if cache_key is not None:
+                    _validation_cache[cache_key] = (is_valid, error)
+                    if len(_validation_cache) > VALIDATION_CACHE_SIZE:
+                        _validation_cache.popitem(last=False)
 
             return {
                 'valid': is_valid,
@@ -117,7 +210,7 @@ class PositionClosureOrchestrator:
             }
 
         except Exception as e:
-            logger.error(f"Pre-closure validation error for position {position.id}: {e}")
+            logger.error("Pre-closure validation error for position %s: %s", position.id, e)
             return {
                 'valid': False,
                 'error': f"Validation error: {str(e)}",
@@ -128,63 +221,122 @@ class PositionClosureOrchestrator:
         position: Position,
         credentials: Dict[str, str]
     ) -> Dict[str, Any]:
-        """Cancel any remaining open orders for the position."""
+        """Cancel any remaining open orders for the position.
+
+        Open orders are fetched once for the subaccount and only IDs still in
+        that set are cancelled. The fetched details are kept as
+        ``order_snapshots`` so a failed closure can re-place exactly the
+        orders that were cancelled.
+        """
+        order_ids = {
+            field: getattr(position, field)
+            for field in ORDER_ID_FIELDS
+            if getattr(position, field)
+        }
+        if not order_ids:
+            # Nothing to cancel, skip client creation entirely
+            return {
+                'success': True,
+                'orders_cancelled': [],
+                'failed_cancellations': [],
+                'order_snapshots': [],
+                'error': None,
+            }
+
         cancelled_orders = []
         failed_cancellations = []
+        order_snapshots = []
 
         try:
             # Create dYdX client
-            dydx_client = await DydxClient.create_client(
-                eth_private_key=credentials['dydx_private_key'],
-                network_id=1
-            )
-
-            # Cancel entry order if exists and is open
-            if position.dydx_order_id:
-                cancel_result = await self.order_monitor.cancel_order_if_exists(
-                    dydx_client, position.dydx_order_id
-                )
-                if cancel_result:
-                    cancelled_orders.append(position.dydx_order_id)
+            dydx_client = await self._create_client(credentials)
+
+            # One lookup for the whole subaccount (resting and untriggered
+            # orders) instead of one per order; fall back to per-order
+            # lookups if the indexer call fails
+            open_orders_result = await DydxClient.get_open_orders(dydx_client)
+            open_orders = open_orders_result.get('orders') if open_orders_result['success'] else None
+
+            # Cancel entry, TP and SL orders if they exist and are open
+            for field, order_id in order_ids.items():
+                if open_orders is not None:
+                    if order_id not in open_orders:
+                        continue  # Already filled or cancelled
+                    order_details = open_orders[order_id]
                 else:
-                    failed_cancellations.append(position.dydx_order_id)
+                    order_details = await self.order_monitor.get_order_details(dydx_client, order_id)
+                snapshot = self._snapshot_order(order_details, field)
 
-            # Cancel TP order if exists and is open
-            if position.tp_order_id:
                 cancel_result = await self.order_monitor.cancel_order_if_exists(
-                    dydx_client, position.tp_order_id
+                    dydx_client, order_id, order_details
                 )
                 if cancel_result:
-                    cancelled_orders.append(position.tp_order_id)
+                    cancelled_orders.append(order_id)
+                    if snapshot:
+                        order_snapshots.append(snapshot)
                 else:
-                    failed_cancellations.append(position.tp_order_id)
-
-            # Cancel SL order if exists and is open
-            if position.sl_order_id:
-                cancel_result = await self.order_monitor.cancel_order_if_exists(
-                    dydx_client, position.sl_order_id
-                )
-                if cancel_result:
-                    cancelled_orders.append(position.sl_order_id)
-                else:
-                    failed_cancellations.append(position.sl_order_id)
+                    failed_cancellations.append(order_id)
 
             return {
                 'success': len(failed_cancellations) == 0,
                 'orders_cancelled': cancelled_orders,
                 'failed_cancellations': failed_cancellations,
+                'order_snapshots': order_snapshots,
                 'error': f"Failed to cancel {len(failed_cancellations)} orders" if failed_cancellations else None,
             }
 
         except Exception as e:
-            logger.error(f"Error cancelling orders for position {position.id}: {e}")
+            logger.error("Error cancelling orders for position %s: %s", position.id, e)
             return {
                 'success': False,
                 'orders_cancelled': cancelled_orders,
                 'failed_cancellations': failed_cancellations,
+                'order_snapshots': order_snapshots,
                 'error': str(e),
             }
 
+    @staticmethod
+    async def _create_client(credentials: Dict[str, Any]) -> DydxClient:
+        """Create a dYdX client on the user's network from their credentials."""
+        return await DydxClient.create_client(
+            mnemonic=credentials['dydx_mnemonic'],
+            network_id=credentials['network_id']
+        )
+
+    @staticmethod
+    def _snapshot_order(
+        order_details: Dict[str, Any],
+        position_field: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Capture the parameters needed to re-place a still-open order.
+
+        Conditional (TP/SL) orders are flagged so a rollback doesn't turn
+        them into plain limit orders.
+        """
+        status = (order_details.get('status') or '').upper()
+        if status in INACTIVE_ORDER_STATUSES:
+            return None
+
+        order_type = (order_details.get('type') or 'LIMIT').upper()
+        trigger_price = order_details.get('trigger_price')
+        conditional = order_type in CONDITIONAL_ORDER_TYPES or bool(trigger_price)
+        if not conditional and not order_details.get('price'):
+            return None
+
+        return {
+            'order_id': order_details.get('order_id'),
+            'position_field': position_field,
+            'order_type': order_type,
+            'trigger_price': trigger_price,
+            'conditional': conditional,
+            'symbol': order_details.get('symbol'),
+            'side': order_details.get('side'),
+            'size': order_details.get('remaining_size') or order_details.get('size'),
+            'price': order_details.get('price'),
+            'time_in_force': order_details.get('time_in_force') or 'GTT',
+            'post_only': bool(order_details.get('post_only')),
+        }
+
     async def _update_position_in_database(
         self,
         position: Position,
@@ -193,43 +345,73 @@ class PositionClosureOrchestrator:
     ) -> Dict[str, Any]:
         """Update position status in database."""
         try:
-            # Update position fields
-            position.status = "closed"
-            position.closed_at = datetime.utcnow()
+            closed_at = datetime.utcnow()
+            await self._execute_update(
+                update(Position)
+                .where(Position.id == position.id)
+                .values(status="closed")
+            )
+            # Mirror the committed value without dirtying the caller's session
+            set_committed_value(position, 'status', "closed")
 
-            # Add closing metadata
-            if not hasattr(position, 'closing_metadata'):
-                position.closing_metadata = {}
+            logger.info("Position %s updated in database", position.id)
 
-            position.closing_metadata.update({
-                'closing_reason': closing_reason,
-                'closing_price': closing_data.get('closing_price'),
-                'closing_size': closing_data.get('closing_size'),
-                'closed_at': position.closed_at.isoformat(),
-                'automated_closure': True,
-            })
+            return {
+                'success': True,
+                'position_id': position.id,
+                'updated_fields': ['status'],
+                'closing_metadata': {
+                    'closing_reason': closing_reason,
+                    'closing_price': closing_data.get('closing_price'),
+                    'closing_size': closing_data.get('closing_size'),
+                    'closed_at': closed_at.isoformat(),
+                    'automated_closure': True,
+                },
+            }
 
-            # Commit the changes
-            self.db.add(position)
-            self.db.commit()
-            self.db.refresh(position)
+        except Exception as e:
+            logger.error("Database update failed for position %s: %s", position.id, e)
+            return {
+                'success': False,
+                'error': str(e),
+            }
+
+    async def _bulk_update_positions_in_database(
+        self,
+        positions: List[Position]
+    ) -> Dict[str, Any]:
+        """Mark several positions closed with a single UPDATE statement."""
+        position_ids = [position.id for position in positions]
+
+        try:
+            await self._execute_update(
+                update(Position)
+                .where(Position.id.in_(position_ids))
+                .values(status="closed")
+            )
+            for position in positions:
+                set_committed_value(position, 'status', "closed")
 
-            logger.info(f"Position {position.id} updated in database")
+            logger.info("%s positions updated in database", len(position_ids))
 
             return {
                 'success': True,
-                'position_id': position.id,
-                'updated_fields': ['status', 'closed_at', 'closing_metadata'],
+                'position_ids': position_ids,
+                'updated_fields': ['status'],
             }
 
         except Exception as e:
-            logger.error(f"Database update failed for position {position.id}: {e}")
-            self.db.rollback()
+            logger.error("Bulk database update failed for positions %s: %s", position_ids, e)
             return {
                 'success': False,
                 'error': str(e),
             }
 
+    async def _execute_update(self, statement) -> None:
+        """Run an UPDATE in its own session, rolling back on failure."""
+        async with self._session_factory() as session, session.begin():
+            await session.execute(statement)
+
     async def _calculate_final_pnl(
         self,
         position: Position,
@@ -241,7 +423,7 @@ class PositionClosureOrchestrator:
             closing_size = closing_data.get('closing_size', float(position.size))
 
             # Use state manager's P&L calculation
-            pnl = await self.state_manager.calculate_position_pnl(
+            pnl = self.state_manager.calculate_position_pnl(
                 position, closing_price, closing_size
             )
 
@@ -252,7 +434,7 @@ class PositionClosureOrchestrator:
             }
 
         except Exception as e:
-            logger.error(f"P&L calculation failed for position {position.id}: {e}")
+            logger.error("P&L calculation failed for position %s: %s", position.id, e)
             return {
                 'pnl': 0.0,
                 'closing_price': float(position.entry_price),
@@ -260,23 +442,137 @@ class PositionClosureOrchestrator:
                 'error': str(e),
             }
 
+    def _calculate_final_pnl_batch(
+        self,
+        closures: List[Tuple[Position, Dict[str, Any]]]
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Vectorized _calculate_final_pnl for positions closed together.
+
+        P&L and the emergency-move flag for the whole batch each come from a
+        single NumPy expression. Returns None if any closing price isn't
+        numeric, so the caller can fall back to the per-position path.
+        """
+        entry_prices, sizes = self.state_manager.position_arrays(
+            [position for position, _ in closures]
+        )
+        try:
+            closing_prices = np.array([
+                float(data.get('closing_price', entry))
+                for (_, data), entry in zip(closures, entry_prices)
+            ], dtype=np.float64)
+        except (TypeError, ValueError):
+            return None
+
+        # Like calculate_position_pnl, P&L is taken on the position size
+        pnls = self.state_manager.calculate_position_pnl_batch(entry_prices, closing_prices, sizes)
+        emergency = self.state_manager.emergency_close_mask(entry_prices, closing_prices)
+
+        return [
+            {
+                'pnl': float(pnl),
+                'closing_price': float(closing_price),
+                'closing_size': data.get('closing_size', float(size)),
+                'emergency_move': bool(is_emergency),
+            }
+            for (_, data), pnl, closing_price, size, is_emergency
+            in zip(closures, pnls, closing_prices, sizes, emergency)
+        ]
+
     async def _rollback_order_cancellations(
         self,
         position: Position,
         credentials: Dict[str, str],
         cancel_result: Dict[str, Any]
-    ) -> None:
-        """Attempt to rollback order cancellations if database update failed."""
-        logger.warning(f"Attempting to rollback order cancellations for position {position.id}")
+    ) -> Dict[str, str]:
+        """Attempt to rollback order cancellations if database update failed.
+
+        Re-places the limit orders captured in ``cancel_result['order_snapshots']``
+        concurrently over a single client connection and stores the new order
+        IDs on the position. Conditional TP/SL orders can't be re-placed through
+        the limit order API, so they are reported instead of being restored as
+        marketable limit orders.
+
+        Returns:
+            New order IDs keyed by the position field they replace
+        """
+        snapshots = cancel_result.get('order_snapshots', [])
+        if not snapshots:
+            logger.info("No cancelled orders to restore for position %s", position.id)
+            return {}
+
+        conditional = [snapshot['order_id'] for snapshot in snapshots if snapshot['conditional']]
+        if conditional:
+            logger.error(
+                "Cannot restore conditional orders %s for position %s; TP/SL must be re-placed manually",
+                conditional, position.id
+            )
+
+        snapshots = [snapshot for snapshot in snapshots if not snapshot['conditional']]
+        if not snapshots:
+            return {}
+
+        logger.warning(
+            "Attempting to rollback %d order cancellations for position %s",
+            len(snapshots), position.id
+        )
 
         try:
-            # This is a best-effort rollback
-            # In a real system, you might want to store the original order state
+            dydx_client = await self._create_client(credentials)
+
+            results = await asyncio.gather(*[
+                DydxClient.place_limit_order(
+                    dydx_client,
+                    symbol=snapshot['symbol'],
+                    side=snapshot['side'],
+                    size=str(snapshot['size']),
+                    price=str(snapshot['price']),
+                    time_in_force=snapshot['time_in_force'],
+                    network_id=credentials['network_id'],
+                )
+                for snapshot in snapshots
+            ], return_exceptions=True)
 
-            logger.info(f"Rollback completed for position {position.id}")
+            restored = {
+                snapshot['position_field']: result['order_id']
+                for snapshot, result in zip(snapshots, results)
+                if isinstance(result, dict) and result.get('success')
+            }
+
+            if len(restored) == len(snapshots):
+                logger.info("Rollback completed for position %s: restored %s", position.id, restored)
+            else:
+                logger.error(
+                    "Partial rollback for position %s: restored %d/%d orders",
+                    position.id, len(restored), len(snapshots)
+                )
+
+            if restored:
+                await self._store_restored_order_ids(position, restored)
+            return restored
 
         except Exception as e:
-            logger.error(f"Rollback failed for position {position.id}: {e}")
+            logger.error("Rollback failed for position %s: %s", position.id, e)
+            return {}
+
+    async def _store_restored_order_ids(
+        self,
+        position: Position,
+        restored: Dict[str, str]
+    ) -> None:
+        """Point the position at the orders re-placed during a rollback."""
+        try:
+            await self._execute_update(
+                update(Position)
+                .where(Position.id == position.id)
+                .values(**restored)
+            )
+            for field, order_id in restored.items():
+                set_committed_value(position, field, order_id)
+        except Exception as e:
+            logger.error(
+                "Failed to store restored order IDs %s for position %s: %s",
+                restored, position.id, e
+            )
 
     async def close_position_with_confirmation(
         self,
@@ -288,10 +584,7 @@ class PositionClosureOrchestrator:
         """Close position with additional confirmation step."""
         try:
             # Get current market price for confirmation
-            dydx_client = await DydxClient.create_client(
-                mnemonic=credentials['dydx_mnemonic'],
-                network_id=1
-            )
+            dydx_client = await self._create_client(credentials)
 
             market_price_result = await DydxClient.get_market_price(dydx_client, position.symbol)
 
@@ -304,8 +597,8 @@ class PositionClosureOrchestrator:
 
                 if price_diff_pct > 0.05:  # 5% threshold
                     logger.warning(
-                        f"Closing price {closing_price} differs significantly from market {current_price} "
-                        f"for position {position.id} ({price_diff_pct:.2%})"
+                        "Closing price %s differs significantly from market %s for position %s (%.2f%%)",
+                        closing_price, current_price, position.id, price_diff_pct * 100
                     )
 
             # Proceed with normal closure
@@ -314,21 +607,27 @@ class PositionClosureOrchestrator:
             )
 
         except Exception as e:
-            logger.error(f"Error in position closure with confirmation for {position.id}: {e}")
+            logger.error("Error in position closure with confirmation for %s: %s", position.id, e)
             return {
                 'success': False,
                 'error': str(e),
                 'position_id': position.id,
             }
 
-    async def bulk_close_positions(
+    async def iter_close_positions(
         self,
         positions: List[Tuple[Position, str, Dict[str, Any]]],
         credentials_map: Dict[str, Dict[str, str]],
         max_concurrent: int = 5
-    ) -> List[Dict[str, Any]]:
-        """Close multiple positions concurrently."""
-        async def close_single_position(
+    ) -> AsyncIterator[Tuple[int, Dict[str, Any]]]:
+        """Close multiple positions concurrently, yielding results as they finish.
+
+        Yields ``(index, result)`` pairs where index points into ``positions``.
+        Positions that fail validation are yielded as soon as they fail; the
+        rest are yielded after a single UPDATE flips all of their statuses,
+        with P&L and emergency-move flags computed for the batch at once.
+        """
+        async def prepare_single_position(
             position_data: Tuple[Position, str, Dict[str, Any]]
         ) -> Dict[str, Any]:
             position, reason, data = position_data
@@ -344,9 +643,9 @@ class PositionClosureOrchestrator:
             credentials = credentials_map[user_address]
 
             try:
-                return await self.close_position_automatically(position, credentials, reason, data)
+                return await self._prepare_closure(position, credentials, data)
             except Exception as e:
-                logger.error(f"Error closing position {position.id}: {e}")
+                logger.error("Error closing position %s: %s", position.id, e)
                 return {
                     'success': False,
                     'error': str(e),
@@ -356,26 +655,72 @@ class PositionClosureOrchestrator:
         # Process positions concurrently with limit
         semaphore = asyncio.Semaphore(max_concurrent)
 
-        async def throttled_close(position_data):
+        async def throttled_prepare(index, position_data):
             async with semaphore:
-                return await close_single_position(position_data)
-
-        # Execute all closures
-        tasks = [throttled_close(pos_data) for pos_data in positions]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Process results
-        processed_results = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                position = positions[i][0]
-                processed_results.append({
+                return index, await prepare_single_position(position_data)
+
+        # Validate and cancel orders for all positions
+        tasks = [throttled_prepare(i, pos_data) for i, pos_data in enumerate(positions)]
+
+        prepared = []
+        for next_result in asyncio.as_completed(tasks):
+            i, result = await next_result
+            if result['success']:
+                prepared.append((i, positions[i], result['cancel_result']))
+            else:
+                yield i, result
+
+        if not prepared:
+            return
+
+        # Update database for all prepared positions at once
+        update_result = await self._bulk_update_positions_in_database(
+            [position_data[0] for _, position_data, _ in prepared]
+        )
+
+        pnl_results = None
+        if update_result['success'] and prepared:
+            pnl_results = self._calculate_final_pnl_batch(
+                [(position, data) for _, (position, _, data), _ in prepared]
+            )
+
+        for k, (i, (position, reason, data), cancel_result) in enumerate(prepared):
+            if update_result['success']:
+                pnl_result = pnl_results[k] if pnl_results is not None else None
+                result = await self._finalize_closure(position, reason, data, cancel_result, pnl_result)
+                if pnl_result is not None:
+                    result['emergency_move'] = pnl_result['emergency_move']
+                    if pnl_result['emergency_move']:
+                        logger.warning(
+                            "Position %s closed beyond the emergency price band at %s",
+                            position.id, pnl_result['closing_price']
+                        )
+                yield i, result
+            else:
+                # Rollback: Try to restore orders if database update failed
+                await self._rollback_order_cancellations(
+                    position, credentials_map[position.user_address], cancel_result
+                )
+                yield i, {
                     'success': False,
-                    'error': str(result),
+                    'error': f"Database update failed: {update_result['error']}",
                     'position_id': position.id,
-                })
-            else:
-                processed_results.append(result)
+                }
+
+    async def bulk_close_positions(
+        self,
+        positions: List[Tuple[Position, str, Dict[str, Any]]],
+        credentials_map: Dict[str, Dict[str, str]],
+        max_concurrent: int = 5
+    ) -> List[Dict[str, Any]]:
+        """Close multiple positions concurrently.
+
+        Collects iter_close_positions into a list ordered like ``positions``.
+        """
+        processed_results: List[Optional[Dict[str, Any]]] = [None] * len(positions)
+
+        async for i, result in self.iter_close_positions(positions, credentials_map, max_concurrent):
+            processed_results[i] = result
 
         return processed_results
 
@@ -410,7 +755,7 @@ class PositionClosureOrchestrator:
             }
 
         except Exception as e:
-            logger.error(f"Error previewing position closure for {position.id}: {e}")
+            logger.error("Error previewing position closure for %s: %s", position.id, e)
             return {
                 'success': False,
                 'error': str(e),
@@ -5,33 +5,100 @@ This module implements the core background worker that continuously monitors
 all open positions and handles automated closure logic for TP/SL events.
 """
 
+from __future__ import annotations
+
 import asyncio
 import logging
 import signal
 import time
+from collections import defaultdict
 from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
 from decimal import Decimal
-from typing import Dict, List, Any, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, List, Any, Optional, Set, Tuple
 from dataclasses import dataclass, field
-import json
 
-from fastapi import FastAPI
-from sqlmodel import Session, select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import func, lambda_stmt
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select, or_
+from sqlalchemy.orm import raiseload, selectinload
 
 from ..db.models import User, Position
 from ..db.database import get_database_manager
 from ..core.security import get_encryption_manager
 from ..core.config import get_settings
-from .dydx_order_monitor import DydxOrderMonitor
-from .position_state_manager import PositionStateManager
-from .position_closure_orchestrator import PositionClosureOrchestrator
-from .notification_manager import PositionNotificationManager
-from .monitoring_manager import MonitoringManager
+
+if TYPE_CHECKING:
+    from fastapi import FastAPI
+    from ..bot.websocket_manager import WebSocketManager
+
+# Prometheus metrics are optional; the dataclass counters are always kept
+try:
+    from prometheus_client import Counter, Histogram
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    PROMETHEUS_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+if PROMETHEUS_AVAILABLE:
+    CYCLES_COMPLETED = Counter(
+        "position_monitor_cycles_total", "Completed position monitoring cycles"
+    )
+    POSITIONS_CLOSED = Counter(
+        "position_monitor_positions_closed_total", "Positions closed automatically"
+    )
+    ERRORS_TOTAL = Counter(
+        "position_monitor_errors_total", "Errors raised while monitoring positions"
+    )
+    CYCLE_SECONDS = Histogram(
+        "position_monitor_cycle_seconds", "Position monitoring cycle duration in seconds"
+    )
+
+# Order statuses pushed by the dYdX indexer that can require a position closure
+ORDER_EVENT_STATUSES = frozenset({
+    'FILLED', 'CANCELED', 'CANCELLED', 'BEST_EFFORT_CANCELED', 'EXPIRED',
+})
+
+# Smoothing factor for the average cycle time reported in worker metrics
+CYCLE_TIME_EMA_ALPHA = 0.1
+
+INDEXER_WS_URLS = {
+    1: "wss://indexer.dydx.trade/v4/ws",
+    11155111: "wss://indexer.v4testnet.dydx.exchange/v4/ws",
+}
+
+# User columns read while monitoring: credentials, order streams, notifications
+MONITORED_USER_COLUMNS = (
+    User.wallet_address,
+    User.dydx_network_id,
+    User.dydx_testnet_address,
+    User.dydx_mainnet_address,
+    User.encrypted_dydx_testnet_mnemonic,
+    User.encrypted_dydx_mainnet_mnemonic,
+    User.encrypted_telegram_token,
+    User.encrypted_telegram_chat_id,
+)
+
+# Cached statements: SQLAlchemy keys the compiled SQL on the lambda's code, so
+# the query is neither rebuilt nor re-looked-up structurally each cycle.
+# Open positions with user data loaded; any other relationship access raises
+# instead of issuing a lazy query. Users only carry the columns monitoring
+# reads, leaving the webhook secret and legacy mnemonic in the database.
+_OPEN_POSITIONS_STMT = lambda_stmt(
+    lambda: select(Position)
+    .where(Position.status == "open")
+    .options(
+        selectinload(Position.user).load_only(*MONITORED_USER_COLUMNS, raiseload=True),
+        raiseload("*"),
+    )
+)
+
+_OPEN_POSITIONS_FINGERPRINT_STMT = lambda_stmt(
+    lambda: select(func.count(Position.id), func.max(Position.id))
+    .where(Position.status == "open")
+)
+
 
 @dataclass
 class WorkerMetrics:
@@ -41,9 +108,48 @@ class WorkerMetrics:
     positions_closed: int = 0
     errors_total: int = 0
     last_cycle_time: float = 0.0
-    last_cycle_timestamp: Optional[datetime] = None
     average_cycle_time: float = 0.0
-    start_time: datetime = field(default_factory=datetime.utcnow)
+    # Monotonic clock readings; wall-clock times are only rendered for status
+    last_cycle_monotonic: Optional[float] = None
+    start_monotonic: float = field(default_factory=time.monotonic)
+
+    def record_cycle(self, cycle_time: float) -> None:
+        """Record a completed monitoring cycle."""
+        self.last_cycle_time = cycle_time
+        self.last_cycle_monotonic = time.monotonic()
+        self.cycles_completed += 1
+
+        # Exponential moving average, seeded with the first cycle
+        if self.cycles_completed == 1:
+            self.average_cycle_time = cycle_time
+        else:
+            self.average_cycle_time += CYCLE_TIME_EMA_ALPHA * (cycle_time - self.average_cycle_time)
+
+        if PROMETHEUS_AVAILABLE:
+            CYCLES_COMPLETED.inc()
+            CYCLE_SECONDS.observe(cycle_time)
+
+    def seconds_since_last_cycle(self) -> Optional[float]:
+        """Seconds since the last completed cycle, or None before the first."""
+        if self.last_cycle_monotonic is None:
+            return None
+        return time.monotonic() - self.last_cycle_monotonic
+
+    def uptime_seconds(self) -> float:
+        """Seconds since the metrics were started."""
+        return time.monotonic() - self.start_monotonic
+
+    def record_position_closed(self) -> None:
+        """Record an automatically closed position."""
+        self.positions_closed += 1
+        if PROMETHEUS_AVAILABLE:
+            POSITIONS_CLOSED.inc()
+
+    def record_error(self) -> None:
+        """Record a monitoring error."""
+        self.errors_total += 1
+        if PROMETHEUS_AVAILABLE:
+            ERRORS_TOTAL.inc()
 
 
 @dataclass
@@ -58,6 +164,59 @@ class WorkerConfig:
     max_concurrent_positions: int = 20
     enable_notifications: bool = True
     enable_monitoring: bool = True
+    credentials_cache_ttl: int = 3600  # seconds
+    enable_event_triggers: bool = True
+    event_sweep_interval: int = 300  # full sweep interval while order events are streaming
+    shutdown_timeout: int = 5  # seconds to wait for tasks on stop
+
+
+def _encrypted_mnemonic(user: User) -> Tuple[int, Optional[str]]:
+    """Return the user's network ID and the mnemonic ciphertext for that network."""
+    network_id = user.dydx_network_id or 11155111
+    if network_id == 1:
+        return network_id, user.encrypted_dydx_mainnet_mnemonic
+    return network_id, user.encrypted_dydx_testnet_mnemonic
+
+
+def _decrypt_user_credentials(encryption_manager, user: User) -> Optional[Dict[str, str]]:
+    """Decrypt user credentials for dYdX and Telegram access."""
+    try:
+        # Decrypt the dYdX mnemonic for the user's selected network
+        network_id, encrypted_mnemonic = _encrypted_mnemonic(user)
+        dydx_mnemonic = None
+        if encrypted_mnemonic:
+            dydx_mnemonic = encryption_manager.decrypt(encrypted_mnemonic)
+
+        # Decrypt Telegram credentials
+        telegram_token = None
+        telegram_chat_id = None
+        if user.encrypted_telegram_token and user.encrypted_telegram_chat_id:
+            telegram_token = encryption_manager.decrypt(user.encrypted_telegram_token)
+            telegram_chat_id = encryption_manager.decrypt(user.encrypted_telegram_chat_id)
+
+        if not dydx_mnemonic:
+            logger.warning(f"No dYdX credentials found for user {user.wallet_address}")
+            return None
+
+        return {
+            'dydx_mnemonic': dydx_mnemonic,
+            'network_id': network_id,
+            'telegram_token': telegram_token,
+            'telegram_chat_id': telegram_chat_id,
+            'wallet_address': user.wallet_address,
+        }
+
+    except Exception as e:
+        logger.error(f"Failed to decrypt credentials for user {user.wallet_address}: {e}")
+        return None
+
+
+def _decrypt_all_credentials(encryption_manager, users: List[User]) -> Dict[str, Optional[Dict[str, str]]]:
+    """Decrypt credentials for a batch of users; run in an executor thread."""
+    return {
+        user.wallet_address: _decrypt_user_credentials(encryption_manager, user)
+        for user in users
+    }
 
 
 class PositionMonitorWorker:
@@ -65,13 +224,13 @@ class PositionMonitorWorker:
 
     def __init__(
         self,
-        db_session: Session,
+        db_session: AsyncSession,
         config: Optional[WorkerConfig] = None
     ):
         """Initialize the position monitor worker.
 
         Args:
-            db_session: Database session for queries
+            db_session: Async database session for queries
             config: Worker configuration (uses defaults if None)
         """
         self.db = db_session
@@ -80,8 +239,39 @@ class PositionMonitorWorker:
         self._shutdown_event = asyncio.Event()
         self._monitoring_task: Optional[asyncio.Task] = None
         self._health_check_task: Optional[asyncio.Task] = None
+        self._pending_notifications: Set[asyncio.Task] = set()
+
+        # Closures awaiting notification, coalesced into one message per user
+        # per cycle: user_address -> (credentials, [(position, close_result)])
+        self._pending_closures: Dict[str, Tuple[Dict[str, str], List[Tuple[Position, Dict[str, Any]]]]] = {}
+
+        # Bounded queue of (user_address, positions, credentials) drained by
+        # max_workers consumer tasks; created on start so config changes apply
+        self._user_queue: Optional[asyncio.Queue] = None
+        self._consumer_tasks: List[asyncio.Task] = []
+
+        # Decrypted credentials keyed by the user's ciphertexts, so any
+        # credential change misses the cache: key -> (expires_at, credentials)
+        self._credentials_cache: Dict[Tuple, Tuple[float, Dict[str, str]]] = {}
+
+        # dYdX indexer order streams per dYdX address; terminal order updates
+        # push order IDs onto the queue to trigger a targeted cycle
+        self._order_events: asyncio.Queue = asyncio.Queue()
+        self._order_listeners: Dict[str, Tuple[WebSocketManager, asyncio.Task]] = {}
+
+        # Open positions from the last full sweep and the (count, max id)
+        # fingerprint they were loaded at; reused while the fingerprint holds
+        self._open_positions: Optional[List[Position]] = None
+        self._open_positions_fingerprint: Optional[Tuple[int, Optional[int]]] = None
+
+        # Initialize components; imported here so importing the module for
+        # its config and metrics types does not load the whole worker stack
+        from .dydx_order_monitor import DydxOrderMonitor
+        from .position_state_manager import PositionStateManager
+        from .position_closure_orchestrator import PositionClosureOrchestrator
+        from .notification_manager import PositionNotificationManager
+        from .monitoring_manager import MonitoringManager
 
-        # Initialize components
         self.order_monitor = DydxOrderMonitor()
         self.state_manager = PositionStateManager()
         self.closure_orchestrator = PositionClosureOrchestrator(db_session)
@@ -126,6 +316,13 @@ class PositionMonitorWorker:
         self.metrics = WorkerMetrics()  # Reset metrics
 
         try:
+            # Start user consumers before the loop that feeds them
+            self._user_queue = asyncio.Queue(maxsize=self.config.max_concurrent_positions)
+            self._consumer_tasks = [
+                asyncio.create_task(self._user_consumer())
+                for _ in range(self.config.max_workers)
+            ]
+
             # Start main monitoring loop
             self._monitoring_task = asyncio.create_task(self.monitoring_loop())
 
@@ -150,115 +347,211 @@ class PositionMonitorWorker:
         self.is_running = False
         self._shutdown_event.set()
 
-        # Cancel running tasks
-        if self._monitoring_task and not self._monitoring_task.done():
-            self._monitoring_task.cancel()
-            try:
-                await self._monitoring_task
-            except asyncio.CancelledError:
-                pass
-
-        if self._health_check_task and not self._health_check_task.done():
-            self._health_check_task.cancel()
-            try:
-                await self._health_check_task
-            except asyncio.CancelledError:
-                pass
+        # Cancel running tasks together and wait a bounded time for them
+        tasks = [
+            task
+            for task in (self._monitoring_task, self._health_check_task, *self._consumer_tasks)
+            if task and not task.done()
+        ]
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            _, pending = await asyncio.wait(tasks, timeout=self.config.shutdown_timeout)
+            if pending:
+                logger.warning(f"{len(pending)} worker tasks did not stop within {self.config.shutdown_timeout}s")
+        self._consumer_tasks = []
+
+        # Stop dYdX order streams
+        await asyncio.gather(
+            *(self._stop_order_listener(dydx_address) for dydx_address in list(self._order_listeners)),
+            return_exceptions=True
+        )
+
+        # Let in-flight closure notifications finish
+        if self._pending_notifications:
+            _, pending = await asyncio.wait(
+                list(self._pending_notifications), timeout=self.config.shutdown_timeout
+            )
+            if pending:
+                logger.warning(f"{len(pending)} closure notifications still pending at shutdown")
 
         logger.info("Position monitoring worker stopped")
 
     async def monitoring_loop(self) -> None:
-        """Main monitoring loop with error handling and recovery."""
+        """Main monitoring loop with error handling and recovery.
+
+        Runs a full sweep of open positions on a timer. While dYdX order
+        streams are connected, order events trigger targeted cycles for the
+        affected positions and the full sweep drops to event_sweep_interval.
+        """
         logger.info("Starting monitoring loop...")
+        order_ids: Optional[Set[str]] = None
 
         while self.is_running and not self._shutdown_event.is_set():
             try:
-                cycle_start_time = time.time()
+                cycle_start_time = time.monotonic()
 
                 # Process one monitoring cycle
-                await self._process_monitoring_cycle()
+                await self._process_monitoring_cycle(order_ids)
 
                 # Update metrics
-                cycle_time = time.time() - cycle_start_time
-                self.metrics.last_cycle_time = cycle_time
-                self.metrics.last_cycle_timestamp = datetime.utcnow()
-                self.metrics.cycles_completed += 1
-
-                # Update average cycle time
-                total_cycles = self.metrics.cycles_completed
-                self.metrics.average_cycle_time = (
-                    (self.metrics.average_cycle_time * (total_cycles - 1)) + cycle_time
-                ) / total_cycles
+                cycle_time = time.monotonic() - cycle_start_time
+                self.metrics.record_cycle(cycle_time)
 
                 # Reset error counters on successful cycle
                 self._consecutive_errors = 0
                 self._last_error = None
 
-                # Wait for next cycle or shutdown
+                # Wait for order events, the next sweep, or shutdown
                 if self.is_running and not self._shutdown_event.is_set():
-                    logger.debug(f"Monitoring cycle completed in {cycle_time:.2f}s, waiting {self.config.monitoring_interval}s")
-                    await asyncio.wait_for(
-                        self._shutdown_event.wait(),
-                        timeout=self.config.monitoring_interval
-                    )
+                    logger.debug(f"Monitoring cycle completed in {cycle_time:.2f}s")
+                    order_ids = await self._wait_for_next_cycle()
 
-            except asyncio.TimeoutError:
-                # Normal timeout, continue to next cycle
-                continue
             except asyncio.CancelledError:
                 logger.info("Monitoring loop cancelled")
                 break
             except Exception as e:
                 logger.error(f"Error in monitoring cycle: {e}")
                 self._handle_monitoring_error(e)
+                order_ids = None
+                self._open_positions = None
 
                 # Continue running even after errors
                 if self.is_running and not self._shutdown_event.is_set():
                     logger.info(f"Continuing monitoring after error, waiting {self.config.monitoring_interval}s")
-                    await asyncio.wait_for(
-                        self._shutdown_event.wait(),
-                        timeout=self.config.monitoring_interval
-                    )
+                    try:
+                        await asyncio.wait_for(
+                            self._shutdown_event.wait(),
+                            timeout=self.config.monitoring_interval
+                        )
+                    except asyncio.TimeoutError:
+                        pass
 
         logger.info("Monitoring loop stopped")
 
-    async def _process_monitoring_cycle(self) -> None:
-        """Process one complete monitoring cycle."""
+    async def _wait_for_next_cycle(self) -> Optional[Set[str]]:
+        """Wait until order events arrive, the sweep interval passes, or shutdown.
+
+        Returns:
+            Order IDs to process in a targeted cycle, or None for a full sweep
+        """
+        interval = (
+            self.config.event_sweep_interval if self._order_listeners
+            else self.config.monitoring_interval
+        )
+
+        event_wait = asyncio.ensure_future(self._order_events.get())
+        shutdown_wait = asyncio.ensure_future(self._shutdown_event.wait())
+        try:
+            done, _ = await asyncio.wait(
+                {event_wait, shutdown_wait},
+                timeout=interval,
+                return_when=asyncio.FIRST_COMPLETED
+            )
+        finally:
+            event_wait.cancel()
+            shutdown_wait.cancel()
+
+        if event_wait in done and not event_wait.cancelled():
+            order_ids = {event_wait.result()}
+            while not self._order_events.empty():
+                order_ids.add(self._order_events.get_nowait())
+            return order_ids
+
+        return None
+
+    async def _process_monitoring_cycle(self, order_ids: Optional[Set[str]] = None) -> None:
+        """Process one monitoring cycle.
+
+        Args:
+            order_ids: Only process positions referencing these dYdX orders;
+                a full sweep of all open positions when None
+        """
         try:
-            # Step 1: Get all open positions
-            positions = await self._get_open_positions()
+            # Step 1: Get open positions
+            positions = await self._get_open_positions(order_ids)
             logger.debug(f"Found {len(positions)} open positions to monitor")
 
+            if order_ids is None and self.config.enable_event_triggers:
+                await self._sync_order_listeners(positions)
+
             if not positions:
                 return
 
             # Step 2: Group positions by user for efficient processing
             positions_by_user = self._group_positions_by_user(positions)
 
-            # Step 3: Process positions in batches
+            # Step 3: Resolve credentials for every user. Users are eager-loaded
+            # with the positions, no extra query needed.
+            users = [user_positions[0].user for user_positions in positions_by_user.values()]
+            credentials_by_user = await self._get_credentials_for_users(users)
+
+            # Step 4: Hand users to the consumer pool; put() blocks while the
+            # queue is full, so memory stays bounded however many users exist
             for user_address, user_positions in positions_by_user.items():
-                try:
-                    await self._process_user_positions(user_address, user_positions)
-                except Exception as e:
-                    logger.error(f"Error processing positions for user {user_address}: {e}")
-                    self.metrics.errors_total += 1
+                credentials = credentials_by_user.get(user_address)
+                if not credentials:
+                    logger.warning(f"Failed to decrypt credentials for user {user_address}")
+                    continue
+
+                await self._user_queue.put((user_address, user_positions, credentials))
+
+            await self._user_queue.join()
 
         except Exception as e:
             logger.error(f"Failed to process monitoring cycle: {e}")
             raise
 
-    async def _get_open_positions(self) -> List[Position]:
-        """Query database for all open positions across users."""
+        finally:
+            self._flush_closure_notifications()
+
+    async def _user_consumer(self) -> None:
+        """Process users' positions from the queue until cancelled."""
+        while True:
+            user_address, user_positions, credentials = await self._user_queue.get()
+            try:
+                await self._process_user_positions(user_address, user_positions, credentials)
+            except Exception as e:
+                logger.error(f"Error processing positions for user {user_address}: {e}")
+                self.metrics.record_error()
+            finally:
+                self._user_queue.task_done()
+
+    async def _get_open_positions(self, order_ids: Optional[Set[str]] = None) -> List[Position]:
+        """Query database for open positions across users.
+
+        Args:
+            order_ids: Restrict to positions referencing any of these orders
+        """
         try:
-            # Query for open positions with user data loaded
-            statement = (
-                select(Position)
-                .where(Position.status == "open")
-                .options(selectinload(Position.user))
-            )
+            if order_ids is not None:
+                statement = _OPEN_POSITIONS_STMT + (lambda s: s.where(or_(
+                    Position.dydx_order_id.in_(order_ids),
+                    Position.tp_order_id.in_(order_ids),
+                    Position.sl_order_id.in_(order_ids),
+                )))
+
+                result = await self.db.execute(statement)
+                positions = result.scalars().all()
+
+                logger.debug(f"Retrieved {len(positions)} open positions from database")
+                return positions
+
+            # Positions are inserted with their order IDs and afterwards only
+            # change status, so the open set is unchanged while its count and
+            # highest id are. Check that first and reuse the last sweep.
+            result = await self.db.execute(_OPEN_POSITIONS_FINGERPRINT_STMT)
+            fingerprint = tuple(result.one())
 
-            result = self.db.exec(statement)
-            positions = result.all()
+            if self._open_positions is not None and fingerprint == self._open_positions_fingerprint:
+                logger.debug(f"Open positions unchanged, reusing {len(self._open_positions)} positions")
+                return self._open_positions
+
+            result = await self.db.execute(_OPEN_POSITIONS_STMT)
+            positions = result.scalars().all()
+
+            self._open_positions = positions
+            self._open_positions_fingerprint = fingerprint
 
             logger.debug(f"Retrieved {len(positions)} open positions from database")
             return positions
@@ -267,127 +560,179 @@ class PositionMonitorWorker:
             logger.error(f"Failed to query open positions: {e}")
             raise
 
+    async def _sync_order_listeners(self, positions: List[Position]) -> None:
+        """Keep one dYdX order stream per account that has open positions."""
+        from ..bot.websocket_manager import WebSocketManager
+        from ..bot.websocket_handlers import WebSocketHandlers
+
+        wanted = {}
+        for position in positions:
+            user = position.user
+            network_id = user.dydx_network_id or 11155111
+            dydx_address = (
+                user.dydx_mainnet_address if network_id == 1 else user.dydx_testnet_address
+            )
+            if dydx_address and network_id in INDEXER_WS_URLS:
+                wanted[dydx_address] = INDEXER_WS_URLS[network_id]
+
+        for dydx_address in set(self._order_listeners) - set(wanted):
+            await self._stop_order_listener(dydx_address)
+
+        for dydx_address, ws_url in wanted.items():
+            if dydx_address in self._order_listeners:
+                continue
+
+            # Subaccount channel carries order updates for the subaccount
+            ws_manager = WebSocketManager(ws_url, f"{dydx_address}/0")
+            handlers = WebSocketHandlers(on_order_update=self._on_order_update)
+            await ws_manager.register_handler("v4_subaccounts", handlers.handle_order_update)
+            await ws_manager.subscribe("v4_subaccounts")
+
+            task = asyncio.create_task(ws_manager.listen())
+            self._order_listeners[dydx_address] = (ws_manager, task)
+            logger.info(f"Started order stream for {dydx_address}")
+
+    async def _stop_order_listener(self, dydx_address: str) -> None:
+        """Stop the order stream for a dYdX address."""
+        ws_manager, task = self._order_listeners.pop(dydx_address)
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        await ws_manager.disconnect()
+
+    async def _on_order_update(self, order_data: Dict[str, Any]) -> None:
+        """Queue orders that reached a state which may close their position."""
+        status = (order_data.get('status') or '').upper()
+        if status in ORDER_EVENT_STATUSES and order_data.get('order_id'):
+            self._order_events.put_nowait(order_data['order_id'])
+
     def _group_positions_by_user(self, positions: List[Position]) -> Dict[str, List[Position]]:
         """Group positions by user address for efficient processing."""
-        positions_by_user = {}
+        positions_by_user = defaultdict(list)
 
         for position in positions:
-            user_address = position.user_address
-            if user_address not in positions_by_user:
-                positions_by_user[user_address] = []
-            positions_by_user[user_address].append(position)
+            positions_by_user[position.user_address].append(position)
 
         logger.debug(f"Grouped positions into {len(positions_by_user)} user batches")
-        return positions_by_user
+        return dict(positions_by_user)
 
-    async def _process_user_positions(self, user_address: str, positions: List[Position]) -> None:
-        """Process all positions for a specific user."""
-        try:
-            # Get user credentials
-            user = await self._get_user_with_credentials(user_address)
-            if not user:
-                logger.warning(f"User {user_address} not found or missing credentials")
-                return
+    async def _get_credentials_for_users(self, users: List[User]) -> Dict[str, Optional[Dict[str, str]]]:
+        """Get decrypted credentials for users, decrypting only cache misses.
 
-            # Decrypt credentials
-            credentials = await self._decrypt_user_credentials(user)
-            if not credentials:
-                logger.warning(f"Failed to decrypt credentials for user {user_address}")
-                return
+        Misses are decrypted in one executor call so the CPU-bound crypto work
+        doesn't stall the event loop.
+        """
+        now = time.monotonic()
+        credentials_by_user = {}
+        cache_keys = {}
+        users_to_decrypt = []
+
+        for user in users:
+            cache_key = (
+                user.wallet_address,
+                *_encrypted_mnemonic(user),
+                user.encrypted_telegram_token,
+                user.encrypted_telegram_chat_id,
+            )
+            cached = self._credentials_cache.get(cache_key)
+            if cached and cached[0] > now:
+                credentials_by_user[user.wallet_address] = cached[1]
+            else:
+                cache_keys[user.wallet_address] = cache_key
+                users_to_decrypt.append(user)
 
-            # Process positions in batches
-            for i in range(0, len(positions), self.config.batch_size):
-                batch = positions[i:i + self.config.batch_size]
+        if users_to_decrypt:
+            # Drop expired entries before adding fresh ones
+            self._credentials_cache = {
+                key: entry for key, entry in self._credentials_cache.items() if entry[0] > now
+            }
 
-                try:
-                    await self._process_position_batch(batch, credentials)
-                except Exception as e:
-                    logger.error(f"Error processing position batch for user {user_address}: {e}")
-                    self.metrics.errors_total += 1
+            encryption_manager = get_encryption_manager()
+            decrypted = await asyncio.get_running_loop().run_in_executor(
+                None, _decrypt_all_credentials, encryption_manager, users_to_decrypt
+            )
 
-        except Exception as e:
-            logger.error(f"Failed to process user positions for {user_address}: {e}")
-            raise
+            expires_at = now + self.config.credentials_cache_ttl
+            for wallet_address, credentials in decrypted.items():
+                credentials_by_user[wallet_address] = credentials
+                if credentials:
+                    self._credentials_cache[cache_keys[wallet_address]] = (expires_at, credentials)
 
-    async def _get_user_with_credentials(self, user_address: str) -> Optional[User]:
-        """Get user with credentials from database."""
-        try:
-            statement = select(User).where(User.wallet_address == user_address)
-            user = self.db.exec(statement).first()
-            return user
-        except Exception as e:
-            logger.error(f"Failed to get user {user_address}: {e}")
-            return None
+        return credentials_by_user
 
-    async def _decrypt_user_credentials(self, user: User) -> Optional[Dict[str, str]]:
-        """Decrypt user credentials for dYdX and Telegram access."""
+    async def _process_user_positions(
+        self,
+        user_address: str,
+        positions: List[Position],
+        credentials: Dict[str, str]
+    ) -> None:
+        """Process all positions for a specific user."""
         try:
-            encryption_manager = get_encryption_manager()
+            # Process position batches concurrently; the per-user semaphore
+            # keeps dYdX calls for one account within max_workers
+            batches = [
+                positions[i:i + self.config.batch_size]
+                for i in range(0, len(positions), self.config.batch_size)
+            ]
+            semaphore = asyncio.Semaphore(self.config.max_workers)
+
+            async def process_batch_bounded(batch):
+                async with semaphore:
+                    await self._process_position_batch(batch, credentials)
 
-            # Decrypt dYdX private key
-            dydx_private_key = None
-            if user.encrypted_dydx_private_key:
-                dydx_private_key = encryption_manager.decrypt(user.encrypted_dydx_private_key)
-
-            # Decrypt Telegram credentials
-            telegram_token = None
-            telegram_chat_id = None
-            if user.encrypted_telegram_token and user.encrypted_telegram_chat_id:
-                telegram_token = encryption_manager.decrypt(user.encrypted_telegram_token)
-                telegram_chat_id = encryption_manager.decrypt(user.encrypted_telegram_chat_id)
-
-            if not dydx_private_key:
-                logger.warning(f"No dYdX credentials found for user {user.wallet_address}")
-                return None
-
-            return {
-                'dydx_private_key': dydx_private_key,
-                'telegram_token': telegram_token,
-                'telegram_chat_id': telegram_chat_id,
-                'wallet_address': user.wallet_address,
-            }
+            results = await asyncio.gather(
+                *(process_batch_bounded(batch) for batch in batches),
+                return_exceptions=True
+            )
+
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.error(f"Error processing position batch for user {user_address}: {result}")
+                    self.metrics.record_error()
 
         except Exception as e:
-            logger.error(f"Failed to decrypt credentials for user {user.wallet_address}: {e}")
-            return None
+            logger.error(f"Failed to process user positions for {user_address}: {e}")
+            raise
 
     async def _process_position_batch(self, positions: List[Position], credentials: Dict[str, str]) -> None:
         """Process a batch of positions for closure evaluation."""
         try:
-            # Step 1: Check dYdX order status for all positions
-            order_checks = await self.order_monitor.check_order_status_batch(
+            # Step 1: Fetch dYdX order status for the batch in one go and
+            # evaluate every position against it
+            evaluations = await self.state_manager.evaluate_positions_batch(
                 positions=positions,
+                order_monitor=self.order_monitor,
                 credentials=credentials
             )
 
-            # Step 2: Evaluate position states
+            # Step 2: Collect positions that need closing
             positions_to_close = []
-            for position in positions:
-                position_key = f"{position.id}"
-
-                if position_key in order_checks:
-                    order_data = order_checks[position_key]
-
-                    # Evaluate if position should be closed
-                    should_close, reason = await self.state_manager.evaluate_position_state(
-                        position=position,
-                        dydx_orders=order_data
-                    )
+            for evaluation in evaluations:
+                if isinstance(evaluation, Exception):
+                    logger.error(f"Failed to evaluate position state: {evaluation}")
+                    self.metrics.record_error()
+                    continue
+
+                position, should_close, reason, order_data = evaluation
+                if should_close:
+                    positions_to_close.append({
+                        'position': position,
+                        'reason': reason,
+                        'order_data': order_data
+                    })
+
+            # Step 3: Close positions that need closing, concurrently
+            results = await asyncio.gather(
+                *(self._close_position_automatically(close_data, credentials) for close_data in positions_to_close),
+                return_exceptions=True
+            )
 
-                    if should_close:
-                        positions_to_close.append({
-                            'position': position,
-                            'reason': reason,
-                            'order_data': order_data
-                        })
-
-            # Step 3: Close positions that need closing
-            for close_data in positions_to_close:
-                try:
-                    await self._close_position_automatically(close_data, credentials)
-                except Exception as e:
-                    logger.error(f"Failed to close position {close_data['position'].id}: {e}")
-                    self.metrics.errors_total += 1
+            for close_data, result in zip(positions_to_close, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Failed to close position {close_data['position'].id}: {result}")
+                    self.metrics.record_error()
 
         except Exception as e:
             logger.error(f"Failed to process position batch: {e}")
@@ -399,6 +744,10 @@ class PositionMonitorWorker:
         reason = close_data['reason']
         order_data = close_data['order_data']
 
+        # A closure changes the open set, and a failed one rolls back the
+        # session and expires its objects; either way reload on the next sweep
+        self._open_positions = None
+
         try:
             logger.info(f"Automatically closing position {position.id} for reason: {reason}")
 
@@ -412,38 +761,70 @@ class PositionMonitorWorker:
 
             if close_result['success']:
                 # Update metrics
-                self.metrics.positions_closed += 1
+                self.metrics.record_position_closed()
 
-                # Send notification if enabled
+                # Queue notification if enabled; sent once the cycle completes
                 if self.config.enable_notifications and credentials.get('telegram_token'):
-                    await self._send_closure_notification(position, credentials, close_result)
+                    _, closures = self._pending_closures.setdefault(
+                        position.user_address, (credentials, [])
+                    )
+                    closures.append((position, close_result))
 
                 logger.info(f"Position {position.id} closed successfully: {reason}")
             else:
                 logger.error(f"Failed to close position {position.id}: {close_result.get('error')}")
-                self.metrics.errors_total += 1
+                self.metrics.record_error()
 
         except Exception as e:
             logger.error(f"Error in automatic position closure for {position.id}: {e}")
-            self.metrics.errors_total += 1
+            self.metrics.record_error()
             raise
 
-    async def _send_closure_notification(self, position: Position, credentials: Dict[str, str], close_result: Dict[str, Any]) -> None:
-        """Send position closure notification to user."""
-        try:
-            await self.notification_manager.send_position_closure_notification(
-                credentials=credentials,
-                position=position,
-                closing_data=close_result
+    def _flush_closure_notifications(self) -> None:
+        """Send this cycle's closure notifications, one message per user.
+
+        Sending runs in background tasks, off the monitoring critical path.
+        """
+        pending, self._pending_closures = self._pending_closures, {}
+
+        for user_address, (credentials, closures) in pending.items():
+            task = asyncio.create_task(
+                self._send_closure_notifications(user_address, credentials, closures)
             )
+            self._pending_notifications.add(task)
+            task.add_done_callback(self._pending_notifications.discard)
+
+    async def _send_closure_notifications(
+        self,
+        user_address: str,
+        credentials: Dict[str, str],
+        closures: List[Tuple[Position, Dict[str, Any]]]
+    ) -> None:
+        """Send closure notifications to a user; several closures share one message."""
+        try:
+            if len(closures) == 1:
+                position, close_result = closures[0]
+                await self.notification_manager.send_position_closure_notification(
+                    credentials=credentials,
+                    position=position,
+                    closing_data=close_result
+                )
+            else:
+                await self.notification_manager.send_batch_closure_notification(
+                    credentials=credentials,
+                    closed_positions=[
+                        {**close_result, 'symbol': position.symbol}
+                        for position, close_result in closures
+                    ]
+                )
         except Exception as e:
-            logger.error(f"Failed to send closure notification for position {position.id}: {e}")
+            logger.error(f"Failed to send closure notifications for user {user_address}: {e}")
 
     def _handle_monitoring_error(self, error: Exception) -> None:
         """Handle errors in the monitoring process."""
         self._last_error = str(error)
         self._consecutive_errors += 1
-        self.metrics.errors_total += 1
+        self.metrics.record_error()
 
         logger.error(f"Monitoring error #{self._consecutive_errors}: {error}")
 
@@ -471,9 +852,7 @@ class PositionMonitorWorker:
         """Perform comprehensive health checks."""
         try:
             # Check if monitoring is responsive
-            time_since_last_cycle = 0.0
-            if self.metrics.last_cycle_timestamp:
-                time_since_last_cycle = (datetime.utcnow() - self.metrics.last_cycle_timestamp).total_seconds()
+            time_since_last_cycle = self.metrics.seconds_since_last_cycle() or 0.0
 
             # Log health status
             health_data = {
@@ -484,10 +863,17 @@ class PositionMonitorWorker:
                 'errors_total': self.metrics.errors_total,
                 'last_cycle_seconds_ago': time_since_last_cycle,
                 'average_cycle_time': self.metrics.average_cycle_time,
-                'uptime_seconds': (datetime.utcnow() - self.metrics.start_time).total_seconds(),
+                'uptime_seconds': self.metrics.uptime_seconds(),
             }
 
-            logger.info(f"Worker health check: {json.dumps(health_data, indent=2)}")
+            # Structured record; the JSON log formatter serializes the fields
+            logger.info(
+                "Worker health check: %d cycles, %d positions closed, %d errors",
+                health_data['cycles_completed'],
+                health_data['positions_closed'],
+                health_data['errors_total'],
+                extra=health_data
+            )
 
             # Check for concerning patterns
             if time_since_last_cycle > self.config.monitoring_interval * 3:
@@ -501,6 +887,13 @@ class PositionMonitorWorker:
 
     def get_status(self) -> Dict[str, Any]:
         """Get current worker status and metrics."""
+        last_cycle_timestamp = None
+        seconds_since_last_cycle = self.metrics.seconds_since_last_cycle()
+        if seconds_since_last_cycle is not None:
+            last_cycle_timestamp = (
+                datetime.utcnow() - timedelta(seconds=seconds_since_last_cycle)
+            ).isoformat()
+
         return {
             'is_running': self.is_running,
             'metrics': {
@@ -509,9 +902,9 @@ class PositionMonitorWorker:
                 'positions_closed': self.metrics.positions_closed,
                 'errors_total': self.metrics.errors_total,
                 'last_cycle_time': self.metrics.last_cycle_time,
-                'last_cycle_timestamp': self.metrics.last_cycle_timestamp.isoformat() if self.metrics.last_cycle_timestamp else None,
+                'last_cycle_timestamp': last_cycle_timestamp,
                 'average_cycle_time': self.metrics.average_cycle_time,
-                'uptime_seconds': (datetime.utcnow() - self.metrics.start_time).total_seconds(),
+                'uptime_seconds': self.metrics.uptime_seconds(),
             },
             'config': {
                 'monitoring_interval': self.config.monitoring_interval,
@@ -533,9 +926,10 @@ async def get_position_monitor_worker() -> PositionMonitorWorker:
     global _worker_instance
 
     if _worker_instance is None:
-        # Get database session
+        # Long-lived async session owned by the worker, drawn from the
+        # database manager's connection pool
         db_manager = get_database_manager()
-        db_session = next(db_manager.get_session())
+        db_session = db_manager.async_session_factory()
 
         # Create worker instance
         _worker_instance = PositionMonitorWorker(db_session)
@@ -564,6 +958,7 @@ async def graceful_shutdown(app: FastAPI) -> None:
 
     if _worker_instance:
         await _worker_instance.stop_monitoring()
+        await _worker_instance.db.close()
         logger.info("Worker shutdown completed")
 
 
@@ -6,14 +6,167 @@ when positions should be closed based on TP/SL orders and market conditions.
 """
 
 import logging
-from typing import Dict, List, Any, Optional, Tuple
+import operator
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from typing import Dict, List, Any, Optional, Tuple, Union
 from decimal import Decimal
-from datetime import datetime
+from datetime import timezone
+
+import numpy as np
 
 from ..db.models import Position
 
 logger = logging.getLogger(__name__)
 
+# Position age limits, in seconds
+MAX_POSITION_AGE_SECONDS = 24 * 3600.0  # market-condition closure
+STALE_POSITION_AGE_SECONDS = 48 * 3600.0  # summary warning
+
+_INV_3600 = 1 / 3600.0
+
+# Price move from entry, as a fraction of entry price
+LARGE_PRICE_CHANGE_PCT = 0.5  # closure sanity warning
+EMERGENCY_PRICE_CHANGE_PCT = 0.20  # emergency close
+
+# Position summaries keyed by position id, status, order statuses and age text
+SUMMARY_CACHE_SIZE = 4096
+_summary_cache: "OrderedDict[Tuple, Dict[str, Any]]" = OrderedDict()
+
+# Outcomes for order statuses that need no further inspection, keyed by the
+# upper-cased status; PARTIALLY_FILLED and unknown statuses fall through
+_TP_ACTIONS = {
+    'NOT_FOUND': (False, "TP order not found"),
+    'FILLED': (True, "Take profit order filled"),
+    'CANCELLED': (True, "TP order cancelled"),
+    'EXPIRED': (True, "TP order expired"),
+}
+
+_SL_ACTIONS = {
+    'NOT_FOUND': (False, "SL order not found"),
+    'FILLED': (True, "Stop loss order filled"),
+    'CANCELLED': (True, "SL order cancelled"),
+    'EXPIRED': (True, "SL order expired"),
+}
+
+# Shared default for absent order data; never mutated
+_EMPTY: Dict[str, Any] = {}
+
+# Required closure data fields, fetched in one call
+_CLOSURE_FIELDS = operator.itemgetter('closing_price', 'closing_size', 'timestamp')
+
+# Statuses for closing-reason and summary checks
+_FILL_STATUSES = frozenset(('FILLED', 'PARTIALLY_FILLED'))
+_ENTRY_FAILED_STATUSES = frozenset(('CANCELLED', 'EXPIRED', 'REJECTED'))
+
+# Action table and description for each closing order kind
+_CLOSE_ORDER_KINDS = {
+    'TP': (_TP_ACTIONS, "Take profit"),
+    'SL': (_SL_ACTIONS, "Stop loss"),
+}
+
+_ENTRY_ACTIONS = {
+    'NOT_FOUND': (False, "Entry order not found"),
+    # Position is fully opened, continue monitoring TP/SL
+    'FILLED': (False, "Entry order filled"),
+    'CANCELLED': (True, "Entry order cancelled"),
+    'EXPIRED': (True, "Entry order expired"),
+    'REJECTED': (True, "Entry order rejected"),
+    'ERROR': (True, "Entry order error"),
+}
+
+
+@dataclass(slots=True)
+class PositionEvalContext:
+    """Per-position numbers shared by every evaluation check.
+
+    Entry price, size and opening time are fixed once a position is opened,
+    so they are converted once and the price bands derived from them.
+    """
+    id: Optional[int]
+    entry: float
+    size: float
+    opened_ts: Optional[float]  # POSIX seconds; None without opened_at
+    warning_lo: float  # closure sanity-warning band
+    warning_hi: float
+    emergency_lo: float  # emergency-close band
+    emergency_hi: float
+
+    @classmethod
+    def from_position(cls, position: Position) -> "PositionEvalContext":
+        """Build the context for a position."""
+        entry = float(position.entry_price)
+        # opened_at is naive UTC; timestamp() alone would read it as local time
+        opened_ts = (
+            position.opened_at.replace(tzinfo=timezone.utc).timestamp()
+            if position.opened_at else None
+        )
+        return cls(
+            id=position.id,
+            entry=entry,
+            size=float(position.size),
+            opened_ts=opened_ts,
+            warning_lo=entry * (1 - LARGE_PRICE_CHANGE_PCT),
+            warning_hi=entry * (1 + LARGE_PRICE_CHANGE_PCT),
+            emergency_lo=entry * (1 - EMERGENCY_PRICE_CHANGE_PCT),
+            emergency_hi=entry * (1 + EMERGENCY_PRICE_CHANGE_PCT),
+        )
+
+
+def _eval_context(position: Position) -> PositionEvalContext:
+    """Evaluation context for a position, built on first use.
+
+    Kept in the instance __dict__, outside the model's fields, so it is
+    neither persisted nor serialized.
+    """
+    ctx = position.__dict__.get('_eval_ctx')
+    if ctx is None:
+        ctx = PositionEvalContext.from_position(position)
+        position.__dict__['_eval_ctx'] = ctx
+    return ctx
+
+
+@lru_cache(maxsize=128)
+def _determine_closing_reason(
+    tp_order_status: str,
+    sl_order_status: str,
+    entry_order_status: str
+) -> str:
+    """Determine why position was closed (TP, SL, or manual).
+
+    Memoized: the result depends only on the three statuses, and a handful
+    of status combinations cover almost every call.
+
+    Args:
+        tp_order_status: Take profit order status
+        sl_order_status: Stop loss order status
+        entry_order_status: Entry order status
+
+    Returns:
+        Closing reason string
+    """
+    try:
+        # Check TP order first
+        if tp_order_status.upper() in _FILL_STATUSES:
+            return "TAKE_PROFIT"
+
+        # Check SL order
+        if sl_order_status.upper() in _FILL_STATUSES:
+            return "STOP_LOSS"
+
+        # Check entry order issues
+        if entry_order_status.upper() in _ENTRY_FAILED_STATUSES:
+            return "ENTRY_FAILED"
+
+        # Default to manual or market condition
+        return "MARKET_CONDITION"
+
+    except Exception as e:
+        logger.error("Error determining closing reason: %s", e)
+        return "UNKNOWN"
+
 
 class PositionStateManager:
     """Manages position state evaluation and closure decisions."""
@@ -21,133 +174,171 @@ class PositionStateManager:
     @staticmethod
     async def evaluate_position_state(
         position: Position,
-        dydx_orders: Dict[str, Any]
+        dydx_orders: Dict[str, Any],
+        now_ts: Optional[float] = None
     ) -> Tuple[bool, str]:
         """Determine if position should be closed based on order status.
 
         Args:
             position: Position to evaluate
             dydx_orders: Order status data from dYdX
+            now_ts: Current POSIX time, read once per tick by batch callers
 
         Returns:
             Tuple of (should_close, reason)
         """
         try:
-            orders = dydx_orders.get('orders', {})
-
-            # Check take profit order
-            tp_should_close, tp_reason = await PositionStateManager._evaluate_tp_order(
-                position, orders.get('tp', {})
-            )
+            return PositionStateManager._evaluate_position_state_impl(position, dydx_orders, now_ts)
 
-            if tp_should_close:
-                return True, f"Take Profit: {tp_reason}"
-
-            # Check stop loss order
-            sl_should_close, sl_reason = await PositionStateManager._evaluate_sl_order(
-                position, orders.get('sl', {})
-            )
+        except Exception as e:
+            logger.error("Error evaluating position state for %s: %s", position.id, e)
+            return False, f"Evaluation error: {str(e)}"
 
-            if sl_should_close:
-                return True, f"Stop Loss: {sl_reason}"
+    @staticmethod
+    def _evaluate_position_state_impl(
+        position: Position,
+        dydx_orders: Dict[str, Any],
+        now_ts: Optional[float] = None
+    ) -> Tuple[bool, str]:
+        """Evaluate position state; errors propagate to the caller."""
+        orders = dydx_orders.get('orders') or _EMPTY
 
-            # Check entry order status
-            entry_should_close, entry_reason = await PositionStateManager._evaluate_entry_order(
-                position, orders.get('entry', {})
-            )
+        # Without order data only market conditions can close the position;
+        # otherwise check each order present in precedence order
+        if orders:
+            for key, evaluator, label in _ORDER_CHECKS:
+                order = orders.get(key)
+                if not order:
+                    continue
 
-            if entry_should_close:
-                return True, f"Entry Order: {entry_reason}"
+                should_close, reason = evaluator(
+                    position, order, (order.get('status') or '').upper()
+                )
 
-            # Check for market-based conditions
-            market_should_close, market_reason = await PositionStateManager._evaluate_market_conditions(
-                position, orders
-            )
+                if should_close:
+                    return True, f"{label}: {reason}"
 
-            if market_should_close:
-                return True, f"Market: {market_reason}"
+        # Check for market-based conditions
+        market_should_close, market_reason = PositionStateManager._evaluate_market_conditions(
+            position, orders, now_ts
+        )
 
-            return False, "Position is active"
+        if market_should_close:
+            return True, f"Market: {market_reason}"
 
-        except Exception as e:
-            logger.error(f"Error evaluating position state for {position.id}: {e}")
-            return False, f"Evaluation error: {str(e)}"
+        return False, "Position is active"
 
     @staticmethod
-    async def _evaluate_tp_order(position: Position, tp_order: Dict[str, Any]) -> Tuple[bool, str]:
-        """Evaluate take profit order status."""
-        try:
-            if not tp_order or tp_order.get('status') == 'NOT_FOUND':
-                return False, "TP order not found"
-
-            status = tp_order.get('status', '').upper()
-
-            # Check if TP order is filled
-            if status == 'FILLED':
-                return True, "Take profit order filled"
-
-            # Check if TP order is partially filled
-            if status == 'PARTIALLY_FILLED':
-                remaining_size = tp_order.get('remaining_size')
-                if remaining_size and float(remaining_size) > 0:
-                    return True, "Take profit order partially filled"
-                else:
-                    return False, "TP order partially filled but complete"
+    async def evaluate_positions_batch(
+        positions: List[Position],
+        order_monitor: Any,
+        credentials: Dict[str, str],
+        now_ts: Optional[float] = None
+    ) -> List[Union[Tuple[Position, bool, str, Dict[str, Any]], Exception]]:
+        """Fetch order status for several positions at once and evaluate them.
+
+        Order status for every position comes from a single batched fetch
+        instead of one round-trip per position. Like gather with
+        return_exceptions, a failed evaluation is returned as its exception
+        so the caller can account for it.
 
-            # Check for error states
-            if status in ['CANCELLED', 'EXPIRED']:
-                return True, f"TP order {status.lower()}"
-
-            return False, f"TP order status: {status}"
+        Args:
+            positions: Positions to evaluate
+            order_monitor: DydxOrderMonitor used for the batched order fetch
+            credentials: User credentials for dYdX access
+            now_ts: Current POSIX time; read once here when omitted
 
-        except Exception as e:
-            logger.error(f"Error evaluating TP order for position {position.id}: {e}")
-            return False, f"TP evaluation error: {str(e)}"
+        Returns:
+            (position, should_close, reason, order_data) or the raised
+            exception, for each position with order data
+        """
+        order_checks = await order_monitor.check_order_status_batch(
+            positions=positions,
+            credentials=credentials
+        )
+        if not order_checks:
+            return []
+
+        if now_ts is None:
+            now_ts = time.time()
+
+        results = []
+        for position in positions:
+            order_data = order_checks.get(str(position.id))
+            if order_data is None:
+                continue
+
+            try:
+                should_close, reason = PositionStateManager._evaluate_position_state_impl(
+                    position, order_data, now_ts
+                )
+            except Exception as e:
+                results.append(e)
+                continue
+
+            if should_close:
+                # Categorize the closure (TAKE_PROFIT, STOP_LOSS, ...) for the
+                # closing data; few status combinations occur, so this hits
+                # the memoized lookup
+                orders = order_data.get('orders') or _EMPTY
+                order_data['closing_type'] = _determine_closing_reason(
+                    *((orders.get(key) or _EMPTY).get('status') or '' for key in ('tp', 'sl', 'entry'))
+                )
+
+            results.append((position, should_close, reason, order_data))
+
+        return results
 
     @staticmethod
-    async def _evaluate_sl_order(position: Position, sl_order: Dict[str, Any]) -> Tuple[bool, str]:
-        """Evaluate stop loss order status."""
-        try:
-            if not sl_order or sl_order.get('status') == 'NOT_FOUND':
-                return False, "SL order not found"
+    def _evaluate_close_order(
+        position: Position,
+        order: Dict[str, Any],
+        status: str,
+        label: str
+    ) -> Tuple[bool, str]:
+        """Evaluate take profit or stop loss order status.
 
-            status = sl_order.get('status', '').upper()
+        Args:
+            position: Position the order belongs to
+            order: Order data from dYdX
+            status: Upper-cased order status
+            label: 'TP' or 'SL'
+        """
+        try:
+            if not order:
+                return False, f"{label} order not found"
 
-            # Check if SL order is filled
-            if status == 'FILLED':
-                return True, "Stop loss order filled"
+            # Filled, terminal or missing orders
+            actions, description = _CLOSE_ORDER_KINDS[label]
+            action = actions.get(status)
+            if action is not None:
+                return action
 
-            # Check if SL order is partially filled
+            # Check if the order is partially filled
             if status == 'PARTIALLY_FILLED':
-                remaining_size = sl_order.get('remaining_size')
+                remaining_size = order.get('remaining_size')
                 if remaining_size and float(remaining_size) > 0:
-                    return True, "Stop loss order partially filled"
+                    return True, f"{description} order partially filled"
                 else:
-                    return False, "SL order partially filled but complete"
+                    return False, f"{label} order partially filled but complete"
 
-            # Check for error states
-            if status in ['CANCELLED', 'EXPIRED']:
-                return True, f"SL order {status.lower()}"
-
-            return False, f"SL order status: {status}"
+            return False, f"{label} order status: {status}"
 
         except Exception as e:
-            logger.error(f"Error evaluating SL order for position {position.id}: {e}")
-            return False, f"SL evaluation error: {str(e)}"
+            logger.error("Error evaluating %s order for position %s: %s", label, position.id, e)
+            return False, f"{label} evaluation error: {str(e)}"
 
     @staticmethod
-    async def _evaluate_entry_order(position: Position, entry_order: Dict[str, Any]) -> Tuple[bool, str]:
+    def _evaluate_entry_order(position: Position, entry_order: Dict[str, Any], status: str) -> Tuple[bool, str]:
         """Evaluate entry order status."""
         try:
-            if not entry_order or entry_order.get('status') == 'NOT_FOUND':
+            if not entry_order:
                 return False, "Entry order not found"
 
-            status = entry_order.get('status', '').upper()
-
-            # Check if entry order is filled (position should be fully opened)
-            if status == 'FILLED':
-                # Position is fully opened, continue monitoring TP/SL
-                return False, "Entry order filled"
+            # Filled, failed or missing orders
+            action = _ENTRY_ACTIONS.get(status)
+            if action is not None:
+                return action
 
             # Check if entry order is partially filled
             if status == 'PARTIALLY_FILLED':
@@ -161,22 +352,18 @@ class PositionStateManager:
 
                 return False, "Entry order partially filled"
 
-            # Check for error states
-            if status in ['CANCELLED', 'EXPIRED']:
-                return True, f"Entry order {status.lower()}"
-
-            # Check if entry order failed
-            if status in ['REJECTED', 'ERROR']:
-                return True, f"Entry order {status.lower()}"
-
             return False, f"Entry order status: {status}"
 
         except Exception as e:
-            logger.error(f"Error evaluating entry order for position {position.id}: {e}")
+            logger.error("Error evaluating entry order for position %s: %s", position.id, e)
             return False, f"Entry evaluation error: {str(e)}"
 
     @staticmethod
-    async def _evaluate_market_conditions(position: Position, orders: Dict[str, Any]) -> Tuple[bool, str]:
+    def _evaluate_market_conditions(
+        position: Position,
+        orders: Dict[str, Any],
+        now_ts: Optional[float] = None
+    ) -> Tuple[bool, str]:
         """Evaluate market-based conditions for position closure."""
         try:
             # This is a simplified implementation
@@ -189,21 +376,22 @@ class PositionStateManager:
 
             # For now, we'll implement a simple time-based check
             # Close positions that have been open too long (e.g., 24 hours)
-            if position.opened_at:
-                hours_open = (datetime.utcnow() - position.opened_at).total_seconds() / 3600
+            opened_ts = _eval_context(position).opened_ts
+            if opened_ts is not None:
+                age_seconds = (time.time() if now_ts is None else now_ts) - opened_ts
 
                 # Close positions open for more than 24 hours as a safety measure
-                if hours_open > 24:
-                    return True, f"Position open for {hours_open:.1f} hours"
+                if age_seconds > MAX_POSITION_AGE_SECONDS:
+                    return True, f"Position open for {age_seconds * _INV_3600:.1f} hours"
 
             return False, "Market conditions normal"
 
         except Exception as e:
-            logger.error(f"Error evaluating market conditions for position {position.id}: {e}")
+            logger.error("Error evaluating market conditions for position %s: %s", position.id, e)
             return False, f"Market evaluation error: {str(e)}"
 
     @staticmethod
-    async def calculate_position_pnl(
+    def calculate_position_pnl(
         position: Position,
         closing_price: float,
         closing_size: float
@@ -219,8 +407,8 @@ class PositionStateManager:
             Calculated P&L
         """
         try:
-            entry_price = float(position.entry_price)
-            position_size = float(position.size)
+            ctx = _eval_context(position)
+            entry_price, position_size = ctx.entry, ctx.size
 
             # Calculate P&L based on position side
             # Note: This is a simplified calculation
@@ -231,47 +419,75 @@ class PositionStateManager:
             return pnl
 
         except Exception as e:
-            logger.error(f"Error calculating P&L for position {position.id}: {e}")
+            logger.error("Error calculating P&L for position %s: %s", position.id, e)
             return 0.0
 
     @staticmethod
-    async def determine_closing_reason(
-        tp_order_status: str,
-        sl_order_status: str,
-        entry_order_status: str
-    ) -> str:
-        """Determine why position was closed (TP, SL, or manual).
+    def position_arrays(positions: List[Position]) -> Tuple[np.ndarray, np.ndarray]:
+        """Entry prices and sizes of positions as float64 arrays.
 
         Args:
-            tp_order_status: Take profit order status
-            sl_order_status: Stop loss order status
-            entry_order_status: Entry order status
+            positions: Positions to convert
 
         Returns:
-            Closing reason string
+            Tuple of (entry_prices, sizes), aligned with positions
         """
-        try:
-            # Check TP order first
-            if tp_order_status.upper() in ['FILLED', 'PARTIALLY_FILLED']:
-                return "TAKE_PROFIT"
+        entry_prices = np.empty(len(positions), dtype=np.float64)
+        sizes = np.empty(len(positions), dtype=np.float64)
+        for i, position in enumerate(positions):
+            ctx = _eval_context(position)
+            entry_prices[i] = ctx.entry
+            sizes[i] = ctx.size
+        return entry_prices, sizes
 
-            # Check SL order
-            if sl_order_status.upper() in ['FILLED', 'PARTIALLY_FILLED']:
-                return "STOP_LOSS"
+    @staticmethod
+    def calculate_position_pnl_batch(
+        entry_prices: np.ndarray,
+        closing_prices: np.ndarray,
+        sizes: np.ndarray
+    ) -> np.ndarray:
+        """Vectorized calculate_position_pnl over aligned arrays.
 
-            # Check entry order issues
-            if entry_order_status.upper() in ['CANCELLED', 'EXPIRED', 'REJECTED']:
-                return "ENTRY_FAILED"
+        Args:
+            entry_prices: Entry price per position
+            closing_prices: Price at closure per position
+            sizes: Position size per position
 
-            # Default to manual or market condition
-            return "MARKET_CONDITION"
+        Returns:
+            P&L per position
+        """
+        return (closing_prices - entry_prices) * sizes
 
-        except Exception as e:
-            logger.error(f"Error determining closing reason: {e}")
-            return "UNKNOWN"
+    @staticmethod
+    def emergency_close_mask(entry_prices: np.ndarray, current_prices: np.ndarray) -> np.ndarray:
+        """Vectorized should_trigger_emergency_close over aligned arrays.
+
+        Args:
+            entry_prices: Entry price per position
+            current_prices: Current market price per position; 0 when unknown
+
+        Returns:
+            Boolean mask of positions to emergency close
+        """
+        return (current_prices != 0) & (
+            np.abs(current_prices - entry_prices) > entry_prices * EMERGENCY_PRICE_CHANGE_PCT
+        )
 
     @staticmethod
-    async def validate_position_closure(
+    async def determine_closing_reason(
+        tp_order_status: str,
+        sl_order_status: str,
+        entry_order_status: str
+    ) -> str:
+        """Determine why position was closed (TP, SL, or manual).
+
+        Kept awaitable for existing callers; delegates to the memoized
+        module-level _determine_closing_reason.
+        """
+        return _determine_closing_reason(tp_order_status, sl_order_status, entry_order_status)
+
+    @staticmethod
+    def validate_position_closure(
         position: Position,
         closing_data: Dict[str, Any]
     ) -> Tuple[bool, str]:
@@ -293,58 +509,83 @@ class PositionStateManager:
             if not closing_data:
                 return False, "Closing data is empty"
 
-            # Validate required fields
-            required_fields = ['closing_price', 'closing_size', 'timestamp']
-            for field in required_fields:
-                if field not in closing_data:
-                    return False, f"Missing required field: {field}"
+            # Validate required fields; the getter reports the first missing one
+            try:
+                closing_price, closing_size, _ = _CLOSURE_FIELDS(closing_data)
+            except KeyError as e:
+                return False, f"Missing required field: {e.args[0]}"
 
             # Validate price is reasonable
-            closing_price = closing_data.get('closing_price', 0)
             if closing_price <= 0:
                 return False, f"Invalid closing price: {closing_price}"
 
             # Validate size is reasonable
-            closing_size = closing_data.get('closing_size', 0)
             if closing_size <= 0:
                 return False, f"Invalid closing size: {closing_size}"
 
             # Validate price is not too far from entry (basic sanity check)
-            entry_price = float(position.entry_price)
-            price_change_pct = abs(closing_price - entry_price) / entry_price
+            # Compare against the precomputed band; the percentage is only
+            # worked out for the warning
+            ctx = _eval_context(position)
 
-            if price_change_pct > 0.5:  # 50% price change seems extreme
-                logger.warning(f"Large price change detected for position {position.id}: {price_change_pct:.2%}")
+            if closing_price < ctx.warning_lo or closing_price > ctx.warning_hi:
+                price_change_pct = abs(closing_price - ctx.entry) / ctx.entry
+                logger.warning("Large price change detected for position %s: %.2f%%", position.id, price_change_pct * 100)
 
             return True, "Valid"
 
         except Exception as e:
-            logger.error(f"Error validating position closure for {position.id}: {e}")
+            logger.error("Error validating position closure for %s: %s", position.id, e)
             return False, f"Validation error: {str(e)}"
 
     @staticmethod
-    async def get_position_summary(position: Position, orders: Dict[str, Any]) -> Dict[str, Any]:
+    async def get_position_summary(
+        position: Position,
+        orders: Dict[str, Any],
+        now_ts: Optional[float] = None
+    ) -> Dict[str, Any]:
         """Get comprehensive position summary for monitoring.
 
         Args:
             position: Position to summarize
             orders: Order data from dYdX
+            now_ts: Current POSIX time, read once per tick by batch callers
 
         Returns:
             Position summary data
         """
         try:
+            entry_status = (orders.get('entry') or _EMPTY).get('status', 'UNKNOWN')
+            tp_status = (orders.get('tp') or _EMPTY).get('status', 'UNKNOWN')
+            sl_status = (orders.get('sl') or _EMPTY).get('status', 'UNKNOWN')
+
+            # Age only shows in the summary once the position is stale, as text
+            ctx = _eval_context(position)
+            age_text = None
+            if ctx.opened_ts is not None:
+                age_seconds = (time.time() if now_ts is None else now_ts) - ctx.opened_ts
+                if age_seconds > STALE_POSITION_AGE_SECONDS:
+                    age_text = f"{age_seconds * _INV_3600:.1f}"
+
+            # Everything else in the summary is fixed for a position id, so
+            # the order statuses and age text determine it
+            cache_key = (position.id, position.status, entry_status, tp_status, sl_status, age_text)
+            cached = _summary_cache.get(cache_key)
+            if cached is not None:
+                _summary_cache.move_to_end(cache_key)
+                return {**cached, 'orders': dict(cached['orders']), 'issues': list(cached['issues'])}
+
             summary = {
                 'position_id': position.id,
                 'symbol': position.symbol,
                 'status': position.status,
-                'entry_price': float(position.entry_price),
-                'size': float(position.size),
-                'opened_at': position.opened_at.isoformat() if position.opened_at else None,
+                'entry_price': ctx.entry,
+                'size': ctx.size,
+                'opened_at': position.opened_at_iso,
                 'orders': {
-                    'entry': orders.get('entry', {}).get('status', 'UNKNOWN'),
-                    'tp': orders.get('tp', {}).get('status', 'UNKNOWN'),
-                    'sl': orders.get('sl', {}).get('status', 'UNKNOWN'),
+                    'entry': entry_status,
+                    'tp': tp_status,
+                    'sl': sl_status,
                 },
                 'health': 'good',
                 'issues': []
@@ -354,32 +595,34 @@ class PositionStateManager:
             issues = []
 
             # Check if position has been open too long
-            if position.opened_at:
-                hours_open = (datetime.utcnow() - position.opened_at).total_seconds() / 3600
-                if hours_open > 48:
-                    issues.append(f"Position open for {hours_open:.1f} hours")
-                    summary['health'] = 'warning'
+            if age_text is not None:
+                issues.append(f"Position open for {age_text} hours")
+                summary['health'] = 'warning'
 
             # Check if orders are missing
-            if summary['orders']['tp'] == 'NOT_FOUND':
+            if tp_status == 'NOT_FOUND':
                 issues.append("Take profit order not found")
                 summary['health'] = 'warning'
 
-            if summary['orders']['sl'] == 'NOT_FOUND':
+            if sl_status == 'NOT_FOUND':
                 issues.append("Stop loss order not found")
                 summary['health'] = 'warning'
 
             # Check if entry order is not filled
-            if summary['orders']['entry'] not in ['FILLED', 'PARTIALLY_FILLED']:
-                issues.append(f"Entry order not filled (status: {summary['orders']['entry']})")
+            if entry_status not in _FILL_STATUSES:
+                issues.append(f"Entry order not filled (status: {entry_status})")
                 summary['health'] = 'warning'
 
             summary['issues'] = issues
 
-            return summary
+            _summary_cache[cache_key] = summary
+            if len(_summary_cache) > SUMMARY_CACHE_SIZE:
+                _summary_cache.popitem(last=False)
+
+            return {**summary, 'orders': dict(summary['orders']), 'issues': list(issues)}
 
         except Exception as e:
-            logger.error(f"Error creating position summary for {position.id}: {e}")
+            logger.error("Error creating position summary for %s: %s", position.id, e)
             return {
                 'position_id': position.id,
                 'error': str(e),
@@ -387,7 +630,7 @@ class PositionStateManager:
             }
 
     @staticmethod
-    async def should_trigger_emergency_close(position: Position, market_data: Dict[str, Any]) -> Tuple[bool, str]:
+    def should_trigger_emergency_close(position: Position, market_data: Dict[str, Any]) -> Tuple[bool, str]:
         """Check if position should be emergency closed due to extreme market conditions.
 
         Args:
@@ -403,11 +646,11 @@ class PositionStateManager:
             if not current_price:
                 return False, "No market price available"
 
-            entry_price = float(position.entry_price)
-            price_change_pct = abs(current_price - entry_price) / entry_price
+            ctx = _eval_context(position)
 
             # Emergency close if price moved more than 20%
-            if price_change_pct > 0.20:
+            if current_price < ctx.emergency_lo or current_price > ctx.emergency_hi:
+                price_change_pct = abs(current_price - ctx.entry) / ctx.entry
                 return True, f"Emergency close: {price_change_pct:.1%} price movement"
 
             # Check for extreme volatility (if available)
@@ -416,5 +659,13 @@ class PositionStateManager:
             return False, "No emergency conditions"
 
         except Exception as e:
-            logger.error(f"Error checking emergency close for position {position.id}: {e}")
-            return False, f"Emergency check error: {str(e)}"
\ No newline at end of file
+            logger.error("Error checking emergency close for position %s: %s", position.id, e)
+            return False, f"Emergency check error: {str(e)}"
+
+
+# Order checks in precedence order: the first that closes names the reason
+_ORDER_CHECKS = (
+    ('tp', partial(PositionStateManager._evaluate_close_order, label='TP'), "Take Profit"),
+    ('sl', partial(PositionStateManager._evaluate_close_order, label='SL'), "Stop Loss"),
+    ('entry', PositionStateManager._evaluate_entry_order, "Entry Order"),
+)
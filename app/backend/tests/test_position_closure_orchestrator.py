@@ -0,0 +1,280 @@
+"""Unit Tests for Position Closure Orchestrator Module.
+
+Tests for order snapshots taken on cancellation and their rollback.
+"""
+
+from decimal import Decimal
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlmodel import SQLModel
+from src.bot.dydx_client import DydxClient
+from src.db.models import Position, User
+from src.workers.position_closure_orchestrator import PositionClosureOrchestrator
+
+
+CREDENTIALS = {
+    'dydx_mnemonic': 'test mnemonic',
+    'network_id': 1,
+    'wallet_address': '0x' + 'a' * 40,
+}
+
+
+def make_position() -> Position:
+    return Position(
+        id=7,
+        user_address=CREDENTIALS['wallet_address'],
+        symbol="BTC-USD",
+        side="BUY",
+        entry_price=Decimal("50000"),
+        size=Decimal("1"),
+        dydx_order_id="entry-1",
+        tp_order_id="tp-1",
+        sl_order_id="sl-1",
+    )
+
+
+def order(order_id, status="OPEN", order_type="LIMIT", price="51000", trigger_price=None):
+    return {
+        'order_id': order_id,
+        'status': status,
+        'symbol': "BTC-USD",
+        'side': "SELL",
+        'size': "1",
+        'remaining_size': "0.5",
+        'price': price,
+        'trigger_price': trigger_price,
+        'type': order_type,
+        'time_in_force': "GTT",
+        'post_only': False,
+    }
+
+
+@pytest.fixture
+async def db_session():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        session.add(User(wallet_address=CREDENTIALS['wallet_address'], webhook_uuid="hook-1"))
+        session.add(make_position())
+        await session.commit()
+        yield session
+    await engine.dispose()
+
+
+@pytest.fixture
+def orchestrator(db_session):
+    return PositionClosureOrchestrator(db_session)
+
+
+@pytest.fixture
+def client_calls(monkeypatch):
+    """Stub client creation and record the network it was created for."""
+    calls = []
+
+    async def create_client(network_id=None, mnemonic=None):
+        calls.append({'network_id': network_id, 'mnemonic': mnemonic})
+        return object()
+
+    monkeypatch.setattr(DydxClient, "create_client", staticmethod(create_client))
+    return calls
+
+
+class TestOrderSnapshot:
+    """Test snapshots of orders cancelled during closure."""
+
+    @pytest.mark.parametrize("status", ["FILLED", "CANCELED", "BEST_EFFORT_CANCELED", "ERROR"])
+    def test_inactive_orders_not_snapshotted(self, status):
+        """Test orders the indexer reports as done are not restored."""
+        assert PositionClosureOrchestrator._snapshot_order(order("o-1", status=status)) is None
+
+    def test_limit_order_snapshot(self):
+        """Test limit order snapshot keeps remaining size and position field."""
+        snapshot = PositionClosureOrchestrator._snapshot_order(order("o-1"), "dydx_order_id")
+
+        assert snapshot['position_field'] == "dydx_order_id"
+        assert snapshot['size'] == "0.5"
+        assert snapshot['order_type'] == "LIMIT"
+        assert not snapshot['conditional']
+
+    @pytest.mark.parametrize("order_type", ["STOP_MARKET", "TAKE_PROFIT_MARKET"])
+    def test_conditional_order_snapshot(self, order_type):
+        """Test untriggered TP/SL orders are flagged as conditional."""
+        details = order("o-1", status="UNTRIGGERED", order_type=order_type,
+                        price=None, trigger_price="49000")
+        snapshot = PositionClosureOrchestrator._snapshot_order(details, "sl_order_id")
+
+        assert snapshot['conditional']
+        assert snapshot['trigger_price'] == "49000"
+
+    async def test_cancel_snapshots_open_and_untriggered(self, orchestrator, client_calls, monkeypatch):
+        """Test cancellation snapshots every order still open on the network."""
+        open_orders = {
+            "entry-1": order("entry-1"),
+            "sl-1": order("sl-1", status="UNTRIGGERED", order_type="STOP_MARKET",
+                          trigger_price="49000"),
+        }
+
+        async def get_open_orders(client):
+            return {'success': True, 'orders': open_orders}
+
+        async def cancel_order_if_exists(client, order_id, order_details):
+            return True
+
+        monkeypatch.setattr(DydxClient, "get_open_orders", staticmethod(get_open_orders))
+        monkeypatch.setattr(orchestrator.order_monitor, "cancel_order_if_exists", cancel_order_if_exists)
+
+        result = await orchestrator._cancel_remaining_orders(make_position(), CREDENTIALS)
+
+        assert result['success']
+        assert result['orders_cancelled'] == ["entry-1", "sl-1"]
+        assert [s['position_field'] for s in result['order_snapshots']] == ["dydx_order_id", "sl_order_id"]
+        assert client_calls == [{'network_id': 1, 'mnemonic': 'test mnemonic'}]
+
+
+class TestRollbackOrderCancellations:
+    """Test re-placing cancelled orders after a failed closure."""
+
+    async def test_replaces_limit_orders_and_stores_ids(
+        self, orchestrator, db_session, client_calls, monkeypatch
+    ):
+        """Test limit orders are re-placed on the user's network and persisted."""
+        placed = []
+
+        async def place_limit_order(client, symbol, side, size, price, time_in_force, network_id):
+            placed.append({'price': price, 'network_id': network_id})
+            return {'success': True, 'order_id': "new-entry"}
+
+        monkeypatch.setattr(DydxClient, "place_limit_order", staticmethod(place_limit_order))
+
+        position = await db_session.get(Position, 7)
+        snapshots = [
+            PositionClosureOrchestrator._snapshot_order(order("entry-1"), "dydx_order_id"),
+            PositionClosureOrchestrator._snapshot_order(
+                order("sl-1", status="UNTRIGGERED", order_type="STOP_MARKET",
+                      price=None, trigger_price="49000"),
+                "sl_order_id",
+            ),
+        ]
+
+        restored = await orchestrator._rollback_order_cancellations(
+            position, CREDENTIALS, {'order_snapshots': snapshots}
+        )
+
+        assert restored == {'dydx_order_id': "new-entry"}
+        assert placed == [{'price': "51000", 'network_id': 1}]
+        assert client_calls == [{'network_id': 1, 'mnemonic': 'test mnemonic'}]
+        assert position.dydx_order_id == "new-entry"
+        assert position.sl_order_id == "sl-1"
+        assert position not in db_session.dirty
+
+        db_session.expire_all()
+        stored = await db_session.get(Position, 7)
+        assert stored.dydx_order_id == "new-entry"
+        assert stored.sl_order_id == "sl-1"
+
+    async def test_conditional_only_skips_client(self, orchestrator, client_calls):
+        """Test conditional orders alone never create a client or place orders."""
+        snapshot = PositionClosureOrchestrator._snapshot_order(
+            order("tp-1", status="UNTRIGGERED", order_type="TAKE_PROFIT",
+                  trigger_price="55000"),
+            "tp_order_id",
+        )
+
+        restored = await orchestrator._rollback_order_cancellations(
+            make_position(), CREDENTIALS, {'order_snapshots': [snapshot]}
+        )
+
+        assert restored == {}
+        assert client_calls == []
+
+
+class TestDatabaseUpdate:
+    """Test closure writes run in their own sessions."""
+
+    async def test_update_marks_position_closed(self, orchestrator, db_session):
+        """Test the status is committed and mirrored onto the loaded position."""
+        position = await db_session.get(Position, 7)
+
+        result = await orchestrator._update_position_in_database(
+            position, {'closing_price': 51000}, "take_profit"
+        )
+
+        assert result['success']
+        assert result['closing_metadata']['closing_reason'] == "take_profit"
+        assert position.status == "closed"
+        assert position not in db_session.dirty
+
+        db_session.expire_all()
+        assert (await db_session.get(Position, 7)).status == "closed"
+
+    async def test_failed_update_leaves_loaded_positions_usable(self, db_session):
+        """Test a failed write does not expire positions held by the caller's session."""
+
+        class FailingSession(AsyncSession):
+            async def execute(self, *args, **kwargs):
+                raise RuntimeError("database unavailable")
+
+        orchestrator = PositionClosureOrchestrator(
+            db_session, async_sessionmaker(db_session.bind, class_=FailingSession)
+        )
+        position = await db_session.get(Position, 7)
+
+        result = await orchestrator._bulk_update_positions_in_database([position])
+
+        assert not result['success']
+        assert 'symbol' in position.__dict__
+        assert position.status == "open"
+
+
+class TestBulkClose:
+    """Test the vectorized P&L path of bulk closures."""
+
+    def test_batch_helpers_match_scalar(self):
+        """Test batch P&L and emergency mask agree with the per-position checks."""
+        import numpy as np
+        from src.workers.position_state_manager import PositionStateManager
+
+        positions = [make_position() for _ in range(4)]
+        for position, entry in zip(positions, ("50000", "100", "2.5", "0.01")):
+            position.entry_price = Decimal(entry)
+        closing_prices = np.array([51000.0, 70.0, 2.5, 0.0125])
+
+        entry_prices, sizes = PositionStateManager.position_arrays(positions)
+        pnls = PositionStateManager.calculate_position_pnl_batch(entry_prices, closing_prices, sizes)
+        mask = PositionStateManager.emergency_close_mask(entry_prices, closing_prices)
+
+        for k, position in enumerate(positions):
+            assert pnls[k] == pytest.approx(PositionStateManager.calculate_position_pnl(
+                position, closing_prices[k], sizes[k]
+            ))
+            assert bool(mask[k]) is PositionStateManager.should_trigger_emergency_close(
+                position, {'price': closing_prices[k]}
+            )[0]
+
+    async def test_bulk_close_uses_batch_pnl(self, orchestrator, db_session, monkeypatch):
+        """Test bulk closure results carry the batch P&L and emergency flag."""
+        db_session.add(Position(
+            id=8, user_address=CREDENTIALS['wallet_address'], symbol="ETH-USD", side="BUY",
+            entry_price=Decimal("2000"), size=Decimal("2"),
+        ))
+        await db_session.commit()
+        positions = [await db_session.get(Position, 7), await db_session.get(Position, 8)]
+
+        async def cancel_remaining_orders(position, credentials):
+            return {'success': True, 'orders_cancelled': [], 'order_snapshots': [], 'error': None}
+
+        monkeypatch.setattr(orchestrator, "_cancel_remaining_orders", cancel_remaining_orders)
+
+        results = await orchestrator.bulk_close_positions(
+            [
+                (positions[0], "take_profit", {'closing_price': 51000.0, 'closing_size': 1.0, 'timestamp': "t"}),
+                (positions[1], "stop_loss", {'closing_price': 1500.0, 'closing_size': 2.0, 'timestamp': "t"}),
+            ],
+            {CREDENTIALS['wallet_address']: CREDENTIALS},
+        )
+
+        assert [result['pnl'] for result in results] == [1000.0, -1000.0]
+        assert [result['emergency_move'] for result in results] == [False, True]
+        assert all(position.status == "closed" for position in positions)
@@ -12,9 +12,15 @@ Usage:
 
 import sys
 import os
+import io
 import argparse
+from contextlib import contextmanager, redirect_stdout
+from functools import lru_cache
 from pathlib import Path
 
+from pydantic import Field, SecretStr, ValidationError
+from pydantic_settings import BaseSettings
+
 # Add src directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
@@ -22,6 +28,22 @@ from src.core.network_validator import NetworkValidator
 from src.core.config import get_settings, validate_configuration
 
 
+@contextmanager
+def buffered_stdout():
+    """Collect everything printed inside the block and write it out once.
+
+    The buffer is flushed even if the block raises, so partial output is
+    never lost.
+    """
+    buffer = io.StringIO()
+    try:
+        with redirect_stdout(buffer):
+            yield
+    finally:
+        sys.stdout.write(buffer.getvalue())
+        sys.stdout.flush()
+
+
 def print_header(text: str) -> None:
     """Print formatted header."""
     print("\n" + "=" * 70)
@@ -50,6 +72,30 @@ def print_error(text: str) -> None:
     print(f"  ❌ {text}")
 
 
+class RequiredEnvironment(BaseSettings):
+    """Environment variables that must be set and non-empty before deployment."""
+
+    DYDX_V4_PRIVATE_KEY: SecretStr = Field(min_length=1, description="dYdX v4 private key")
+    DYDX_V4_API_WALLET_ADDRESS: SecretStr = Field(min_length=1, description="dYdX v4 wallet address")
+    MASTER_ENCRYPTION_KEY: SecretStr = Field(min_length=1, description="Master encryption key")
+
+    class Config:
+        case_sensitive = True
+
+
+@lru_cache(maxsize=8)
+def _get_validator(environment: str) -> NetworkValidator:
+    """Get a network validator for an environment, reused across calls."""
+    return NetworkValidator(environment=environment)
+
+
+def _mask(value: str) -> str:
+    """Mask a secret, keeping the first and last 4 characters of long values."""
+    if len(value) > 10:
+        return f"{value[:4]}{'*' * (len(value) - 8)}{value[-4:]}"
+    return "*" * len(value)
+
+
 def validate_environment_variables() -> bool:
     """Validate required environment variables.
 
@@ -58,28 +104,20 @@ def validate_environment_variables() -> bool:
     """
     print_section("Environment Variables")
 
-    required_vars = {
-        "DYDX_V4_PRIVATE_KEY": "dYdX v4 private key",
-        "DYDX_V4_API_WALLET_ADDRESS": "dYdX v4 wallet address",
-        "MASTER_ENCRYPTION_KEY": "Master encryption key",
-    }
-
-    all_valid = True
-
-    for var_name, description in required_vars.items():
-        if os.getenv(var_name):
-            # Show masked value for security
-            value = os.getenv(var_name)
-            if len(value) > 10:
-                masked = value[:4] + "*" * (len(value) - 8) + value[-4:]
-            else:
-                masked = "*" * len(value)
-            print_success(f"{var_name}: {masked}")
+    try:
+        RequiredEnvironment()
+        missing = set()
+    except ValidationError as e:
+        missing = {error["loc"][0] for error in e.errors()}
+
+    for var_name, field in RequiredEnvironment.model_fields.items():
+        if var_name in missing:
+            print_error(f"{var_name}: NOT SET ({field.description})")
         else:
-            print_error(f"{var_name}: NOT SET ({description})")
-            all_valid = False
+            # Show masked value for security
+            print_success(f"{var_name}: {_mask(os.environ[var_name])}")
 
-    return all_valid
+    return not missing
 
 
 def validate_network_configuration(environment: str) -> bool:
@@ -95,7 +133,7 @@ def validate_network_configuration(environment: str) -> bool:
 
     try:
         # Create validator
-        validator = NetworkValidator(environment=environment)
+        validator = _get_validator(environment)
 
         # Get network config
         config, is_safe = validator.get_network_config()
@@ -197,12 +235,14 @@ def validate_configuration_issues() -> bool:
         print_success("No configuration issues found")
         return True
     else:
+        error_count = 0
         for issue in issues:
             if issue.startswith("ERROR"):
                 print_error(issue)
+                error_count += 1
             else:
                 print_warning(issue)
-        return len([i for i in issues if i.startswith("ERROR")]) == 0
+        return error_count == 0
 
 
 def main() -> int:
@@ -227,12 +267,25 @@ def main() -> int:
 
     args = parser.parse_args()
 
+    with buffered_stdout():
+        return run_validations(args.environment)
+
+
+def run_validations(environment: str) -> int:
+    """Run all validations and print the report.
+
+    Args:
+        environment: Application environment
+
+    Returns:
+        0 if all validations pass, 1 otherwise
+    """
     print_header("dYdX Network Configuration Validator")
 
     # Run validations
     results = {
         "Environment Variables": validate_environment_variables(),
-        "Network Configuration": validate_network_configuration(args.environment),
+        "Network Configuration": validate_network_configuration(environment),
         "Application Configuration": validate_application_configuration(),
         "Configuration Issues": validate_configuration_issues(),
     }
@@ -8,12 +8,17 @@ Displays portfolio growth visualization with:
 - Key metrics and milestones
 """
 
+import asyncio
 import streamlit as st
 import pandas as pd
 import plotly.graph_objects as go
-from datetime import datetime, timedelta
-import requests
-from typing import Dict, Any, List
+import httpx
+from typing import Dict, Any, List, NamedTuple, Optional, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Page configuration
 st.set_page_config(
@@ -23,111 +28,153 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom styling
-st.markdown("""
-    <style>
-    .metric-card {
-        background-color: #f0f2f6;
-        padding: 20px;
-        border-radius: 10px;
-        margin: 10px 0;
-    }
-    .profit {
-        color: #28a745;
-        font-weight: bold;
-    }
-    .loss {
-        color: #dc3545;
-        font-weight: bold;
-    }
-    </style>
-""", unsafe_allow_html=True)
-
-
-def get_equity_curve_data(days: int = 30) -> Dict[str, Any]:
-    """Fetch equity curve data from API."""
-    try:
-        # Get token from session state
-        token = st.session_state.get("auth_token")
-        if not token:
-            st.error("Not authenticated. Please login first.")
-            return None
 
-        headers = {"Authorization": f"Bearer {token}"}
-        
-        # Fetch equity curve
-        response = requests.get(
-            f"http://localhost:8000/api/equity/curve?days={days}",
-            headers=headers,
-            timeout=10
-        )
-        
-        if response.status_code == 200:
-            return response.json()
-        else:
-            st.error(f"Failed to fetch equity curve: {response.status_code}")
-            return None
-    except Exception as e:
-        st.error(f"Error fetching equity curve: {str(e)}")
-        return None
+API_BASE_URL = "http://localhost:8000"
 
+# Seconds an API response is reused across reruns before it is fetched again
+API_CACHE_TTL = 30
 
-def get_equity_summary() -> Dict[str, Any]:
-    """Fetch equity summary from API."""
-    try:
-        token = st.session_state.get("auth_token")
-        if not token:
-            return None
+# Selectable chart ranges; a small fixed set keeps cached curves reusable
+DAY_RANGES = (7, 14, 30, 60, 90, 180, 365)
 
-        headers = {"Authorization": f"Bearer {token}"}
-        
-        response = requests.get(
-            "http://localhost:8000/api/equity/summary",
-            headers=headers,
-            timeout=10
-        )
-        
-        if response.status_code == 200:
-            return response.json()
-        else:
-            return None
-    except Exception as e:
-        st.error(f"Error fetching equity summary: {str(e)}")
-        return None
+# Auto-refresh options mapped to seconds between data reruns (None = manual).
+# No interval is shorter than API_CACHE_TTL, so every tick can bring new data.
+REFRESH_INTERVALS = {
+    "Manual": None,
+    "Every 30 seconds": 30,
+    "Every 1 minute": 60,
+}
 
+# Fixed chart layouts; update_layout copies them, so they are shared safely
+EQUITY_CHART_LAYOUT = dict(
+    title="Portfolio Equity Curve",
+    uirevision="equity_curve",  # keep zoom/pan across reruns
+    xaxis_title="Date",
+    yaxis_title="Portfolio Value ($)",
+    hovermode='x unified',
+    template='plotly_white',
+    height=500,
+    margin=dict(l=50, r=50, t=50, b=50),
+    xaxis=dict(
+        rangeslider=dict(visible=False),
+        type='date'
+    ),
+    yaxis=dict(
+        tickformat='$,.0f'
+    )
+)
 
-def get_equity_milestones() -> Dict[str, Any]:
-    """Fetch equity milestones from API."""
-    try:
-        token = st.session_state.get("auth_token")
-        if not token:
-            return None
+GROWTH_CHART_LAYOUT = dict(
+    title="Portfolio Growth Percentage",
+    uirevision="growth_chart",  # keep zoom/pan across reruns
+    xaxis_title="Date",
+    yaxis_title="Growth (%)",
+    hovermode='x unified',
+    template='plotly_white',
+    height=400,
+    margin=dict(l=50, r=50, t=50, b=50),
+    yaxis=dict(
+        tickformat='.2f',
+        ticksuffix='%'
+    )
+)
 
-        headers = {"Authorization": f"Bearer {token}"}
-        
-        response = requests.get(
-            "http://localhost:8000/api/equity/milestones",
-            headers=headers,
-            timeout=10
-        )
-        
-        if response.status_code == 200:
-            return response.json()
-        else:
-            return None
+
+# Endpoint paths fetched for each render, keyed by result name
+EQUITY_ENDPOINTS = {
+    "curve": "/api/equity/curve?days={days}",
+    "summary": "/api/equity/summary",
+    "milestones": "/api/equity/milestones",
+}
+
+
+class FetchFailure(NamedTuple):
+    """An endpoint request that did not return data."""
+    status_code: Optional[int]  # None when no HTTP response was received
+    message: str
+
+
+class EquityFetchError(Exception):
+    """Raised when any endpoint fails; carries every endpoint's result."""
+
+    def __init__(self, results: Dict[str, Union[Dict[str, Any], FetchFailure]]):
+        super().__init__("Failed to fetch equity data")
+        self.results = results
+
+
+async def _get_json(client: httpx.AsyncClient, path: str) -> Union[Dict[str, Any], FetchFailure]:
+    """GET an endpoint, returning its JSON body or the failure."""
+    try:
+        response = await client.get(path)
+        response.raise_for_status()
+        if orjson is not None:
+            return orjson.loads(response.content)
+        return response.json()
+    except httpx.HTTPStatusError as e:
+        return FetchFailure(e.response.status_code, str(e))
     except Exception as e:
-        st.error(f"Error fetching milestones: {str(e)}")
-        return None
+        return FetchFailure(None, str(e))
 
 
-def create_equity_chart(curve_data: List[Dict]) -> go.Figure:
-    """Create equity curve chart using Plotly."""
-    
+async def _fetch_all(days: int, token: str) -> Dict[str, Union[Dict[str, Any], FetchFailure]]:
+    """Fetch every equity endpoint concurrently over one client."""
+    async with httpx.AsyncClient(
+        base_url=API_BASE_URL,
+        headers={"Authorization": f"Bearer {token}"},
+        timeout=10,
+        transport=httpx.AsyncHTTPTransport(retries=2)
+    ) as client:
+        results = await asyncio.gather(*(
+            _get_json(client, path.format(days=days))
+            for path in EQUITY_ENDPOINTS.values()
+        ))
+    return dict(zip(EQUITY_ENDPOINTS, results))
+
+
+@st.cache_data(ttl=API_CACHE_TTL, show_spinner=False)
+def fetch_equity_data(days: int, token: str) -> Dict[str, Dict[str, Any]]:
+    """Fetch curve, summary and milestones from the API.
+
+    Cached per (days, token) so slider moves and reruns reuse the responses.
+    Raises EquityFetchError if any endpoint fails, so failures are never
+    cached; the error carries the endpoints that did succeed.
+    """
+    results = asyncio.run(_fetch_all(days, token))
+    if any(isinstance(result, FetchFailure) for result in results.values()):
+        raise EquityFetchError(results)
+    return results
+
+
+def _unwrap(
+    result: Union[Dict[str, Any], FetchFailure],
+    label: str,
+    report_status: bool = False
+) -> Optional[Dict[str, Any]]:
+    """Return an endpoint's data, or show its failure and return None."""
+    if not isinstance(result, FetchFailure):
+        return result
+    if result.status_code is None:
+        st.error(f"Error fetching {label}: {result.message}")
+    elif report_status:
+        st.error(f"Failed to fetch {label}: {result.status_code}")
+    return None
+
+
+@st.cache_data(ttl=API_CACHE_TTL, show_spinner=False)
+def _curve_to_dataframe(curve_data: List[Dict]) -> pd.DataFrame:
+    """Parse curve points into a DataFrame with datetime dates."""
     df = pd.DataFrame(curve_data)
     df['date'] = pd.to_datetime(df['date'])
+    return df
+
+
+@st.cache_data(ttl=API_CACHE_TTL, show_spinner=False)
+def create_equity_chart(df: pd.DataFrame) -> go.Figure:
+    """Create equity curve chart using Plotly."""
     
     # Get starting capital (first equity value)
-    starting_capital = df['equity'].iloc[0] if len(df) > 0 else 0
+    starting_capital = df['equity'].iat[0] if len(df) > 0 else 0
+    is_profit = df['equity'].iat[-1] >= starting_capital
     
     fig = go.Figure()
     
@@ -142,47 +189,30 @@ def create_equity_chart(curve_data: List[Dict]) -> go.Figure:
     )
     
     # Add equity curve
-    fig.add_trace(go.Scatter(
+    fig.add_trace(go.Scattergl(
         x=df['date'],
         y=df['equity'],
         mode='lines',
         name='Portfolio Value',
         line=dict(
-            color='green' if df['equity'].iloc[-1] >= starting_capital else 'red',
+            color='green' if is_profit else 'red',
             width=3
         ),
         fill='tozeroy',
-        fillcolor='rgba(0, 255, 0, 0.1)' if df['equity'].iloc[-1] >= starting_capital else 'rgba(255, 0, 0, 0.1)',
+        fillcolor='rgba(0, 255, 0, 0.1)' if is_profit else 'rgba(255, 0, 0, 0.1)',
         hovertemplate='<b>Date:</b> %{x|%Y-%m-%d}<br><b>Portfolio Value:</b> $%{y:,.2f}<extra></extra>'
     ))
     
     # Update layout
-    fig.update_layout(
-        title="Portfolio Equity Curve",
-        xaxis_title="Date",
-        yaxis_title="Portfolio Value ($)",
-        hovermode='x unified',
-        template='plotly_white',
-        height=500,
-        margin=dict(l=50, r=50, t=50, b=50),
-        xaxis=dict(
-            rangeslider=dict(visible=False),
-            type='date'
-        ),
-        yaxis=dict(
-            tickformat='$,.0f'
-        )
-    )
+    fig.update_layout(**EQUITY_CHART_LAYOUT)
     
     return fig
 
 
-def create_growth_chart(curve_data: List[Dict]) -> go.Figure:
+@st.cache_data(ttl=API_CACHE_TTL, show_spinner=False)
+def create_growth_chart(df: pd.DataFrame) -> go.Figure:
     """Create growth percentage chart."""
     
-    df = pd.DataFrame(curve_data)
-    df['date'] = pd.to_datetime(df['date'])
-    
     fig = go.Figure()
     
     # Add zero reference line
@@ -194,13 +224,13 @@ def create_growth_chart(curve_data: List[Dict]) -> go.Figure:
     )
     
     # Add growth percentage line
-    fig.add_trace(go.Scatter(
+    fig.add_trace(go.Scattergl(
         x=df['date'],
         y=df['growth_percentage'],
         mode='lines+markers',
         name='Growth %',
         line=dict(
-            color='green' if df['growth_percentage'].iloc[-1] >= 0 else 'red',
+            color='green' if df['growth_percentage'].iat[-1] >= 0 else 'red',
             width=2
         ),
         marker=dict(size=4),
@@ -208,19 +238,7 @@ def create_growth_chart(curve_data: List[Dict]) -> go.Figure:
     ))
     
     # Update layout
-    fig.update_layout(
-        title="Portfolio Growth Percentage",
-        xaxis_title="Date",
-        yaxis_title="Growth (%)",
-        hovermode='x unified',
-        template='plotly_white',
-        height=400,
-        margin=dict(l=50, r=50, t=50, b=50),
-        yaxis=dict(
-            tickformat='.2f',
-            ticksuffix='%'
-        )
-    )
+    fig.update_layout(**GROWTH_CHART_LAYOUT)
     
     return fig
 
@@ -234,20 +252,41 @@ def main():
     # Sidebar controls
     with st.sidebar:
         st.header("Settings")
-        days = st.slider("Days to display", min_value=7, max_value=365, value=30, step=7)
+        days = st.select_slider("Days to display", options=DAY_RANGES, value=30)
         refresh_interval = st.selectbox(
             "Auto-refresh interval",
-            ["Manual", "Every 5 seconds", "Every 30 seconds", "Every 1 minute"]
+            list(REFRESH_INTERVALS)
         )
         
         if st.button("🔄 Refresh Data", use_container_width=True):
+            # Drop cached API responses so the rerun fetches fresh data
+            fetch_equity_data.clear()
             st.rerun()
     
-    # Fetch data
+    # Fetch and render data
+    token = st.session_state.get("auth_token")
+    if not token:
+        st.error("Not authenticated. Please login first.")
+        return
+    
+    # Only the data section reruns on the auto-refresh tick; the title and
+    # sidebar controls are left as they are
+    auto_refresh = st.fragment(run_every=REFRESH_INTERVALS[refresh_interval])
+    auto_refresh(render_equity_data)(days, token)
+
+
+def render_equity_data(days: int, token: str) -> None:
+    """Fetch equity data and render the metrics, charts and milestones."""
+    
     with st.spinner("Loading equity curve data..."):
-        curve_data = get_equity_curve_data(days)
-        summary = get_equity_summary()
-        milestones = get_equity_milestones()
+        try:
+            results = fetch_equity_data(days, token)
+        except EquityFetchError as e:
+            results = e.results
+    
+    curve_data = _unwrap(results["curve"], "equity curve", report_status=True)
+    summary = _unwrap(results["summary"], "equity summary")
+    milestones = _unwrap(results["milestones"], "milestones")
     
     if not curve_data or not summary:
         st.error("Failed to load equity curve data. Please check your connection.")
@@ -298,12 +337,15 @@ def main():
         "🔴 **Red line** = Portfolio Value (Loss)"
     )
     
-    equity_chart = create_equity_chart(curve_data['curve_data'])
+    # Parse the curve once; both charts and the raw data table share it
+    curve_df = _curve_to_dataframe(curve_data['curve_data'])
+    
+    equity_chart = create_equity_chart(curve_df)
     st.plotly_chart(equity_chart, use_container_width=True)
     
     # Growth Percentage Chart
     st.subheader("Growth Percentage Over Time")
-    growth_chart = create_growth_chart(curve_data['curve_data'])
+    growth_chart = create_growth_chart(curve_df)
     st.plotly_chart(growth_chart, use_container_width=True)
     
     # Additional Metrics Row 2
@@ -357,22 +399,27 @@ def main():
     
     # Data Table
     with st.expander("📊 View Raw Data"):
-        df = pd.DataFrame(curve_data['curve_data'])
-        df['date'] = pd.to_datetime(df['date']).dt.strftime('%Y-%m-%d')
-        df = df[['date', 'equity', 'pnl', 'growth_percentage']]
+        df = curve_df[['date', 'equity', 'pnl', 'growth_percentage']].copy()
+        df['date'] = df['date'].dt.strftime('%Y-%m-%d')
         df.columns = ['Date', 'Equity ($)', 'PNL ($)', 'Growth (%)']
         
-        # Format numbers
-        df['Equity ($)'] = df['Equity ($)'].apply(lambda x: f"${x:,.2f}")
-        df['PNL ($)'] = df['PNL ($)'].apply(lambda x: f"${x:,.2f}")
-        df['Growth (%)'] = df['Growth (%)'].apply(lambda x: f"{x:.2f}%")
-        
-        st.dataframe(df, use_container_width=True)
+        # Format numbers at render time instead of building string columns
+        st.dataframe(
+            df.style.format({
+                'Equity ($)': '${:,.2f}',
+                'PNL ($)': '${:,.2f}',
+                'Growth (%)': '{:.2f}%',
+            }),
+            use_container_width=True
+        )
     
     # Footer
     st.divider()
+    # The server stamps the summary when it is built; show that (UTC) so the
+    # footer reflects data freshness, including cached responses
+    last_updated = summary['timestamp'][:19].replace('T', ' ')
     st.caption(
-        f"Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} | "
+        f"Last updated: {last_updated} UTC | "
         f"Data range: {days} days"
     )
 
@@ -29,6 +29,7 @@ CREATE TABLE IF NOT EXISTS positions (
 CREATE INDEX IF NOT EXISTS idx_users_webhook_uuid ON users(webhook_uuid);
 CREATE INDEX IF NOT EXISTS idx_positions_user_address ON positions(user_address);
 CREATE INDEX IF NOT EXISTS idx_positions_status ON positions(status);
+CREATE INDEX IF NOT EXISTS idx_positions_status_open ON positions(status) WHERE status = 'open';
 CREATE INDEX IF NOT EXISTS idx_positions_symbol ON positions(symbol);
 
 -- Insert sample data for testing (optional)